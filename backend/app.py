@@ -1,9 +1,26 @@
-from flask import Flask, request, jsonify, send_file
+from flask import Flask, request, send_file, Response
 from flask_cors import CORS
 import numpy as np
 import os
-from datetime import datetime
+import gc
+import json
+import hashlib
+import gzip
+import tempfile
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
+from typing import Mapping, NamedTuple
+try:
+    import orjson
+except ImportError:  # Fall back to the stdlib encoder when orjson isn't installed
+    orjson = None
 from pdf_generator import HealthReportGenerator
+from prediction_cache import PredictionCache
+from report_cache import ReportCache
+from batching import PredictionBatcher
+from schemas import PredictRequest, AnalyzeRequest, ReportRequest, SchemaError
 
 from predictors import (
     # Disease Risk & Diagnosis Predictors
@@ -36,6 +53,42 @@ from predictors import (
 )
 
 app = Flask(__name__)
+
+def _json_default(obj):
+    """Serialize numpy scalars/arrays and other non-JSON-native values"""
+    if isinstance(obj, (np.generic, np.ndarray)):
+        return obj.tolist()
+    if isinstance(obj, Mapping):
+        return dict(obj)
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+def _dumps(payload):
+    """Serialize payload to JSON bytes"""
+    if orjson is not None:
+        return orjson.dumps(payload, default=_json_default, option=orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS)
+    return json.dumps(payload, default=_json_default).encode()
+
+class CachedPrediction(NamedTuple):
+    """Core /predict result kept in the prediction cache, smaller than the equivalent dict"""
+    risk_score: float
+    risk_level: str
+    recommendations: tuple
+    confidence: float
+
+def _json(payload, status=200):
+    """Build a JSON response"""
+    return Response(_dumps(payload), status=status, mimetype='application/json')
+
+# ISO timestamp, refreshed at most once per second
+_TS_CACHE = (0, '')
+
+def now_iso():
+    """Return the current UTC time as an ISO 8601 string at one-second resolution"""
+    global _TS_CACHE
+    t = int(time.time())
+    if t != _TS_CACHE[0]:
+        _TS_CACHE = (t, datetime.fromtimestamp(t, timezone.utc).strftime('%Y-%m-%dT%H:%M:%SZ'))
+    return _TS_CACHE[1]
 # Configure CORS for both development and production
 allowed_origins = [
     "http://localhost:3000",
@@ -60,11 +113,39 @@ def after_request(response):
     response.headers.add('Access-Control-Allow-Methods', 'GET,PUT,POST,DELETE,OPTIONS')
     return response
 
+# Compress JSON bodies above this size when the client accepts gzip
+COMPRESS_MIN_SIZE = 1024
+COMPRESS_LEVEL = 6
+
+@app.after_request
+def compress_response(response):
+    """Gzip JSON responses for clients that accept it"""
+    response.vary.add('Accept-Encoding')
+    if (response.status_code != 200
+            or response.mimetype != 'application/json'
+            or response.direct_passthrough
+            or response.is_streamed
+            or 'Content-Encoding' in response.headers
+            or 'gzip' not in request.accept_encodings):
+        return response
+
+    body = response.get_data()
+    if len(body) < COMPRESS_MIN_SIZE:
+        return response
+
+    response.set_data(gzip.compress(body, compresslevel=COMPRESS_LEVEL))
+    response.headers['Content-Encoding'] = 'gzip'
+    # The encoded bytes differ from the identity body, so the tag can only be weak
+    etag, weak = response.get_etag()
+    if etag and not weak:
+        response.set_etag(etag, weak=True)
+    return response
+
 # Handle preflight requests
 @app.before_request
 def handle_preflight():
     if request.method == "OPTIONS":
-        response = jsonify({})
+        response = _json({})
         response.headers.add("Access-Control-Allow-Origin", "*")
         response.headers.add('Access-Control-Allow-Headers', "*")
         response.headers.add('Access-Control-Allow-Methods', "*")
@@ -105,9 +186,114 @@ predictors = {
     "cancer_recurrence": CancerRecurrencePredictor()
 }
 
+# Predictor classes are static, so resolve their capabilities once
+SUPPORTS_ANALYSIS = {name: hasattr(predictor, 'identify_contributing_factors') for name, predictor in predictors.items()}
+
+# Warm every predictor at startup so the first request doesn't pay for model training
+if os.environ.get('WARM_PREDICTORS', '1') != '0':
+    for name, predictor in predictors.items():
+        try:
+            predictor.predict(predictor.get_dummy_input())
+        except Exception as warm_error:
+            app.logger.warning(f"Warm-up failed for predictor '{name}': {warm_error}")
+
+def _etagged(blob):
+    """Pair a serialized payload with a content-derived ETag"""
+    return blob, hashlib.blake2b(blob).hexdigest()[:16]
+
+def _static_json(cached):
+    """Serve a precomputed (payload, etag) pair, answering 304 when the client copy is current"""
+    blob, etag = cached
+    headers = {'ETag': f'"{etag}"', 'Cache-Control': 'public, max-age=3600'}
+    if request.if_none_match.contains_weak(etag):
+        return Response(status=304, headers=headers)
+    return Response(blob, mimetype='application/json', headers=headers)
+
+# Predictor metadata is static, so serialize and tag it once
+PREDICTORS_CACHE = _etagged(_dumps({
+    name: {
+        "name": predictor.name,
+        "description": predictor.description,
+        "required_fields": predictor.get_required_fields()
+    }
+    for name, predictor in predictors.items()
+}))
+FIELDS_CACHE = {
+    name: _etagged(_dumps({
+        "predictor_type": name,
+        "name": predictor.name,
+        "description": predictor.description,
+        "required_fields": predictor.get_required_fields(),
+        "field_descriptions": predictor.get_field_descriptions(),
+        "supports_enhanced_analysis": SUPPORTS_ANALYSIS[name]
+    }))
+    for name, predictor in predictors.items()
+}
+
+# Under `gunicorn --preload` the master builds the predictors once; freezing the objects
+# created so far keeps the GC from touching them, so forked workers share the pages copy-on-write
+if __name__ != '__main__':
+    gc.collect()
+    gc.freeze()
+
+def _predictor_workers(name):
+    """Worker threads for one predictor: PREDICTOR_WORKERS_<NAME>, else PREDICTOR_WORKERS, else 1"""
+    return int(os.environ.get(f'PREDICTOR_WORKERS_{name.upper()}', os.environ.get('PREDICTOR_WORKERS', 1)))
+
+# Largest batch a worker drains at once, and how long it waits for a batch to fill
+PREDICT_BATCH_MAX = int(os.environ.get('PREDICT_BATCH_MAX', 32))
+PREDICT_BATCH_WAIT_MS = float(os.environ.get('PREDICT_BATCH_WAIT_MS', 5.0))
+
+# /predict only returns the score, level, confidence and recommendations; analysis is built separately
+_PREDICT_SECTIONS = ("recommendations",)
+
+# Per-predictor batchers that coalesce concurrent /predict calls into one model call. Each runs on
+# its own worker threads, so a slow predictor can be given more workers without throttling the rest
+batchers = {
+    name: PredictionBatcher(
+        predictor,
+        max_batch=PREDICT_BATCH_MAX,
+        max_wait_ms=PREDICT_BATCH_WAIT_MS,
+        workers=_predictor_workers(name),
+        include=_PREDICT_SECTIONS
+    )
+    for name, predictor in predictors.items()
+}
+
+# Cache of prediction and analysis results keyed by (predictor_type, canonicalized input)
+prediction_cache = PredictionCache(maxsize=4096)
+
+# Reports render on a separate pool so slow reportlab builds don't hold up /predict threads
+PDF_POOL = ThreadPoolExecutor(max_workers=int(os.environ.get('PDF_WORKERS', 4)), thread_name_prefix='pdf')
+PDF_JOB_TIMEOUT = 60
+PDF_JOB_POLL_INTERVAL = 0.05
+
+# Rendered reports are deterministic for a given input and minute, so repeats are served from disk.
+# Async report jobs are recorded in the same directory so any gunicorn worker can serve the download.
+report_cache = ReportCache(
+    os.environ.get('REPORT_CACHE_DIR', os.path.join(tempfile.gettempdir(), 'gods-health-reports')),
+    ttl=float(os.environ.get('REPORT_CACHE_TTL', 600))
+)
+
+def get_cached_analysis(predictor, input_data, cache_key, validate=False):
+    """Run the detailed analysis methods, reusing cached results for identical inputs"""
+    analysis = prediction_cache.get(cache_key)
+    if analysis is None:
+        if validate:
+            # Normalize the input exactly as predict() would have
+            predictor.validate_input(input_data)
+        contributing_factors, health_metrics = predictor.analyze_factors_and_metrics(input_data)
+        analysis = {
+            "contributing_factors": contributing_factors,
+            "health_metrics": health_metrics,
+            "lifestyle_impact": predictor.assess_lifestyle_impact(input_data)
+        }
+        prediction_cache.set(cache_key, analysis)
+    return analysis
+
 @app.route("/")
 def root():
-    return jsonify({
+    return _json({
         "message": "Welcome to Gods Health AI - Comprehensive Health Prediction Platform",
         "version": "1.0.0",
         "available_predictors": list(predictors.keys()),
@@ -117,156 +303,229 @@ def root():
 @app.route("/predictors")
 def get_available_predictors():
     """Get list of all available predictors with their descriptions"""
-    predictor_info = {}
-    for name, predictor in predictors.items():
-        predictor_info[name] = {
-            "name": predictor.name,
-            "description": predictor.description,
-            "required_fields": predictor.get_required_fields()
-        }
-    return jsonify(predictor_info)
+    return _static_json(PREDICTORS_CACHE)
 
 @app.route("/predict", methods=["POST"])
 def make_prediction():
     """Make a health prediction using the specified predictor with enhanced analysis"""
     try:
-        data = request.get_json()
-        predictor_type = data.get("predictor_type")
-        input_data = data.get("data")
-        include_analysis = data.get("include_analysis", True)  # Default to True for enhanced analysis
+        req = PredictRequest.from_json(request.get_data())
+        predictor_type = req.predictor_type
+        input_data = req.data
+        include_analysis = req.include_analysis  # Defaults to True for enhanced analysis
         
         if predictor_type not in predictors:
-            return jsonify({
+            return _json({
                 "error": f"Predictor '{predictor_type}' not found. Available predictors: {list(predictors.keys())}"
-            }), 400
+            }, 400)
         
         predictor = predictors[predictor_type]
-        result = predictor.predict(input_data)
         
-        # Base response
+        # Reuse cached results for repeat payloads; keys are taken before predict() normalizes input_data
+        cache_key = PredictionCache.make_key(predictor_type, input_data)
+        analysis_key = PredictionCache.make_key(predictor_type, input_data, kind="analysis")
+        result = prediction_cache.get(cache_key)
+        cache_hit = result is not None
+        if not cache_hit:
+            prediction = batchers[predictor_type].submit(input_data).result(timeout=10)
+            result = CachedPrediction(
+                prediction["risk_score"],
+                prediction["risk_level"],
+                tuple(prediction["recommendations"]),
+                prediction["confidence"]
+            )
+            prediction_cache.set(cache_key, result)
+        
+        # Base response; the encoder writes the recommendations tuple as a JSON array
         response = {
             "predictor_type": predictor_type,
-            "risk_score": result["risk_score"],
-            "risk_level": result["risk_level"],
-            "recommendations": result["recommendations"],
-            "confidence": result["confidence"],
-            "timestamp": datetime.now().isoformat()
+            "risk_score": result.risk_score,
+            "risk_level": result.risk_level,
+            "recommendations": result.recommendations,
+            "confidence": result.confidence,
+            "timestamp": now_iso()
         }
         
         # Add enhanced analysis if requested and predictor supports it
-        if include_analysis and hasattr(predictor, 'identify_contributing_factors'):
+        if include_analysis and SUPPORTS_ANALYSIS[predictor_type]:
             try:
-                response["detailed_analysis"] = {
-                    "contributing_factors": predictor.identify_contributing_factors(input_data),
-                    "health_metrics": predictor.analyze_health_metrics(input_data),
-                    "lifestyle_impact": predictor.assess_lifestyle_impact(input_data)
-                }
+                response["detailed_analysis"] = get_cached_analysis(
+                    predictor, input_data, analysis_key, validate=cache_hit
+                )
             except Exception as analysis_error:
                 # If analysis fails, still return basic prediction but log the error
                 response["analysis_error"] = f"Enhanced analysis failed: {str(analysis_error)}"
         
-        return jsonify(response)
+        return _json(response)
     
+    except SchemaError as e:
+        return _json({"error": str(e)}, 400)
     except Exception as e:
-        return jsonify({"error": f"Prediction error: {str(e)}"}), 500
+        return _json({"error": f"Prediction error: {str(e)}"}, 500)
 
 @app.route("/predictor/<predictor_type>/fields")
 def get_predictor_fields(predictor_type):
     """Get required input fields for a specific predictor"""
     if predictor_type not in predictors:
-        return jsonify({
+        return _json({
             "error": f"Predictor '{predictor_type}' not found"
-        }), 404
+        }, 404)
     
-    predictor = predictors[predictor_type]
-    return jsonify({
-        "predictor_type": predictor_type,
-        "name": predictor.name,
-        "description": predictor.description,
-        "required_fields": predictor.get_required_fields(),
-        "field_descriptions": predictor.get_field_descriptions(),
-        "supports_enhanced_analysis": hasattr(predictor, 'identify_contributing_factors')
-    })
+    return _static_json(FIELDS_CACHE[predictor_type])
 
 @app.route("/analyze", methods=["POST"])
 def analyze_health_data():
     """Perform detailed health analysis without prediction"""
     try:
-        data = request.get_json()
-        predictor_type = data.get("predictor_type")
-        input_data = data.get("data")
+        req = AnalyzeRequest.from_json(request.get_data())
+        predictor_type = req.predictor_type
+        input_data = req.data
         
         if predictor_type not in predictors:
-            return jsonify({
+            return _json({
                 "error": f"Predictor '{predictor_type}' not found. Available predictors: {list(predictors.keys())}"
-            }), 400
+            }, 400)
         
         predictor = predictors[predictor_type]
         
         # Check if predictor supports enhanced analysis
-        if not hasattr(predictor, 'identify_contributing_factors'):
-            return jsonify({
+        if not SUPPORTS_ANALYSIS[predictor_type]:
+            return _json({
                 "error": f"Predictor '{predictor_type}' does not support enhanced analysis"
-            }), 400
+            }, 400)
         
         # Perform detailed analysis
         analysis_result = {
             "predictor_type": predictor_type,
-            "analysis": {
-                "contributing_factors": predictor.identify_contributing_factors(input_data),
-                "health_metrics": predictor.analyze_health_metrics(input_data),
-                "lifestyle_impact": predictor.assess_lifestyle_impact(input_data)
-            },
-            "timestamp": datetime.now().isoformat()
+            "analysis": get_cached_analysis(
+                predictor, input_data, PredictionCache.make_key(predictor_type, input_data, kind="analyze")
+            ),
+            "timestamp": now_iso()
         }
         
-        return jsonify(analysis_result)
+        return _json(analysis_result)
     
+    except SchemaError as e:
+        return _json({"error": str(e)}, 400)
     except Exception as e:
-        return jsonify({"error": f"Analysis error: {str(e)}"}), 500
+        return _json({"error": f"Analysis error: {str(e)}"}, 500)
 
 @app.route("/health")
 def health_check():
     """Health check endpoint"""
-    return jsonify({
+    return _json({
         "status": "healthy",
-        "timestamp": datetime.now().isoformat(),
-        "predictors_loaded": len(predictors)
+        "timestamp": now_iso(),
+        "predictors_loaded": len(predictors),
+        "prediction_cache": prediction_cache.stats()
     })
 
+def _parse_report_request():
+    """Extract prediction and user data from a report request, or return an error response"""
+    try:
+        req = ReportRequest.from_json(request.get_data())
+    except SchemaError as e:
+        return None, _json({"error": str(e)}, 400)
+
+    return (req.prediction_data, req.user_data), None
+
+def _render_report(prediction_data, user_data, generated_at):
+    """Return the cache key of a rendered report, building and caching it on a miss"""
+    key = ReportCache.make_key(prediction_data, user_data, generated_at.isoformat())
+    if report_cache.get(key) is None:
+        pdf_buffer = HealthReportGenerator().generate_report(prediction_data, user_data, generated_at)
+        report_cache.put(key, pdf_buffer)
+    return key
+
+def _submit_report(prediction_data, user_data):
+    """Queue a PDF build on the report pool and return its future and filename"""
+    predictor_type = prediction_data.get('predictor_type', 'health')
+    now = datetime.now()
+    filename = f"{predictor_type}_report_{now.strftime('%Y%m%d_%H%M%S')}.pdf"
+
+    # The report only shows the time to the minute, so that's all the cache key needs
+    generated_at = now.replace(second=0, microsecond=0)
+    future = PDF_POOL.submit(_render_report, prediction_data, user_data, generated_at)
+    return future, filename
+
+def _send_cached_report(key, filename):
+    """Send a cached report file as an attachment"""
+    # A file path lets the server use sendfile and answer Range/conditional requests
+    return send_file(
+        report_cache.path(key),
+        as_attachment=True,
+        download_name=filename,
+        mimetype='application/pdf',
+        conditional=True
+    )
+
+def _send_report(future, filename):
+    """Wait for a queued PDF build and send the cached file as an attachment"""
+    return _send_cached_report(future.result(timeout=PDF_JOB_TIMEOUT), filename)
+
+def _record_report_job(job_id, filename, future):
+    """Write the outcome of a finished report build to its job record"""
+    try:
+        record = {"status": "done", "filename": filename, "key": future.result()}
+    except Exception as e:
+        record = {"status": "error", "filename": filename, "error": str(e)}
+    report_cache.put_job(job_id, record)
+
 @app.route("/download-report", methods=["POST"])
 def download_report():
     """Generate and download PDF health assessment report"""
     try:
-        data = request.get_json()
-        
-        if not data:
-            return jsonify({"error": "No data provided"}), 400
-        
-        prediction_data = data.get('prediction_data')
-        user_data = data.get('user_data', {})
-        
-        if not prediction_data:
-            return jsonify({"error": "Prediction data is required"}), 400
-        
-        # Generate PDF report
-        pdf_generator = HealthReportGenerator()
-        pdf_buffer = pdf_generator.generate_report(prediction_data, user_data)
-        
-        # Generate filename
-        predictor_type = prediction_data.get('predictor_type', 'health')
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        filename = f"{predictor_type}_report_{timestamp}.pdf"
-        
-        return send_file(
-            pdf_buffer,
-            as_attachment=True,
-            download_name=filename,
-            mimetype='application/pdf'
-        )
-    
+        parsed, error = _parse_report_request()
+        if error:
+            return error
+
+        return _send_report(*_submit_report(*parsed))
+
     except Exception as e:
-        return jsonify({"error": f"PDF generation error: {str(e)}"}), 500
+        return _json({"error": f"PDF generation error: {str(e)}"}, 500)
+
+@app.route("/download-report/async", methods=["POST"])
+def download_report_async():
+    """Start a PDF report build and return a job id for fetching it later"""
+    try:
+        parsed, error = _parse_report_request()
+        if error:
+            return error
+
+        job_id = uuid.uuid4().hex
+        # The pending record must exist before the build can finish and overwrite it
+        report_cache.put_job(job_id, {"status": "pending"})
+        future, filename = _submit_report(*parsed)
+        future.add_done_callback(lambda done: _record_report_job(job_id, filename, done))
+
+        return _json({"job_id": job_id, "url": f"/download-report/{job_id}"}, 202)
+
+    except Exception as e:
+        return _json({"error": f"PDF generation error: {str(e)}"}, 500)
+
+@app.route("/download-report/<job_id>", methods=["GET"])
+def download_report_job(job_id):
+    """Wait for a queued PDF report and download it"""
+    deadline = time.monotonic() + PDF_JOB_TIMEOUT
+    job = report_cache.get_job(job_id)
+    while job is not None and job["status"] == "pending" and time.monotonic() < deadline:
+        time.sleep(PDF_JOB_POLL_INTERVAL)
+        job = report_cache.get_job(job_id)
+
+    if job is None:
+        return _json({"error": f"Report job '{job_id}' not found"}, 404)
+    if job["status"] == "pending":
+        return _json({"error": f"PDF generation error: report job '{job_id}' timed out"}, 500)
+    if job["status"] == "error":
+        report_cache.remove_job(job_id)
+        return _json({"error": f"PDF generation error: {job['error']}"}, 500)
+
+    try:
+        response = _send_cached_report(job["key"], job["filename"])
+    except Exception as e:
+        return _json({"error": f"PDF generation error: {str(e)}"}, 500)
+    report_cache.remove_job(job_id)
+    return response
 
 if __name__ == '__main__':
     # Use environment variables for production deployment
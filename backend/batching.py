@@ -0,0 +1,78 @@
+import os
+import queue
+import threading
+import time
+from concurrent.futures import Future
+from typing import Any, Dict
+
+
+class PredictionBatcher:
+    """Coalesce concurrent predict requests for one predictor into batched model calls"""
+
+    def __init__(self, predictor, max_batch: int = 32, max_wait_ms: float = 5.0, workers: int = 1, include=None):
+        self.predictor = predictor
+        # Result sections passed through to predict_batch; None keeps the predictor's default
+        self.include = include
+        self.max_batch = max_batch
+        self.max_wait = max_wait_ms / 1000.0
+        self.workers = max(1, workers)
+        self._queue = queue.Queue()
+        self._lock = threading.Lock()
+        self._threads = []
+        self._worker_pid = None
+
+    def submit(self, data: Dict[str, Any]) -> Future:
+        """Queue one input for prediction and return a future for its result"""
+        self._ensure_worker()
+        future = Future()
+        self._queue.put((data, future))
+        return future
+
+    def _ensure_worker(self):
+        """Start the worker threads lazily, and again in any forked child process"""
+        if self._threads and self._worker_pid == os.getpid():
+            return
+        with self._lock:
+            if not self._threads or self._worker_pid != os.getpid():
+                self._threads = [threading.Thread(target=self._run, daemon=True) for _ in range(self.workers)]
+                self._worker_pid = os.getpid()
+                for thread in self._threads:
+                    thread.start()
+
+    def _run(self):
+        while True:
+            batch = [self._queue.get()]
+            deadline = time.monotonic() + self.max_wait
+            while len(batch) < self.max_batch:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                try:
+                    batch.append(self._queue.get(timeout=remaining))
+                except queue.Empty:
+                    break
+            self._dispatch(batch)
+
+    def _predict_batch(self, rows):
+        if self.include is None:
+            return self.predictor.predict_batch(rows)
+        return self.predictor.predict_batch(rows, include=self.include)
+
+    def _dispatch(self, batch):
+        """Run one batched prediction, falling back to per-item calls if it fails"""
+        try:
+            results = self._predict_batch([data for data, _ in batch])
+        except Exception:
+            results = None
+
+        if results is not None:
+            for (_, future), result in zip(batch, results):
+                future.set_result(result)
+            return
+
+        # Isolate the failing input(s) so each caller sees only its own error
+        for data, future in batch:
+            try:
+                future.set_result(self._predict_batch([data])[0])
+            except Exception as e:
+                future.set_exception(e)
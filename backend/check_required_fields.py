@@ -17,7 +17,7 @@ from predictors.specialized_predictors import (
 )
 
 def check_predictor_fields(predictor_class, predictor_name):
-    """Check what fields a predictor requires"""
+    """Print the fields a predictor requires and return them"""
     print(f"\n=== {predictor_name} Required Fields ===")
     
     try:
@@ -27,9 +27,12 @@ def check_predictor_fields(predictor_class, predictor_name):
         print(f"Total fields: {len(required_fields)}")
         for i, field in enumerate(required_fields, 1):
             print(f"{i:2d}. {field}")
+        
+        return required_fields
             
     except Exception as e:
         print(f"Error: {str(e)}")
+        return []
 
 def main():
     """Check required fields for all predictors"""
@@ -52,15 +55,8 @@ def main():
     all_fields = set()
     
     for predictor_class, predictor_name in predictors_to_check:
-        check_predictor_fields(predictor_class, predictor_name)
-        
-        # Collect all unique fields
-        try:
-            predictor = predictor_class()
-            required_fields = predictor.get_required_fields()
-            all_fields.update(required_fields)
-        except:
-            pass
+        # Collect all unique fields from the same instance that was printed
+        all_fields.update(check_predictor_fields(predictor_class, predictor_name))
     
     print(f"\n=== All Unique Fields ({len(all_fields)}) ===")
     for i, field in enumerate(sorted(all_fields), 1):
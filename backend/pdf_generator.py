@@ -1,68 +1,150 @@
 from reportlab.lib.pagesizes import letter, A4
-from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer, Table, TableStyle, Image
+from reportlab.platypus import BaseDocTemplate, PageTemplate, Frame, Paragraph, Preformatted, Spacer, Image
 from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
 from reportlab.lib.units import inch
 from reportlab.lib import colors
 from reportlab.lib.enums import TA_CENTER, TA_LEFT, TA_RIGHT
 from datetime import datetime
+from xml.sax.saxutils import escape
+import copy
 import io
 import os
 
+# Page geometry is identical for every report, so measure it once
+_PAGE_SIZE = A4
+_MARGINS = {'leftMargin': 72, 'rightMargin': 72, 'topMargin': 72, 'bottomMargin': 18}
+_FRAME_GEOMETRY = (
+    _MARGINS['leftMargin'],
+    _MARGINS['bottomMargin'],
+    _PAGE_SIZE[0] - _MARGINS['leftMargin'] - _MARGINS['rightMargin'],
+    _PAGE_SIZE[1] - _MARGINS['topMargin'] - _MARGINS['bottomMargin']
+)
+
+# Style sheet parsing is the slowest part of building a small report, so build styles once
+_STYLES = getSampleStyleSheet()
+
+_TITLE_STYLE = ParagraphStyle(
+    'CustomTitle',
+    parent=_STYLES['Heading1'],
+    fontSize=24,
+    spaceAfter=30,
+    alignment=TA_CENTER,
+    textColor=colors.HexColor('#2563eb')
+)
+
+_SUBTITLE_STYLE = ParagraphStyle(
+    'CustomSubtitle',
+    parent=_STYLES['Heading2'],
+    fontSize=16,
+    spaceAfter=20,
+    alignment=TA_LEFT,
+    textColor=colors.HexColor('#1f2937')
+)
+
+_RISK_COLORS = {
+    'Low': colors.HexColor('#10b981'),
+    'Moderate': colors.HexColor('#f59e0b'),
+    'High': colors.HexColor('#ef4444'),
+    'Very High': colors.HexColor('#dc2626')
+}
+
+# Hex markup for the colored risk level, resolved once instead of per report
+_RISK_HEX = {level: '#' + color.hexval()[2:] for level, color in _RISK_COLORS.items()}
+_LEVEL_HEX = _RISK_HEX.get
+_DEFAULT_LEVEL_HEX = '#000000'
+
+# Accept the numeric encoding the predictors use as well as common string forms
+_GENDER_LABEL = {
+    0: 'Female', 1: 'Male',
+    '0': 'Female', '1': 'Male',
+    'F': 'Female', 'M': 'Male',
+    'female': 'Female', 'male': 'Male',
+    'Female': 'Female', 'Male': 'Male'
+}.get
+
+# Monospace styles for the small label/value blocks; Preformatted draws them without table layout
+_PATIENT_INFO_STYLE = ParagraphStyle(
+    'PatientInfo',
+    parent=_STYLES['Code'],
+    fontName='Courier',
+    fontSize=11,
+    leading=19,
+    leftIndent=0,
+    spaceAfter=0
+)
+
+_RESULTS_STYLE = ParagraphStyle(
+    'Results',
+    parent=_STYLES['Code'],
+    fontName='Courier',
+    fontSize=12,
+    leading=22,
+    leftIndent=0,
+    spaceAfter=0
+)
+
+# Label column width in characters, roughly the old 2 inch table column
+_LABEL_WIDTH = 14
+
+_BODY_STYLE = ParagraphStyle(
+    'CustomBody',
+    parent=_STYLES['Normal'],
+    fontSize=11,
+    spaceAfter=12,
+    alignment=TA_LEFT
+)
+
+_DISCLAIMER_STYLE = ParagraphStyle(
+    'Disclaimer',
+    parent=_STYLES['Normal'],
+    fontSize=9,
+    alignment=TA_CENTER,
+    textColor=colors.grey
+)
+
+_DISCLAIMER_TEXT = (
+    "<b>IMPORTANT DISCLAIMER:</b> This report is for informational purposes only and should not "
+    "replace professional medical advice, diagnosis, or treatment. Always consult with a qualified "
+    "healthcare provider regarding any health concerns or before making any decisions related to your health."
+)
+
+# Header title and disclaimer never change, so their markup is parsed once. Builds wrap each flowable
+# in place, so every report takes a shallow copy rather than sharing these instances
+_TITLE_PARAGRAPH = Paragraph("Health Assessment Report", _TITLE_STYLE)
+_DISCLAIMER_PARAGRAPH = Paragraph(_DISCLAIMER_TEXT, _DISCLAIMER_STYLE)
+
+_RISK_INTERPRETATION_TEMPLATES = {
+    'Low': "Your risk score of {risk_score:.1%} indicates a low risk level. This suggests that based on the assessed factors, you have a relatively low likelihood of developing the condition. Continue maintaining healthy lifestyle habits.",
+    'Moderate': "Your risk score of {risk_score:.1%} indicates a moderate risk level. While not immediately concerning, this suggests you should pay attention to risk factors and consider preventive measures.",
+    'High': "Your risk score of {risk_score:.1%} indicates a high risk level. This suggests you should take proactive steps to address risk factors and consult with healthcare professionals for proper evaluation and management.",
+    'Very High': "Your risk score of {risk_score:.1%} indicates a very high risk level. This requires immediate attention and professional medical consultation for proper assessment and intervention."
+}
+
+_DEFAULT_INTERPRETATION = "Your risk score is {risk_score:.1%}. Please consult with a healthcare professional for proper interpretation.".format
+
+# Bound str.format methods, so building the text is a single call
+_RISK_INTERPRETATIONS = {level: template.format for level, template in _RISK_INTERPRETATION_TEMPLATES.items()}
+
+# Blank line between numbered recommendations, matching the old per-paragraph spacing
+_RECOMMENDATION_SEPARATOR = "<br/><br/>"
+
 class HealthReportGenerator:
-    def __init__(self):
-        self.styles = getSampleStyleSheet()
-        self.setup_custom_styles()
-    
-    def setup_custom_styles(self):
-        """Setup custom styles for the PDF report"""
-        # Title style
-        self.title_style = ParagraphStyle(
-            'CustomTitle',
-            parent=self.styles['Heading1'],
-            fontSize=24,
-            spaceAfter=30,
-            alignment=TA_CENTER,
-            textColor=colors.HexColor('#2563eb')
-        )
-        
-        # Subtitle style
-        self.subtitle_style = ParagraphStyle(
-            'CustomSubtitle',
-            parent=self.styles['Heading2'],
-            fontSize=16,
-            spaceAfter=20,
-            alignment=TA_LEFT,
-            textColor=colors.HexColor('#1f2937')
-        )
-        
-        # Risk level styles
-        self.risk_styles = {
-            'Low': colors.HexColor('#10b981'),
-            'Moderate': colors.HexColor('#f59e0b'),
-            'High': colors.HexColor('#ef4444'),
-            'Very High': colors.HexColor('#dc2626')
-        }
-        
-        # Body text style
-        self.body_style = ParagraphStyle(
-            'CustomBody',
-            parent=self.styles['Normal'],
-            fontSize=11,
-            spaceAfter=12,
-            alignment=TA_LEFT
-        )
+    styles = _STYLES
+    title_style = _TITLE_STYLE
+    subtitle_style = _SUBTITLE_STYLE
+    risk_styles = _RISK_COLORS
+    body_style = _BODY_STYLE
     
-    def generate_report(self, prediction_data, user_data=None):
+    def generate_report(self, prediction_data, user_data=None, generated_at=None):
         """Generate a comprehensive health assessment PDF report"""
         buffer = io.BytesIO()
-        doc = SimpleDocTemplate(buffer, pagesize=A4, rightMargin=72, leftMargin=72,
-                              topMargin=72, bottomMargin=18)
+        doc = self._create_document(buffer)
         
         # Build the story (content)
         story = []
         
         # Header
-        story.extend(self._build_header())
+        story.extend(self._build_header(generated_at))
         
         # Patient Information (if provided)
         if user_data:
@@ -85,17 +167,27 @@ class HealthReportGenerator:
         buffer.seek(0)
         return buffer
     
-    def _build_header(self):
+    def _create_document(self, buffer):
+        """Create a document with a single precomputed page template"""
+        # Frames hold per-build layout state, so each document gets its own
+        frame = Frame(*_FRAME_GEOMETRY, id='body')
+        return BaseDocTemplate(
+            buffer,
+            pagesize=_PAGE_SIZE,
+            pageTemplates=[PageTemplate(id='report', frames=[frame], pagesize=_PAGE_SIZE)],
+            **_MARGINS
+        )
+    
+    def _build_header(self, generated_at=None):
         """Build the report header"""
         story = []
         
         # Title
-        title = Paragraph("Health Assessment Report", self.title_style)
-        story.append(title)
+        story.append(copy.copy(_TITLE_PARAGRAPH))
         story.append(Spacer(1, 20))
         
         # Report date
-        date_str = datetime.now().strftime("%B %d, %Y at %I:%M %p")
+        date_str = (generated_at or datetime.now()).strftime("%B %d, %Y at %I:%M %p")
         date_para = Paragraph(f"<b>Report Generated:</b> {date_str}", self.body_style)
         story.append(date_para)
         story.append(Spacer(1, 30))
@@ -108,25 +200,17 @@ class HealthReportGenerator:
         
         story.append(Paragraph("Patient Information", self.subtitle_style))
         
-        # Create patient info table
-        patient_data = []
+        # Two-column label/value block
+        patient_lines = []
         if 'age' in user_data:
-            patient_data.append(['Age:', f"{user_data['age']} years"])
+            patient_lines.append(f"{'Age:':<{_LABEL_WIDTH}}{user_data['age']} years")
         if 'gender' in user_data:
-            gender_text = 'Male' if user_data['gender'] == 1 else 'Female'
-            patient_data.append(['Gender:', gender_text])
+            patient_lines.append(f"{'Gender:':<{_LABEL_WIDTH}}{_GENDER_LABEL(user_data['gender'], 'Unspecified')}")
         if 'bmi' in user_data:
-            patient_data.append(['BMI:', f"{user_data['bmi']:.1f}"])
-        
-        if patient_data:
-            table = Table(patient_data, colWidths=[2*inch, 3*inch])
-            table.setStyle(TableStyle([
-                ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
-                ('FONTNAME', (0, 0), (0, -1), 'Helvetica-Bold'),
-                ('FONTSIZE', (0, 0), (-1, -1), 11),
-                ('BOTTOMPADDING', (0, 0), (-1, -1), 8),
-            ]))
-            story.append(table)
+            patient_lines.append(f"{'BMI:':<{_LABEL_WIDTH}}{user_data['bmi']:.1f}")
+        
+        if patient_lines:
+            story.append(Preformatted("\n".join(patient_lines), _PATIENT_INFO_STYLE))
         
         story.append(Spacer(1, 30))
         return story
@@ -139,30 +223,20 @@ class HealthReportGenerator:
         
         # Predictor type
         predictor_name = prediction_data.get('predictor_type', 'Unknown').replace('_', ' ').title()
-        story.append(Paragraph(f"<b>Assessment Type:</b> {predictor_name}", self.body_style))
+        story.append(Paragraph(f"<b>Assessment Type:</b> {escape(predictor_name)}", self.body_style))
         
         # Risk score and level
         risk_score = prediction_data.get('risk_score', 0)
         risk_level = prediction_data.get('risk_level', 'Unknown')
         confidence = prediction_data.get('confidence', 0)
         
-        # Create results table
-        results_data = [
-            ['Risk Score:', f"{risk_score:.2%}"],
-            ['Risk Level:', risk_level],
-            ['Confidence:', f"{confidence:.1%}"]
-        ]
-        
-        table = Table(results_data, colWidths=[2*inch, 3*inch])
-        table.setStyle(TableStyle([
-            ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
-            ('FONTNAME', (0, 0), (0, -1), 'Helvetica-Bold'),
-            ('FONTSIZE', (0, 0), (-1, -1), 12),
-            ('BOTTOMPADDING', (0, 0), (-1, -1), 10),
-            ('TEXTCOLOR', (1, 1), (1, 1), self.risk_styles.get(risk_level, colors.black)),
-            ('FONTNAME', (1, 1), (1, 1), 'Helvetica-Bold'),
-        ]))
-        story.append(table)
+        # Plain label/value lines; only the risk level needs markup for its color, so it is escaped as it
+        # comes from the request
+        risk_color = _LEVEL_HEX(risk_level, _DEFAULT_LEVEL_HEX)
+        label = f"{'Risk Level:':<{_LABEL_WIDTH}}".replace(' ', '&nbsp;')
+        story.append(Preformatted(f"{'Risk Score:':<{_LABEL_WIDTH}}{risk_score:.2%}", _RESULTS_STYLE))
+        story.append(Paragraph(f'{label}<font color="{risk_color}"><b>{escape(str(risk_level))}</b></font>', _RESULTS_STYLE))
+        story.append(Preformatted(f"{'Confidence:':<{_LABEL_WIDTH}}{confidence:.1%}", _RESULTS_STYLE))
         story.append(Spacer(1, 30))
         
         return story
@@ -191,9 +265,9 @@ class HealthReportGenerator:
         
         recommendations = prediction_data.get('recommendations', [])
         if recommendations:
-            for i, rec in enumerate(recommendations, 1):
-                rec_para = Paragraph(f"{i}. {rec}", self.body_style)
-                story.append(rec_para)
+            # One flowable for the whole numbered list instead of one per recommendation
+            body = _RECOMMENDATION_SEPARATOR.join(f"{i}. {escape(str(rec))}" for i, rec in enumerate(recommendations, 1))
+            story.append(Paragraph(body, self.body_style))
         else:
             story.append(Paragraph("No specific recommendations available.", self.body_style))
         
@@ -205,32 +279,11 @@ class HealthReportGenerator:
         story = []
         
         # Disclaimer
-        disclaimer_style = ParagraphStyle(
-            'Disclaimer',
-            parent=self.styles['Normal'],
-            fontSize=9,
-            alignment=TA_CENTER,
-            textColor=colors.grey
-        )
-        
-        disclaimer_text = (
-            "<b>IMPORTANT DISCLAIMER:</b> This report is for informational purposes only and should not "
-            "replace professional medical advice, diagnosis, or treatment. Always consult with a qualified "
-            "healthcare provider regarding any health concerns or before making any decisions related to your health."
-        )
-        
         story.append(Spacer(1, 40))
-        story.append(Paragraph(disclaimer_text, disclaimer_style))
+        story.append(copy.copy(_DISCLAIMER_PARAGRAPH))
         
         return story
     
     def _get_risk_interpretation(self, risk_level, risk_score):
         """Get risk level interpretation text"""
-        interpretations = {
-            'Low': f"Your risk score of {risk_score:.1%} indicates a low risk level. This suggests that based on the assessed factors, you have a relatively low likelihood of developing the condition. Continue maintaining healthy lifestyle habits.",
-            'Moderate': f"Your risk score of {risk_score:.1%} indicates a moderate risk level. While not immediately concerning, this suggests you should pay attention to risk factors and consider preventive measures.",
-            'High': f"Your risk score of {risk_score:.1%} indicates a high risk level. This suggests you should take proactive steps to address risk factors and consult with healthcare professionals for proper evaluation and management.",
-            'Very High': f"Your risk score of {risk_score:.1%} indicates a very high risk level. This requires immediate attention and professional medical consultation for proper assessment and intervention."
-        }
-        
-        return interpretations.get(risk_level, f"Your risk score is {risk_score:.1%}. Please consult with a healthcare professional for proper interpretation.")
\ No newline at end of file
+        return _RISK_INTERPRETATIONS.get(risk_level, _DEFAULT_INTERPRETATION)(risk_score=risk_score)
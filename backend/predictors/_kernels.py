@@ -0,0 +1,34 @@
+import numpy as np
+
+try:
+    from numba import njit, types as nb_types
+    NUMBA_AVAILABLE = True
+except ImportError:  # Callers fall back to vectorized numpy when numba isn't installed
+    NUMBA_AVAILABLE = False
+    
+    def njit(*args, **kwargs):
+        """No-op stand-in for numba.njit"""
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+        return lambda func: func
+
+
+# fastmath is left off: it assumes no NaNs, and a NaN reading must stay in range as it does in numpy
+@njit(cache=True, nogil=True)
+def _out_of_range_loop(values, below, above):
+    """Elementwise values < below or values > above in one pass, without temporaries"""
+    out = np.empty(values.shape[0], dtype=np.bool_)
+    for i in range(values.shape[0]):
+        out[i] = values[i] < below[i] or values[i] > above[i]
+    return out
+
+if NUMBA_AVAILABLE:
+    # Compile at import instead of on the first request
+    _out_of_range_loop.compile((nb_types.float64[::1],) * 3)
+
+
+def out_of_range(values: np.ndarray, below: np.ndarray, above: np.ndarray) -> np.ndarray:
+    """Mask of values under their `below` bound or over their `above` bound"""
+    if NUMBA_AVAILABLE:
+        return _out_of_range_loop(values, below, above)
+    return (values < below) | (values > above)
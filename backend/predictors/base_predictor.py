@@ -1,25 +1,187 @@
 from abc import ABC, abstractmethod
-from typing import Dict, List, Any, Optional
+from typing import TYPE_CHECKING, Callable, Dict, List, Any, Iterable, Mapping, NamedTuple
 import numpy as np
-import pandas as pd
-from sklearn.ensemble import RandomForestClassifier
-from sklearn.preprocessing import StandardScaler
-from sklearn.model_selection import train_test_split
-from sklearn.metrics import accuracy_score, classification_report
-import joblib
+import hashlib
+import json
+import logging
 import os
+import pickle
+import threading
+from collections import OrderedDict
+from itertools import chain, count
+from .tree_runtime import CompiledForest
+from bisect import bisect_right
+
+# sklearn and joblib take over a second to import and are only needed once a model is trained, loaded
+# or saved, so they are imported where used; reading schemas or building predictors stays cheap
+if TYPE_CHECKING:
+    import pandas as pd
+    from sklearn.ensemble import RandomForestClassifier
+
+_logger = logging.getLogger(__name__)
+
+# Per-thread float32 feature rows, keyed by feature count, reused across predictions
+_scratch = threading.local()
+
+# Optional parts of a prediction result; predict() builds all of them unless told otherwise
+PREDICTION_SECTIONS = ("detailed_analysis", "recommendations", "chart_data", "explanation")
+_OPTIONAL_SECTIONS = frozenset(PREDICTION_SECTIONS)
+
+# Field contribution bands shared by categorize_field_risk and get_risk_color
+_CONTRIBUTION_BOUNDS = (0.2, 0.5, 0.8)
+_CONTRIBUTION_LEVELS = ("Low", "Moderate", "High", "Very High")
+_CONTRIBUTION_COLORS = ("#22c55e", "#eab308", "#f97316", "#ef4444")  # Green, yellow, orange, red
+
+_SEVERITY_BOUNDS = (0.2, 0.4, 0.6, 0.8)
+_SEVERITIES = (
+    "Minimal - Very low likelihood of developing the condition",
+    "Mild - Low to moderate risk with good prognosis if managed",
+    "Moderate - Significant risk requiring active management",
+    "High - Elevated risk requiring immediate intervention",
+    "Critical - Very high risk requiring urgent medical attention"
+)
+
+# Fixed recommendation texts; methods return list copies, since results hand them to callers
+_LEVEL_RECOMMENDATIONS = {
+    "Low": (
+        "Maintain your current healthy lifestyle",
+        "Continue regular check-ups with your healthcare provider",
+        "Stay physically active and eat a balanced diet"
+    ),
+    "Moderate": (
+        "Consider lifestyle modifications to reduce risk",
+        "Schedule more frequent health screenings",
+        "Consult with your healthcare provider about prevention strategies",
+        "Monitor relevant health metrics regularly"
+    ),
+    "High": (
+        "Seek immediate consultation with a healthcare professional",
+        "Consider comprehensive health screening",
+        "Implement significant lifestyle changes",
+        "Follow up with specialist if recommended"
+    ),
+    "Very High": (
+        "Urgent medical consultation recommended",
+        "Comprehensive diagnostic testing may be needed",
+        "Consider immediate lifestyle interventions",
+        "Follow all medical advice strictly"
+    )
+}
+_PREVENTIVE_MEASURES = (
+    "Regular health screenings and check-ups",
+    "Maintain a balanced, nutritious diet",
+    "Engage in regular physical activity",
+    "Manage stress through relaxation techniques",
+    "Avoid smoking and limit alcohol consumption"
+)
+_LIFESTYLE_RECOMMENDATIONS = (
+    "Implement a heart-healthy diet rich in fruits and vegetables",
+    "Establish a regular exercise routine (150 minutes/week moderate activity)",
+    "Practice stress management techniques like meditation or yoga"
+)
+_MONITORING_RECOMMENDATIONS = (
+    "Schedule regular follow-up appointments with your healthcare provider",
+    "Monitor key health metrics daily or weekly as advised",
+    "Keep a health diary to track symptoms and improvements"
+)
+
+# Per field type: the types accepted as-is, the caster for anything else, and the value that
+# replaces None or an unconvertible input
+_FIELD_COERCIONS = {
+    'float': ((int, float), float, 0.0),
+    'int': (int, int, 0),
+    'str': (str, str, "")
+}
+
+# Marks a field absent from the input, as distinct from one explicitly set to None
+_MISSING = object()
+
+# Pre-drawn jitter for the decorative age-group average, cycled through instead of drawn per prediction
+_NOISE_SIZE = 4096
+_NOISE = tuple(np.random.default_rng(0).normal(0, 5, size=_NOISE_SIZE).tolist())
+_noise_index = count()
+
+# Synthetic default forests shared by every predictor with the same feature count, as (model, compiled
+# forest) pairs. They live in memory only: under gunicorn --preload the master trains them once and the
+# forked workers share them, and nothing is ever unpickled from a path another user could write to
+_DEFAULT_MODEL_CACHE: Dict[int, tuple] = {}
+_DEFAULT_MODEL_LOCKS: Dict[int, threading.Lock] = {}
+
+# The synthetic labels carry no signal worth deep trees, and prediction cost grows with trees x depth
+_DEFAULT_FOREST_PARAMS = {'n_estimators': 25, 'max_depth': 6, 'random_state': 42}
+
+# Upper bounds of the Low/Moderate/High bands; scores at or above the last are Very High
+_THRESHOLDS = np.array([0.3, 0.6, 0.8])
+_LEVELS = np.array(["Low", "Moderate", "High", "Very High"])
+_THRESHOLD_BOUNDS = tuple(_THRESHOLDS.tolist())
+_LEVEL_NAMES = tuple(_LEVELS.tolist())
+
+class RiskFactors(NamedTuple):
+    """Significant risk factors, most contributing first, as parallel columns"""
+    factors: List[str]
+    values: List[Any]
+    contributions: np.ndarray
+    explanations: List[str]
+    risk_levels: List[str]
+    
+    def records(self) -> List[Dict[str, Any]]:
+        """One dict per factor, the shape returned to API clients"""
+        return [
+            {
+                "factor": factor,
+                "value": value,
+                "risk_level": risk_level,
+                "contribution_score": contribution,
+                "explanation": explanation
+            }
+            for factor, value, risk_level, contribution, explanation in zip(
+                self.factors, self.values, self.risk_levels, self.contributions, self.explanations
+            )
+        ]
 
 class BasePredictor(ABC):
     """Base class for all health predictors"""
     
+    # joblib's pool setup costs more than walking the forest for a small batch, so forests predict
+    # serially unless a batch has at least parallel_predict_rows rows
+    n_jobs_predict = 1
+    parallel_predict_rows = 256
+    # Most recent results kept per predictor, so repeated inputs skip the pipeline; 0 disables the cache
+    result_cache_size = 1024
+    # Predictors whose features are input fields divided by fixed scales declare them here, which lets
+    # preprocess_batch() build a whole batch in one pass; _FEATURE_GETTER is itemgetter(*_FEATURE_FIELDS)
+    _FEATURE_FIELDS = None
+    _FEATURE_SCALES = None
+    _FEATURE_GETTER = None
+    
     def __init__(self, name: str, description: str):
         self.name = name
         self.description = description
         self.model = None
-        self.scaler = StandardScaler()
+        self._scaler = None
         self.is_trained = False
         self.feature_names = []
-        
+        # Array form of a fitted forest for fast inference, rebuilt whenever self.model changes
+        self._fast_predictor = None
+        # Field metadata is fixed per predictor, so it is built once on first use
+        self._required_fields = None
+        self._field_descriptions = None
+        self._validators = None
+        self._result_cache_lock = threading.Lock()
+        self.cache_clear()
+        
+    @property
+    def scaler(self):
+        """Feature scaler saved with the model, created on first use since the forest needs no scaling"""
+        if self._scaler is None:
+            from sklearn.preprocessing import StandardScaler
+            self._scaler = StandardScaler()
+        return self._scaler
+    
+    @scaler.setter
+    def scaler(self, scaler):
+        self._scaler = scaler
+    
     @abstractmethod
     def get_required_fields(self) -> Dict[str, str]:
         """Return dictionary of required input fields and their types"""
@@ -32,127 +194,192 @@ class BasePredictor(ABC):
     
     @abstractmethod
     def preprocess_data(self, data: Dict[str, Any]) -> np.ndarray:
-        """Preprocess input data for prediction"""
+        """Preprocess input data into a (1, n_features) array for prediction"""
         pass
     
+    def _required_fields_cached(self) -> Dict[str, str]:
+        """get_required_fields(), built once per instance"""
+        if self._required_fields is None:
+            self._required_fields = self.get_required_fields()
+        return self._required_fields
+    
+    def _field_descriptions_cached(self) -> Dict[str, str]:
+        """get_field_descriptions(), built once per instance"""
+        if self._field_descriptions is None:
+            self._field_descriptions = self.get_field_descriptions()
+        return self._field_descriptions
+    
+    def _scratch_row(self, n_features: int) -> np.ndarray:
+        """This thread's reusable (1, n_features) float32 buffer"""
+        buffers = getattr(_scratch, 'buffers', None)
+        if buffers is None:
+            buffers = _scratch.buffers = {}
+        buffer = buffers.get(n_features)
+        if buffer is None:
+            buffer = buffers[n_features] = np.empty((1, n_features), dtype=np.float32)
+        return buffer
+    
+    def _fill_row(self, features: List[float]) -> np.ndarray:
+        """Copy features into this thread's reusable (1, n_features) float32 buffer and return it"""
+        buffer = self._scratch_row(len(features))
+        buffer[0] = features
+        return buffer
+    
+    def _fill_scaled_row(self, data: Dict[str, Any], getter: Callable, scales: np.ndarray) -> np.ndarray:
+        """Gather fields from data with getter, divide each by its scale and fill the scratch buffer"""
+        buffer = self._scratch_row(len(scales))
+        values = np.array(getter(data), dtype=np.float64)
+        # The quotient is taken in float64 and rounded once into the float32 buffer, exactly as the
+        # per-field Python division was
+        np.divide(values, scales, out=buffer[0])
+        return buffer
+    
+    def preprocess_batch(self, rows: List[Dict[str, Any]]) -> np.ndarray:
+        """Preprocess several validated inputs into one (len(rows), n_features) float32 matrix"""
+        fields = self._FEATURE_FIELDS
+        if fields is not None:
+            values = np.fromiter(chain.from_iterable(map(self._FEATURE_GETTER, rows)), dtype=np.float64,
+                                 count=len(rows) * len(fields)).reshape(len(rows), len(fields))
+            # Divided in float64 and rounded once into float32, exactly as preprocess_data() does per row
+            X = np.empty(values.shape, dtype=np.float32)
+            np.divide(values, self._FEATURE_SCALES, out=X)
+            return X
+        
+        # preprocess_data() may hand back the shared scratch buffer, so copy each into the batch matrix
+        X = None
+        for i, data in enumerate(rows):
+            row = self.preprocess_data(data)[0]
+            if X is None:
+                X = np.empty((len(rows), len(row)), dtype=np.float32)
+            X[i] = row
+        return X
+    
+    def _validators_cached(self) -> tuple:
+        """(field, accepted types, caster, default) per required field, built once per instance"""
+        if self._validators is None:
+            required_fields = self._required_fields_cached()
+            if isinstance(required_fields, Mapping):
+                self._validators = tuple(
+                    (field, *_FIELD_COERCIONS.get(field_type, (None, None, None)))
+                    for field, field_type in required_fields.items()
+                )
+            else:
+                # Untyped field lists are only checked for presence
+                self._validators = tuple((field, None, None, None) for field in required_fields)
+        return self._validators
+    
     def validate_input(self, data: Dict[str, Any]) -> bool:
         """Validate input data against required fields"""
-        required_fields = self.get_required_fields()
-        for field in required_fields:
-            if field not in data:
+        for field, accepted, cast, default in self._validators_cached():
+            value = data.get(field, _MISSING)
+            if value is _MISSING:
                 raise ValueError(f"Missing required field: {field}")
             
             # Handle None values by providing defaults
-            if data[field] is None:
-                expected_type = required_fields[field]
-                if expected_type == 'float':
-                    data[field] = 0.0
-                elif expected_type == 'int':
-                    data[field] = 0
-                elif expected_type == 'str':
-                    data[field] = ""
+            if value is None:
+                if cast is not None:
+                    data[field] = default
                 continue
             
             # Type validation
-            expected_type = required_fields[field]
-            if expected_type == 'float' and not isinstance(data[field], (int, float)):
-                try:
-                    data[field] = float(data[field]) if data[field] is not None and data[field] != "" else 0.0
-                except (ValueError, TypeError):
-                    data[field] = 0.0  # Default to 0 if conversion fails
-            elif expected_type == 'int' and not isinstance(data[field], int):
-                try:
-                    data[field] = int(data[field]) if data[field] is not None and data[field] != "" else 0
-                except (ValueError, TypeError):
-                    data[field] = 0  # Default to 0 if conversion fails
-            elif expected_type == 'str' and not isinstance(data[field], str):
-                data[field] = str(data[field]) if data[field] is not None else ""
+            if accepted is None or isinstance(value, accepted):
+                continue
+            if cast is str:
+                data[field] = str(value)
+                continue
+            try:
+                data[field] = cast(value) if value != "" else default
+            except (ValueError, TypeError):
+                data[field] = default  # Default to 0 if conversion fails
         
         return True
     
+    def get_dummy_input(self) -> Dict[str, Any]:
+        """Return a zero-filled payload that satisfies the required fields"""
+        defaults = {'float': 0.0, 'int': 0, 'str': ""}
+        required_fields = self._required_fields_cached()
+        if isinstance(required_fields, Mapping):
+            return {field: defaults.get(field_type, 0) for field, field_type in required_fields.items()}
+        return {field: 0 for field in required_fields}
+    
     def calculate_risk_level(self, risk_score: float) -> str:
         """Convert risk score to risk level"""
-        if risk_score < 0.3:
-            return "Low"
-        elif risk_score < 0.6:
-            return "Moderate"
-        elif risk_score < 0.8:
-            return "High"
-        else:
-            return "Very High"
+        return _LEVEL_NAMES[bisect_right(_THRESHOLD_BOUNDS, risk_score)]
+    
+    @staticmethod
+    def calculate_risk_level_batch(risk_scores) -> np.ndarray:
+        """Convert an array of risk scores to risk levels in one pass"""
+        return _LEVELS[np.searchsorted(_THRESHOLDS, np.asarray(risk_scores, dtype=np.float64), side='right')]
     
     def get_recommendations(self, risk_score: float, risk_level: str, data: Dict[str, Any]) -> List[str]:
         """Generate recommendations based on risk level and input data"""
-        recommendations = []
-        
-        if risk_level == "Low":
-            recommendations.extend([
-                "Maintain your current healthy lifestyle",
-                "Continue regular check-ups with your healthcare provider",
-                "Stay physically active and eat a balanced diet"
-            ])
-        elif risk_level == "Moderate":
-            recommendations.extend([
-                "Consider lifestyle modifications to reduce risk",
-                "Schedule more frequent health screenings",
-                "Consult with your healthcare provider about prevention strategies",
-                "Monitor relevant health metrics regularly"
-            ])
-        elif risk_level == "High":
-            recommendations.extend([
-                "Seek immediate consultation with a healthcare professional",
-                "Consider comprehensive health screening",
-                "Implement significant lifestyle changes",
-                "Follow up with specialist if recommended"
-            ])
-        else:  # Very High
-            recommendations.extend([
-                "Urgent medical consultation recommended",
-                "Comprehensive diagnostic testing may be needed",
-                "Consider immediate lifestyle interventions",
-                "Follow all medical advice strictly"
-            ])
-        
-        return recommendations
+        # Any level other than the first three is treated as Very High
+        return list(_LEVEL_RECOMMENDATIONS.get(risk_level, _LEVEL_RECOMMENDATIONS["Very High"]))
     
     def generate_detailed_analysis(self, data: Dict[str, Any], risk_score: float, risk_level: str) -> Dict[str, Any]:
         """Generate detailed medical analysis"""
+        contributing_factors, health_metrics = self.analyze_factors_and_metrics(data)
         analysis = {
             "severity_assessment": self.assess_severity(risk_score, data),
-            "contributing_factors": self.identify_contributing_factors(data),
-            "health_metrics_analysis": self.analyze_health_metrics(data),
+            "contributing_factors": contributing_factors,
+            "health_metrics_analysis": health_metrics,
             "lifestyle_impact": self.assess_lifestyle_impact(data),
             "preventive_measures": self.suggest_preventive_measures(risk_score, data)
         }
         return analysis
     
-    def analyze_risk_factors(self, data: Dict[str, Any], processed_data: np.ndarray) -> List[Dict[str, Any]]:
+    def analyze_risk_factors(self, data: Dict[str, Any], processed_data: np.ndarray) -> RiskFactors:
         """Analyze individual risk factors and their contributions"""
-        risk_factors = []
-        field_descriptions = self.get_field_descriptions()
+        if type(self).calculate_field_risk_contribution is not BasePredictor.calculate_field_risk_contribution:
+            return self._analyze_risk_factors_per_field(data, processed_data)
+        
+        field_descriptions = self._field_descriptions_cached()
+        field_names = list(self._required_fields_cached())
+        
+        # The default contribution is elementwise, so score every field at once
+        contributions = np.abs(processed_data[:len(field_names)] - 0.5) * 2
+        significant = np.flatnonzero(contributions > 0.1)  # Only include significant risk factors
+        # A stable sort on the negated scores keeps ties in field order, like list.sort(reverse=True)
+        top = significant[np.argsort(-contributions[significant], kind='stable')[:10]]
+        
+        names = [field_names[i] for i in top]
+        values = [data.get(field_name, 0) for field_name in names]
+        contributions = contributions[top]
+        return RiskFactors(
+            factors=[field_descriptions.get(field_name, field_name) for field_name in names],
+            values=values,
+            contributions=contributions,
+            explanations=list(map(self.explain_field_risk, names, values)),
+            risk_levels=list(map(self.categorize_field_risk, contributions))
+        )
+    
+    def _analyze_risk_factors_per_field(self, data: Dict[str, Any], processed_data: np.ndarray) -> RiskFactors:
+        """analyze_risk_factors for predictors with their own calculate_field_risk_contribution"""
+        scored = []
         
         # Analyze each field for risk contribution
-        for i, (field_name, field_type) in enumerate(self.get_required_fields().items()):
+        for i, field_name in enumerate(self._required_fields_cached()):
             if i < len(processed_data):
                 value = data.get(field_name, 0)
-                normalized_value = processed_data[i]
-                
-                risk_contribution = self.calculate_field_risk_contribution(field_name, value, normalized_value)
-                
+                risk_contribution = self.calculate_field_risk_contribution(field_name, value, processed_data[i])
                 if risk_contribution > 0.1:  # Only include significant risk factors
-                    risk_factors.append({
-                        "factor": field_descriptions.get(field_name, field_name),
-                        "value": value,
-                        "risk_level": self.categorize_field_risk(risk_contribution),
-                        "contribution_score": risk_contribution,
-                        "explanation": self.explain_field_risk(field_name, value)
-                    })
-        
-        # Sort by risk contribution
-        risk_factors.sort(key=lambda x: x["contribution_score"], reverse=True)
-        return risk_factors[:10]  # Return top 10 risk factors
-    
-    def get_enhanced_recommendations(self, risk_score: float, risk_level: str, data: Dict[str, Any], risk_factors: List[Dict[str, Any]]) -> List[str]:
+                    scored.append((risk_contribution, field_name, value))
+        
+        # Sort by risk contribution and keep the top 10
+        scored.sort(key=lambda x: x[0], reverse=True)
+        del scored[10:]
+        
+        field_descriptions = self._field_descriptions_cached()
+        contributions = [contribution for contribution, _, _ in scored]
+        return RiskFactors(
+            factors=[field_descriptions.get(field_name, field_name) for _, field_name, _ in scored],
+            values=[value for _, _, value in scored],
+            contributions=np.array(contributions),
+            explanations=[self.explain_field_risk(field_name, value) for _, field_name, value in scored],
+            risk_levels=list(map(self.categorize_field_risk, contributions))
+        )
+    
+    def get_enhanced_recommendations(self, risk_score: float, risk_level: str, data: Dict[str, Any], risk_factors: RiskFactors) -> List[str]:
         """Generate enhanced personalized recommendations"""
         recommendations = []
         
@@ -160,10 +387,12 @@ class BasePredictor(ABC):
         base_recommendations = self.get_recommendations(risk_score, risk_level, data)
         recommendations.extend(base_recommendations)
         
-        # Add specific recommendations based on top risk factors
-        for factor in risk_factors[:5]:  # Top 5 risk factors
+        # Add specific recommendations based on top risk factors, skipping any already given
+        seen = set(recommendations)
+        for factor in risk_factors.records()[:5]:  # Top 5 risk factors
             specific_rec = self.get_factor_specific_recommendation(factor)
-            if specific_rec and specific_rec not in recommendations:
+            if specific_rec and specific_rec not in seen:
+                seen.add(specific_rec)
                 recommendations.append(specific_rec)
         
         # Add lifestyle recommendations
@@ -176,26 +405,27 @@ class BasePredictor(ABC):
         
         return recommendations[:15]  # Limit to 15 recommendations
     
-    def calculate_confidence(self, data: Dict[str, Any], risk_score: float, risk_factors: List[Dict[str, Any]]) -> float:
+    def calculate_confidence(self, data: Dict[str, Any], risk_score: float, risk_factors: RiskFactors) -> float:
         """Calculate prediction confidence based on data quality and risk factors"""
         base_confidence = 0.75
         
         # Adjust based on data completeness
-        required_fields = len(self.get_required_fields())
-        provided_fields = len([v for v in data.values() if v is not None and v != ''])
+        required_fields = len(self._required_fields_cached())
+        provided_fields = sum(1 for v in data.values() if v is not None and v != '')
         completeness_factor = provided_fields / required_fields
         
         # Adjust based on risk score certainty
         certainty_factor = 1.0 - abs(0.5 - risk_score) * 2  # Higher confidence for extreme scores
         
         # Adjust based on number of significant risk factors
-        risk_factor_confidence = min(1.0, len(risk_factors) / 5.0)
+        risk_factor_confidence = min(1.0, len(risk_factors.factors) / 5.0)
         
         confidence = base_confidence * (0.4 * completeness_factor + 0.4 * certainty_factor + 0.2 * risk_factor_confidence)
         return min(0.95, max(0.60, confidence))  # Clamp between 60% and 95%
     
-    def generate_chart_data(self, data: Dict[str, Any], risk_score: float, risk_factors: List[Dict[str, Any]]) -> Dict[str, Any]:
+    def generate_chart_data(self, data: Dict[str, Any], risk_score: float, risk_factors: RiskFactors) -> Dict[str, Any]:
         """Generate data for charts and visualizations"""
+        top_contributions = risk_factors.contributions[:8]
         return {
             "risk_gauge": {
                 "value": risk_score * 100,
@@ -208,15 +438,23 @@ class BasePredictor(ABC):
                 ]
             },
             "risk_factors_chart": {
-                "labels": [rf["factor"] for rf in risk_factors[:8]],
-                "data": [rf["contribution_score"] * 100 for rf in risk_factors[:8]],
-                "colors": [self.get_risk_color(rf["contribution_score"]) for rf in risk_factors[:8]]
+                "labels": risk_factors.factors[:8],
+                "data": list(top_contributions * 100),
+                "colors": self._risk_colors(top_contributions)
             },
             "health_metrics": self.generate_health_metrics_chart(data),
             "comparison_data": self.generate_population_comparison(data, risk_score)
         }
     
-    def generate_explanation(self, data: Dict[str, Any], risk_score: float, risk_level: str, risk_factors: List[Dict[str, Any]]) -> str:
+    def _risk_colors(self, contributions: np.ndarray) -> List[str]:
+        """get_risk_color for each contribution, banded in one searchsorted call unless it is overridden"""
+        if type(self).get_risk_color is not BasePredictor.get_risk_color:
+            return list(map(self.get_risk_color, contributions))
+        # Bounds in the scores' own dtype, so the bands match the scalar comparisons exactly
+        bounds = np.asarray(_CONTRIBUTION_BOUNDS, dtype=contributions.dtype)
+        return [_CONTRIBUTION_COLORS[i] for i in np.searchsorted(bounds, contributions, side='right').tolist()]
+    
+    def generate_explanation(self, data: Dict[str, Any], risk_score: float, risk_level: str, risk_factors: RiskFactors) -> str:
         """Generate detailed explanation of the prediction"""
         explanation_parts = []
         
@@ -224,8 +462,8 @@ class BasePredictor(ABC):
         explanation_parts.append(f"Based on the provided health information, your {self.name.lower()} shows a {risk_level.lower()} risk level with a score of {risk_score:.1%}.")
         
         # Key contributing factors
-        if risk_factors:
-            top_factors = [rf["factor"] for rf in risk_factors[:3]]
+        if risk_factors.factors:
+            top_factors = risk_factors.factors[:3]
             explanation_parts.append(f"The primary contributing factors are: {', '.join(top_factors)}.")
         
         # Risk level specific explanation
@@ -241,16 +479,7 @@ class BasePredictor(ABC):
     # Helper methods for detailed analysis
     def assess_severity(self, risk_score: float, data: Dict[str, Any]) -> str:
         """Assess the severity of the condition"""
-        if risk_score < 0.2:
-            return "Minimal - Very low likelihood of developing the condition"
-        elif risk_score < 0.4:
-            return "Mild - Low to moderate risk with good prognosis if managed"
-        elif risk_score < 0.6:
-            return "Moderate - Significant risk requiring active management"
-        elif risk_score < 0.8:
-            return "High - Elevated risk requiring immediate intervention"
-        else:
-            return "Critical - Very high risk requiring urgent medical attention"
+        return _SEVERITIES[bisect_right(_SEVERITY_BOUNDS, risk_score)]
     
     def identify_contributing_factors(self, data: Dict[str, Any]) -> List[str]:
         """Identify key contributing factors"""
@@ -263,6 +492,11 @@ class BasePredictor(ABC):
         # This will be overridden by specific predictors
         return {}
     
+    def analyze_factors_and_metrics(self, data: Dict[str, Any]) -> tuple:
+        """identify_contributing_factors() and analyze_health_metrics() together"""
+        # Predictors whose two analyses share the same checks override this to run them once
+        return self.identify_contributing_factors(data), self.analyze_health_metrics(data)
+    
     def assess_lifestyle_impact(self, data: Dict[str, Any]) -> str:
         """Assess lifestyle impact on risk"""
         # This will be overridden by specific predictors
@@ -270,14 +504,7 @@ class BasePredictor(ABC):
     
     def suggest_preventive_measures(self, risk_score: float, data: Dict[str, Any]) -> List[str]:
         """Suggest preventive measures"""
-        measures = [
-            "Regular health screenings and check-ups",
-            "Maintain a balanced, nutritious diet",
-            "Engage in regular physical activity",
-            "Manage stress through relaxation techniques",
-            "Avoid smoking and limit alcohol consumption"
-        ]
-        return measures
+        return list(_PREVENTIVE_MEASURES)
     
     def calculate_field_risk_contribution(self, field_name: str, value: Any, normalized_value: float) -> float:
         """Calculate how much a field contributes to risk"""
@@ -286,14 +513,7 @@ class BasePredictor(ABC):
     
     def categorize_field_risk(self, contribution: float) -> str:
         """Categorize field risk level"""
-        if contribution < 0.2:
-            return "Low"
-        elif contribution < 0.5:
-            return "Moderate"
-        elif contribution < 0.8:
-            return "High"
-        else:
-            return "Very High"
+        return _CONTRIBUTION_LEVELS[bisect_right(_CONTRIBUTION_BOUNDS, contribution)]
     
     def explain_field_risk(self, field_name: str, value: Any) -> str:
         """Explain why a field contributes to risk"""
@@ -307,36 +527,15 @@ class BasePredictor(ABC):
     
     def get_lifestyle_recommendations(self, data: Dict[str, Any], risk_score: float) -> List[str]:
         """Get lifestyle-specific recommendations"""
-        recommendations = []
-        if risk_score > 0.5:
-            recommendations.extend([
-                "Implement a heart-healthy diet rich in fruits and vegetables",
-                "Establish a regular exercise routine (150 minutes/week moderate activity)",
-                "Practice stress management techniques like meditation or yoga"
-            ])
-        return recommendations
-    
-    def get_monitoring_recommendations(self, risk_level: str, risk_factors: List[Dict[str, Any]]) -> List[str]:
+        return list(_LIFESTYLE_RECOMMENDATIONS) if risk_score > 0.5 else []
+    
+    def get_monitoring_recommendations(self, risk_level: str, risk_factors: RiskFactors) -> List[str]:
         """Get monitoring recommendations based on risk level"""
-        recommendations = []
-        if risk_level in ["High", "Very High"]:
-            recommendations.extend([
-                "Schedule regular follow-up appointments with your healthcare provider",
-                "Monitor key health metrics daily or weekly as advised",
-                "Keep a health diary to track symptoms and improvements"
-            ])
-        return recommendations
+        return list(_MONITORING_RECOMMENDATIONS) if risk_level in ("High", "Very High") else []
     
     def get_risk_color(self, contribution: float) -> str:
         """Get color for risk visualization"""
-        if contribution < 0.2:
-            return "#22c55e"  # Green
-        elif contribution < 0.5:
-            return "#eab308"  # Yellow
-        elif contribution < 0.8:
-            return "#f97316"  # Orange
-        else:
-            return "#ef4444"  # Red
+        return _CONTRIBUTION_COLORS[bisect_right(_CONTRIBUTION_BOUNDS, contribution)]
     
     def generate_health_metrics_chart(self, data: Dict[str, Any]) -> Dict[str, Any]:
         """Generate health metrics chart data"""
@@ -350,93 +549,289 @@ class BasePredictor(ABC):
         
         return {
             "user_risk": risk_score * 100,
-            "age_group_average": max(10, min(90, (age - 20) * 1.5 + np.random.normal(0, 5))),
+            "age_group_average": max(10, min(90, (age - 20) * 1.5 + _NOISE[next(_noise_index) % _NOISE_SIZE])),
             "population_average": 35,
             "age_group": age_group
         }
     
-    def predict(self, data: Dict[str, Any]) -> Dict[str, Any]:
+    def predict(self, data: Dict[str, Any], include: Iterable[str] = PREDICTION_SECTIONS) -> Dict[str, Any]:
         """Make prediction and return comprehensive result with detailed analysis"""
-        # Validate input
-        self.validate_input(data)
+        return self._predict_rows([data], include)[0]
+    
+    def predict_batch(self, rows: List[Dict[str, Any]], include: Iterable[str] = PREDICTION_SECTIONS) -> List[Dict[str, Any]]:
+        """Make predictions for several inputs with a single model call"""
+        # Subclasses with a custom predict() don't share the model pipeline; the optional sections they
+        # build are dropped afterwards unless requested, so every predictor answers in the same shape
+        if type(self).predict is not BasePredictor.predict:
+            results = [self.predict(data) for data in rows]
+            excluded = _OPTIONAL_SECTIONS.difference(include)
+            if excluded:
+                for result in results:
+                    for section in excluded:
+                        result.pop(section, None)
+            return results
+        
+        if not rows:
+            return []
+        
+        return self._predict_rows(rows, include)
+    
+    def predict_frame(self, df: 'pd.DataFrame') -> 'pd.DataFrame':
+        """Score every row of a DataFrame, returning its risk_score and risk_level columns"""
+        import pandas as pd
+        
+        if df.empty:
+            risk_scores, risk_levels = [], []
+        elif type(self).predict is not BasePredictor.predict or self._FEATURE_FIELDS is None:
+            # Without a feature table the rows are preprocessed one by one anyway
+            results = self.predict_batch(df.to_dict('records'), include=())
+            risk_scores = [result["risk_score"] for result in results]
+            risk_levels = [result["risk_level"] for result in results]
+        else:
+            values = self._frame_values(df)
+            X = np.empty(values.shape, dtype=np.float32)
+            np.divide(values, self._FEATURE_SCALES, out=X)
+            if not self.is_trained:
+                self._train_default_model()
+            risk_scores = [max(0.0, min(1.0, risk_score)) for risk_score in self._score_matrix(X)]
+            risk_levels = self._risk_levels(risk_scores)
+        
+        return pd.DataFrame({"risk_score": risk_scores, "risk_level": risk_levels}, index=df.index)
+    
+    def _frame_values(self, df: 'pd.DataFrame') -> np.ndarray:
+        """The feature columns of df as a float64 matrix, coerced column-wise as validate_input() coerces rows"""
+        import pandas as pd
+        
+        required_fields = self._required_fields_cached()
+        values = np.empty((len(df), len(self._FEATURE_FIELDS)), dtype=np.float64)
+        for j, field in enumerate(self._FEATURE_FIELDS):
+            if field not in df.columns:
+                raise ValueError(f"Missing required field: {field}")
+            # Empty and unconvertible cells take the field's default of 0, and int fields drop their fraction
+            column = pd.to_numeric(df[field], errors='coerce').to_numpy(dtype=np.float64, na_value=0.0)
+            values[:, j] = np.trunc(column) if required_fields[field] == 'int' else column
+        return values
+    
+    def cache_clear(self):
+        """Forget cached prediction results and reset their statistics; called whenever the model changes"""
+        # Swapped rather than cleared, so a prediction still running on the old model stores into the old cache
+        self._result_cache = OrderedDict()
+        self._result_hits = 0
+        self._result_misses = 0
+    
+    def cache_info(self) -> Dict[str, Any]:
+        """Return result cache statistics for monitoring, in the shape of PredictionCache.stats()"""
+        with self._result_cache_lock:
+            lookups = self._result_hits + self._result_misses
+            return {
+                "size": len(self._result_cache),
+                "maxsize": self.result_cache_size,
+                "hits": self._result_hits,
+                "misses": self._result_misses,
+                "hit_rate": round(self._result_hits / lookups, 4) if lookups else 0.0
+            }
+    
+    def _result_key(self, data: Dict[str, Any], include: frozenset):
+        """Stable cache key for one input and result shape, or None if the input can't be canonicalized"""
+        try:
+            canonical = json.dumps(data, sort_keys=True, default=str).encode()
+        except (TypeError, ValueError):
+            return None
+        return hashlib.blake2b(canonical, digest_size=16).digest(), include
+    
+    def _predict_rows(self, rows: List[Dict[str, Any]], include: Iterable[str] = PREDICTION_SECTIONS) -> List[Dict[str, Any]]:
+        """Validate rows, serve them from the result cache and score the rest through the model pipeline"""
+        include = frozenset(include)
+        # Every row is normalized before the lookup, so callers always get their input validated in place
+        # and the cache is keyed on the validated data
+        for data in rows:
+            self.validate_input(data)
+        if self.result_cache_size <= 0:
+            return self._score_rows(rows, include)
         
-        # Preprocess data
-        processed_data = self.preprocess_data(data)
+        if not self.is_trained:
+            self._train_default_model()
+        cache = self._result_cache
+        keys = [self._result_key(data, include) for data in rows]
+        with self._result_cache_lock:
+            stored = [cache.get(key) if key is not None else None for key in keys]
+            for key, result in zip(keys, stored):
+                if result is not None:
+                    cache.move_to_end(key)
+            misses = [i for i, result in enumerate(stored) if result is None]
+            self._result_hits += len(stored) - len(misses)
+            self._result_misses += len(misses)
+        
+        # The cache keeps its own copy of each result and hands out copies of it, so no caller can reach
+        # into a cached result and change it for the next
+        results = [_copy_containers(result) if result is not None else None for result in stored]
+        if misses:
+            scored = self._score_rows([rows[i] for i in misses], include)
+            copies = [_copy_containers(result) for result in scored]
+            with self._result_cache_lock:
+                for i, result, copy in zip(misses, scored, copies):
+                    results[i] = result
+                    if keys[i] is not None:
+                        cache[keys[i]] = copy
+                        cache.move_to_end(keys[i])
+                while len(cache) > self.result_cache_size:
+                    cache.popitem(last=False)
+        
+        return results
+    
+    def _score_rows(self, rows: List[Dict[str, Any]], include: frozenset) -> List[Dict[str, Any]]:
+        """Stack validated rows and score them through the model pipeline in one predict_proba call"""
+        if len(rows) == 1:
+            # A lone row is scored in place: the scratch buffer preprocess_data() fills is already a float32 matrix
+            X = np.asarray(self.preprocess_data(rows[0]), dtype=np.float32)
+        else:
+            X = self.preprocess_batch(rows)
         
-        # Make prediction
         if not self.is_trained:
             self._train_default_model()
         
-        # Get prediction probability
+        # Clamped here so the levels are banded from the same scores _build_prediction() reports
+        risk_scores = [max(0.0, min(1.0, risk_score)) for risk_score in self._score_matrix(X)]
+        risk_levels = self._risk_levels(risk_scores)
+        return [
+            self._build_prediction(data, processed_data, risk_score, include, risk_level)
+            for data, processed_data, risk_score, risk_level in zip(rows, X, risk_scores, risk_levels)
+        ]
+    
+    def _risk_levels(self, risk_scores: List[float]) -> List[str]:
+        """calculate_risk_level for each score, banded in one searchsorted call unless it is overridden"""
+        if len(risk_scores) == 1 or type(self).calculate_risk_level is not BasePredictor.calculate_risk_level:
+            return list(map(self.calculate_risk_level, risk_scores))
+        return self.calculate_risk_level_batch(risk_scores).tolist()
+    
+    def _score_matrix(self, X: np.ndarray) -> List[float]:
+        """Return raw risk scores for a 2D feature matrix"""
+        if self._fast_predictor is not None:
+            probabilities = self._fast_predictor.predict_proba(X)
+            column = 1 if probabilities.shape[1] > 1 else 0
+            return [float(p) for p in probabilities[:, column]]
+        if hasattr(self.model, 'n_jobs'):
+            n_jobs = self.n_jobs_predict if len(X) >= self.parallel_predict_rows else 1
+            if self.model.n_jobs != n_jobs:
+                self.model.n_jobs = n_jobs
         if hasattr(self.model, 'predict_proba'):
-            probabilities = self.model.predict_proba(processed_data.reshape(1, -1))[0]
-            risk_score = float(probabilities[1] if len(probabilities) > 1 else probabilities[0])
-        else:
-            prediction = self.model.predict(processed_data.reshape(1, -1))[0]
-            risk_score = float(prediction)
-        
+            probabilities = self.model.predict_proba(X)
+            column = 1 if probabilities.shape[1] > 1 else 0
+            return [float(p) for p in probabilities[:, column]]
+        return [float(p) for p in self.model.predict(X)]
+    
+    def _build_prediction(self, data: Dict[str, Any], processed_data: np.ndarray, risk_score: float,
+                          include: Iterable[str] = PREDICTION_SECTIONS, risk_level: str = None) -> Dict[str, Any]:
+        """Assemble the prediction result for one input, with only the optional sections in include"""
         # Ensure risk score is between 0 and 1
         risk_score = max(0.0, min(1.0, risk_score))
         
-        # Calculate risk level
-        risk_level = self.calculate_risk_level(risk_score)
+        # Calculate risk level, unless the caller banded the whole batch already
+        if risk_level is None:
+            risk_level = self.calculate_risk_level(risk_score)
+        
+        result = {"risk_score": risk_score, "risk_level": risk_level}
         
         # Generate comprehensive analysis
-        detailed_analysis = self.generate_detailed_analysis(data, risk_score, risk_level)
+        if "detailed_analysis" in include:
+            result["detailed_analysis"] = self.generate_detailed_analysis(data, risk_score, risk_level)
+        # Risk factors feed the confidence as well as the other optional sections, so they are always built
         risk_factors = self.analyze_risk_factors(data, processed_data)
-        recommendations = self.get_enhanced_recommendations(risk_score, risk_level, data, risk_factors)
+        result["risk_factors"] = risk_factors.records()
+        if "recommendations" in include:
+            result["recommendations"] = self.get_enhanced_recommendations(risk_score, risk_level, data, risk_factors)
         
         # Calculate confidence with more sophisticated logic
-        confidence = self.calculate_confidence(data, risk_score, risk_factors)
+        result["confidence"] = self.calculate_confidence(data, risk_score, risk_factors)
         
         # Generate visualization data
-        chart_data = self.generate_chart_data(data, risk_score, risk_factors)
-        
-        return {
-            "risk_score": risk_score,
-            "risk_level": risk_level,
-            "detailed_analysis": detailed_analysis,
-            "risk_factors": risk_factors,
-            "recommendations": recommendations,
-            "confidence": confidence,
-            "chart_data": chart_data,
-            "explanation": self.generate_explanation(data, risk_score, risk_level, risk_factors)
-        }
+        if "chart_data" in include:
+            result["chart_data"] = self.generate_chart_data(data, risk_score, risk_factors)
+        if "explanation" in include:
+            result["explanation"] = self.generate_explanation(data, risk_score, risk_level, risk_factors)
+        return result
     
     def _train_default_model(self):
-        """Train a default model with synthetic data for demonstration"""
-        # Generate synthetic training data
-        n_samples = 1000
-        n_features = len(self.get_required_fields())
-        
-        # Create synthetic features
-        X = np.random.randn(n_samples, n_features)
-        
-        # Create synthetic labels with some logic
-        y = (X.sum(axis=1) + np.random.randn(n_samples) * 0.1 > 0).astype(int)
-        
-        # Train model
-        self.model = RandomForestClassifier(n_estimators=100, random_state=42)
-        self.model.fit(X, y)
+        """Use the shared default model for this feature count, training it on first use in this process"""
+        n_features = len(self._required_fields_cached())
+        cached = _DEFAULT_MODEL_CACHE.get(n_features)
+        if cached is None:
+            with _DEFAULT_MODEL_LOCKS.setdefault(n_features, threading.Lock()):
+                cached = _DEFAULT_MODEL_CACHE.get(n_features)
+                if cached is None:
+                    model = _fit_default_model(n_features)
+                    cached = _DEFAULT_MODEL_CACHE[n_features] = (model, CompiledForest.from_sklearn(model))
+        
+        self.model, self._fast_predictor = cached
         self.is_trained = True
+        self.cache_clear()
     
     def save_model(self, filepath: str):
         """Save trained model to file"""
         if self.model is not None:
-            joblib.dump({
-                'model': self.model,
-                'scaler': self.scaler,
-                'feature_names': self.feature_names,
-                'is_trained': self.is_trained
-            }, filepath)
+            with open(filepath, 'wb') as fh:
+                pickle.dump({
+                    'model': self.model,
+                    'scaler': self.scaler,
+                    'feature_names': self.feature_names,
+                    'is_trained': self.is_trained
+                }, fh, protocol=pickle.HIGHEST_PROTOCOL)
     
     def load_model(self, filepath: str):
         """Load trained model from file"""
         if os.path.exists(filepath):
-            data = joblib.load(filepath)
+            data = _read_model_file(filepath)
             self.model = data['model']
             self.scaler = data['scaler']
             self.feature_names = data['feature_names']
             self.is_trained = data['is_trained']
+            self._fast_predictor = CompiledForest.from_sklearn(self.model)
+            self.cache_clear()
             return True
-        return False
\ No newline at end of file
+        return False
+
+
+def _copy_containers(value: Any) -> Any:
+    """Copy of a prediction result with every dict and list in it copied; the scalars and strings are shared"""
+    if type(value) is dict:
+        return {key: _copy_containers(item) for key, item in value.items()}
+    if type(value) is list:
+        return [_copy_containers(item) for item in value]
+    return value
+
+
+def _read_model_file(filepath: str) -> Dict[str, Any]:
+    """Read a save_model file, including ones written by joblib before save_model used plain pickle"""
+    # Only the errors plain pickle raises on joblib's format are caught; a missing or unreadable file
+    # is reported as it is rather than retried with joblib
+    try:
+        with open(filepath, 'rb') as fh:
+            data = pickle.load(fh)
+    except (pickle.UnpicklingError, EOFError, AttributeError) as error:
+        reason = f"{type(error).__name__}: {error}"
+    else:
+        if isinstance(data, dict):
+            return data
+        reason = f"it holds a {type(data).__name__}, not a dict"
+    _logger.warning("Model file %s is not a plain pickle save (%s); reading it with joblib", filepath, reason)
+    import joblib
+    return joblib.load(filepath)
+
+
+def _fit_default_model(n_features: int) -> 'RandomForestClassifier':
+    """Train a default model with synthetic data for demonstration"""
+    from sklearn.ensemble import RandomForestClassifier
+    
+    # Generate synthetic training data
+    n_samples = 1000
+    
+    # Create synthetic features
+    X = np.random.randn(n_samples, n_features)
+    
+    # Create synthetic labels with some logic
+    y = (X.sum(axis=1) + np.random.randn(n_samples) * 0.1 > 0).astype(int)
+    
+    # Train model
+    model = RandomForestClassifier(**_DEFAULT_FOREST_PARAMS, n_jobs=1)
+    model.fit(X, y)
+    return model
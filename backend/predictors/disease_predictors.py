@@ -1,68 +1,402 @@
 import numpy as np
-from typing import Dict, List, Any
+from bisect import bisect_left, bisect_right
+from functools import partial
+from operator import gt, itemgetter, le
+from types import MappingProxyType
+from typing import Dict, List, Any, Mapping, Optional
 from .base_predictor import BasePredictor
 
+# Form schemas never change, so each is one shared read-only mapping rather than a literal per call
+_HEART_REQUIRED_FIELDS = MappingProxyType({
+    "age": "int",
+    "sex": "int",  # 1 = male, 0 = female
+    "chest_pain_type": "int",  # 0-3
+    "resting_bp": "float",  # resting blood pressure
+    "cholesterol": "float",  # serum cholesterol mg/dl
+    "fasting_blood_sugar": "int",  # > 120 mg/dl (1 = true, 0 = false)
+    "resting_ecg": "int",  # 0-2
+    "max_heart_rate": "float",
+    "exercise_angina": "int",  # 1 = yes, 0 = no
+    "st_depression": "float",
+    "st_slope": "int",  # 0-2
+    "smoking": "int",  # 1 = yes, 0 = no
+    "family_history": "int"  # 1 = yes, 0 = no
+})
+
+_HEART_FIELD_DESCRIPTIONS = MappingProxyType({
+    "age": "Age in years",
+    "sex": "Sex (1 = Male, 0 = Female)",
+    "chest_pain_type": "Chest pain type (0 = Typical angina, 1 = Atypical angina, 2 = Non-anginal pain, 3 = Asymptomatic)",
+    "resting_bp": "Resting blood pressure (mm Hg)",
+    "cholesterol": "Serum cholesterol (mg/dl)",
+    "fasting_blood_sugar": "Fasting blood sugar > 120 mg/dl (1 = Yes, 0 = No)",
+    "resting_ecg": "Resting ECG results (0 = Normal, 1 = ST-T wave abnormality, 2 = Left ventricular hypertrophy)",
+    "max_heart_rate": "Maximum heart rate achieved",
+    "exercise_angina": "Exercise induced angina (1 = Yes, 0 = No)",
+    "st_depression": "ST depression induced by exercise relative to rest",
+    "st_slope": "Slope of peak exercise ST segment (0 = Upsloping, 1 = Flat, 2 = Downsloping)",
+    "smoking": "Smoking status (1 = Yes, 0 = No)",
+    "family_history": "Family history of heart disease (1 = Yes, 0 = No)"
+})
+
+_DIABETES_REQUIRED_FIELDS = MappingProxyType({
+    "age": "int",
+    "gender": "str",
+    "bmi": "float",
+    "glucose_level": "float",
+    "blood_pressure": "float",
+    "insulin_level": "float",
+    "family_history_diabetes": "str",
+    "physical_activity": "float",
+    "pregnancies": "int",
+    "skin_thickness": "float",
+    "diabetes_pedigree_function": "float"
+})
+
+_DIABETES_FIELD_DESCRIPTIONS = MappingProxyType({
+    "age": "Age in years",
+    "gender": "Gender (Male/Female)",
+    "bmi": "Body Mass Index (kg/m²)",
+    "glucose_level": "Fasting blood glucose level (mg/dL)",
+    "blood_pressure": "Diastolic blood pressure (mmHg)",
+    "insulin_level": "Serum insulin level (μU/mL)",
+    "family_history_diabetes": "Family history of diabetes (Yes/No)",
+    "physical_activity": "Physical activity hours per week",
+    "pregnancies": "Number of pregnancies (for women)",
+    "skin_thickness": "Triceps skin fold thickness (mm)",
+    "diabetes_pedigree_function": "Diabetes pedigree function (0.0-2.5)"
+})
+
+_STROKE_REQUIRED_FIELDS = MappingProxyType({
+    "age": "int",
+    "gender": "int",  # 1 = male, 0 = female
+    "hypertension": "int",  # 1 = yes, 0 = no
+    "heart_disease": "int",  # 1 = yes, 0 = no
+    "ever_married": "int",  # 1 = yes, 0 = no
+    "work_type": "int",  # 0-4 (private, self-employed, govt, children, never worked)
+    "residence_type": "int",  # 1 = urban, 0 = rural
+    "avg_glucose_level": "float",
+    "bmi": "float",
+    "smoking_status": "int",  # 0-3 (never, formerly, smokes, unknown)
+    "alcohol_consumption": "int",  # 0-3 (never, occasional, moderate, heavy)
+    "physical_activity": "int",  # 0-3 (sedentary, light, moderate, vigorous)
+    "family_history_stroke": "int"  # 1 = yes, 0 = no
+})
+
+_STROKE_FIELD_DESCRIPTIONS = MappingProxyType({
+    "age": "Age in years",
+    "gender": "Gender (1 = Male, 0 = Female)",
+    "hypertension": "Hypertension (1 = Yes, 0 = No)",
+    "heart_disease": "Heart disease (1 = Yes, 0 = No)",
+    "ever_married": "Ever married (1 = Yes, 0 = No)",
+    "work_type": "Work type (0 = Private, 1 = Self-employed, 2 = Government, 3 = Children, 4 = Never worked)",
+    "residence_type": "Residence type (1 = Urban, 0 = Rural)",
+    "avg_glucose_level": "Average glucose level (mg/dL)",
+    "bmi": "Body Mass Index",
+    "smoking_status": "Smoking status (0 = Never smoked, 1 = Formerly smoked, 2 = Smokes, 3 = Unknown)",
+    "alcohol_consumption": "Alcohol consumption (0 = Never, 1 = Occasional, 2 = Moderate, 3 = Heavy)",
+    "physical_activity": "Physical activity level (0 = Sedentary, 1 = Light, 2 = Moderate, 3 = Vigorous)",
+    "family_history_stroke": "Family history of stroke (1 = Yes, 0 = No)"
+})
+
+_CANCER_REQUIRED_FIELDS = MappingProxyType({
+    "age": "int",
+    "gender": "int",  # 1 = male, 0 = female
+    "cancer_type": "int",  # 0 = breast, 1 = lung, 2 = prostate, 3 = skin, 4 = cervical
+    "family_history": "int",  # 1 = yes, 0 = no
+    "smoking_history": "int",  # 0-3 (never, light, moderate, heavy)
+    "alcohol_consumption": "int",  # 0-3
+    "bmi": "float",
+    "physical_activity": "int",  # 0-3
+    "diet_quality": "int",  # 0-3 (poor, fair, good, excellent)
+    "sun_exposure": "int",  # 0-3 (minimal, moderate, high, extreme)
+    "occupational_exposure": "int",  # 1 = yes, 0 = no
+    "hormonal_factors": "int",  # 1 = yes, 0 = no (for breast/cervical)
+    "previous_cancer": "int"  # 1 = yes, 0 = no
+})
+
+_CANCER_FIELD_DESCRIPTIONS = MappingProxyType({
+    "age": "Age in years",
+    "gender": "Gender (1 = Male, 0 = Female)",
+    "cancer_type": "Cancer type to assess (0 = Breast, 1 = Lung, 2 = Prostate, 3 = Skin, 4 = Cervical)",
+    "family_history": "Family history of cancer (1 = Yes, 0 = No)",
+    "smoking_history": "Smoking history (0 = Never, 1 = Light, 2 = Moderate, 3 = Heavy)",
+    "alcohol_consumption": "Alcohol consumption (0 = Never, 1 = Light, 2 = Moderate, 3 = Heavy)",
+    "bmi": "Body Mass Index",
+    "physical_activity": "Physical activity level (0 = Sedentary, 1 = Light, 2 = Moderate, 3 = Vigorous)",
+    "diet_quality": "Diet quality (0 = Poor, 1 = Fair, 2 = Good, 3 = Excellent)",
+    "sun_exposure": "Sun exposure level (0 = Minimal, 1 = Moderate, 2 = High, 3 = Extreme)",
+    "occupational_exposure": "Occupational exposure to carcinogens (1 = Yes, 0 = No)",
+    "hormonal_factors": "Hormonal factors (relevant for breast/cervical cancer) (1 = Yes, 0 = No)",
+    "previous_cancer": "Previous cancer diagnosis (1 = Yes, 0 = No)"
+})
+
+_KIDNEY_REQUIRED_FIELDS = MappingProxyType({
+    "age": "int",
+    "blood_pressure": "float",
+    "specific_gravity": "float",
+    "albumin": "int",  # 0-5
+    "sugar": "int",  # 0-5
+    "red_blood_cells": "int",  # 1 = normal, 0 = abnormal
+    "pus_cell": "int",  # 1 = normal, 0 = abnormal
+    "pus_cell_clumps": "int",  # 1 = present, 0 = not present
+    "bacteria": "int",  # 1 = present, 0 = not present
+    "blood_glucose_random": "float",
+    "blood_urea": "float",
+    "serum_creatinine": "float",
+    "sodium": "float",
+    "potassium": "float",
+    "hemoglobin": "float",
+    "packed_cell_volume": "float",
+    "white_blood_cell_count": "float",
+    "red_blood_cell_count": "float",
+    "hypertension": "int",  # 1 = yes, 0 = no
+    "diabetes_mellitus": "int",  # 1 = yes, 0 = no
+    "coronary_artery_disease": "int",  # 1 = yes, 0 = no
+    "appetite": "int",  # 1 = good, 0 = poor
+    "pedal_edema": "int",  # 1 = yes, 0 = no
+    "anemia": "int"  # 1 = yes, 0 = no
+})
+
+_KIDNEY_FIELD_DESCRIPTIONS = MappingProxyType({
+    "age": "Age in years",
+    "blood_pressure": "Blood pressure (mm Hg)",
+    "specific_gravity": "Specific gravity of urine",
+    "albumin": "Albumin level (0-5 scale)",
+    "sugar": "Sugar level (0-5 scale)",
+    "red_blood_cells": "Red blood cells in urine (1 = Normal, 0 = Abnormal)",
+    "pus_cell": "Pus cells in urine (1 = Normal, 0 = Abnormal)",
+    "pus_cell_clumps": "Pus cell clumps (1 = Present, 0 = Not present)",
+    "bacteria": "Bacteria in urine (1 = Present, 0 = Not present)",
+    "blood_glucose_random": "Random blood glucose (mg/dL)",
+    "blood_urea": "Blood urea (mg/dL)",
+    "serum_creatinine": "Serum creatinine (mg/dL)",
+    "sodium": "Sodium level (mEq/L)",
+    "potassium": "Potassium level (mEq/L)",
+    "hemoglobin": "Hemoglobin (g/dL)",
+    "packed_cell_volume": "Packed cell volume (%)",
+    "white_blood_cell_count": "White blood cell count (cells/cumm)",
+    "red_blood_cell_count": "Red blood cell count (millions/cmm)",
+    "hypertension": "Hypertension (1 = Yes, 0 = No)",
+    "diabetes_mellitus": "Diabetes mellitus (1 = Yes, 0 = No)",
+    "coronary_artery_disease": "Coronary artery disease (1 = Yes, 0 = No)",
+    "appetite": "Appetite (1 = Good, 0 = Poor)",
+    "pedal_edema": "Pedal edema (1 = Yes, 0 = No)",
+    "anemia": "Anemia (1 = Yes, 0 = No)"
+})
+
+_LIVER_REQUIRED_FIELDS = MappingProxyType({
+    "age": "int",
+    "gender": "int",  # 1 = male, 0 = female
+    "total_bilirubin": "float",
+    "direct_bilirubin": "float",
+    "alkaline_phosphotase": "float",
+    "alamine_aminotransferase": "float",
+    "aspartate_aminotransferase": "float",
+    "total_proteins": "float",
+    "albumin": "float",
+    "albumin_globulin_ratio": "float",
+    "alcohol_consumption": "int",  # 0-3
+    "smoking": "int",  # 1 = yes, 0 = no
+    "bmi": "float",
+    "diabetes": "int",  # 1 = yes, 0 = no
+    "family_history": "int"  # 1 = yes, 0 = no
+})
+
+_LIVER_FIELD_DESCRIPTIONS = MappingProxyType({
+    "age": "Age in years",
+    "gender": "Gender (1 = Male, 0 = Female)",
+    "total_bilirubin": "Total bilirubin (mg/dL)",
+    "direct_bilirubin": "Direct bilirubin (mg/dL)",
+    "alkaline_phosphotase": "Alkaline phosphatase (IU/L)",
+    "alamine_aminotransferase": "Alanine aminotransferase (IU/L)",
+    "aspartate_aminotransferase": "Aspartate aminotransferase (IU/L)",
+    "total_proteins": "Total proteins (g/dL)",
+    "albumin": "Albumin (g/dL)",
+    "albumin_globulin_ratio": "Albumin/Globulin ratio",
+    "alcohol_consumption": "Alcohol consumption (0 = Never, 1 = Light, 2 = Moderate, 3 = Heavy)",
+    "smoking": "Smoking status (1 = Yes, 0 = No)",
+    "bmi": "Body Mass Index",
+    "diabetes": "Diabetes (1 = Yes, 0 = No)",
+    "family_history": "Family history of liver disease (1 = Yes, 0 = No)"
+})
+
+_ALZHEIMER_REQUIRED_FIELDS = MappingProxyType({
+    "age": "int",
+    "gender": "int",  # 1 = male, 0 = female
+    "education_years": "int",
+    "mmse_score": "int",  # Mini-Mental State Examination (0-30)
+    "memory_complaints": "int",  # 1 = yes, 0 = no
+    "functional_assessment": "int",  # 0-10 scale
+    "depression_score": "int",  # 0-15 scale
+    "anxiety_level": "int",  # 0-10 scale
+    "sleep_quality": "int",  # 0-10 scale
+    "social_isolation": "int",  # 0-10 scale
+    "physical_activity": "int",  # 0-3
+    "family_history_dementia": "int",  # 1 = yes, 0 = no
+    "cardiovascular_disease": "int",  # 1 = yes, 0 = no
+    "diabetes": "int",  # 1 = yes, 0 = no
+    "hypertension": "int",  # 1 = yes, 0 = no
+    "smoking_history": "int",  # 0-3
+    "alcohol_consumption": "int"  # 0-3
+})
+
+_ALZHEIMER_FIELD_DESCRIPTIONS = MappingProxyType({
+    "age": "Age in years",
+    "gender": "Gender (1 = Male, 0 = Female)",
+    "education_years": "Years of education",
+    "mmse_score": "Mini-Mental State Examination score (0-30, higher is better)",
+    "memory_complaints": "Subjective memory complaints (1 = Yes, 0 = No)",
+    "functional_assessment": "Functional assessment score (0-10, higher is better)",
+    "depression_score": "Depression assessment score (0-15, higher indicates more depression)",
+    "anxiety_level": "Anxiety level (0-10, higher indicates more anxiety)",
+    "sleep_quality": "Sleep quality (0-10, higher is better)",
+    "social_isolation": "Social isolation level (0-10, higher indicates more isolation)",
+    "physical_activity": "Physical activity level (0 = Sedentary, 1 = Light, 2 = Moderate, 3 = Vigorous)",
+    "family_history_dementia": "Family history of dementia (1 = Yes, 0 = No)",
+    "cardiovascular_disease": "Cardiovascular disease (1 = Yes, 0 = No)",
+    "diabetes": "Diabetes (1 = Yes, 0 = No)",
+    "hypertension": "Hypertension (1 = Yes, 0 = No)",
+    "smoking_history": "Smoking history (0 = Never, 1 = Light, 2 = Moderate, 3 = Heavy)",
+    "alcohol_consumption": "Alcohol consumption (0 = Never, 1 = Light, 2 = Moderate, 3 = Heavy)"
+})
+
+_PARKINSON_REQUIRED_FIELDS = MappingProxyType({
+    "age": "int",
+    "gender": "int",  # 1 = male, 0 = female
+    "mdvp_fo": "float",  # Average vocal fundamental frequency
+    "mdvp_fhi": "float",  # Maximum vocal fundamental frequency
+    "mdvp_flo": "float",  # Minimum vocal fundamental frequency
+    "mdvp_jitter_percent": "float",  # Jitter percentage
+    "mdvp_jitter_abs": "float",  # Absolute jitter
+    "mdvp_rap": "float",  # Relative amplitude perturbation
+    "mdvp_ppq": "float",  # Pitch period perturbation quotient
+    "jitter_ddp": "float",  # Jitter DDP
+    "mdvp_shimmer": "float",  # Shimmer
+    "mdvp_shimmer_db": "float",  # Shimmer in dB
+    "shimmer_apq3": "float",  # Shimmer APQ3
+    "shimmer_apq5": "float",  # Shimmer APQ5
+    "mdvp_apq": "float",  # Amplitude perturbation quotient
+    "shimmer_dda": "float",  # Shimmer DDA
+    "nhr": "float",  # Noise-to-harmonics ratio
+    "hnr": "float",  # Harmonics-to-noise ratio
+    "rpde": "float",  # Recurrence period density entropy
+    "dfa": "float",  # Detrended fluctuation analysis
+    "spread1": "float",  # Nonlinear measure of fundamental frequency variation
+    "spread2": "float",  # Nonlinear measure of fundamental frequency variation
+    "d2": "float",  # Correlation dimension
+    "ppe": "float",  # Pitch period entropy
+    "tremor_severity": "int",  # 0-4 scale
+    "rigidity_score": "int",  # 0-4 scale
+    "bradykinesia_score": "int",  # 0-4 scale
+    "postural_instability": "int",  # 0-4 scale
+    "family_history": "int"  # 1 = yes, 0 = no
+})
+
+_PARKINSON_FIELD_DESCRIPTIONS = MappingProxyType({
+    "age": "Age in years",
+    "gender": "Gender (1 = Male, 0 = Female)",
+    "mdvp_fo": "Average vocal fundamental frequency (Hz)",
+    "mdvp_fhi": "Maximum vocal fundamental frequency (Hz)",
+    "mdvp_flo": "Minimum vocal fundamental frequency (Hz)",
+    "mdvp_jitter_percent": "Jitter percentage (%)",
+    "mdvp_jitter_abs": "Absolute jitter (ms)",
+    "mdvp_rap": "Relative amplitude perturbation",
+    "mdvp_ppq": "Pitch period perturbation quotient",
+    "jitter_ddp": "Jitter DDP",
+    "mdvp_shimmer": "Shimmer",
+    "mdvp_shimmer_db": "Shimmer in dB",
+    "shimmer_apq3": "Shimmer APQ3",
+    "shimmer_apq5": "Shimmer APQ5",
+    "mdvp_apq": "Amplitude perturbation quotient",
+    "shimmer_dda": "Shimmer DDA",
+    "nhr": "Noise-to-harmonics ratio",
+    "hnr": "Harmonics-to-noise ratio",
+    "rpde": "Recurrence period density entropy",
+    "dfa": "Detrended fluctuation analysis",
+    "spread1": "Nonlinear measure of fundamental frequency variation",
+    "spread2": "Nonlinear measure of fundamental frequency variation",
+    "d2": "Correlation dimension",
+    "ppe": "Pitch period entropy",
+    "tremor_severity": "Tremor severity (0 = None, 1 = Slight, 2 = Mild, 3 = Moderate, 4 = Severe)",
+    "rigidity_score": "Rigidity score (0 = None, 1 = Slight, 2 = Mild, 3 = Moderate, 4 = Severe)",
+    "bradykinesia_score": "Bradykinesia score (0 = None, 1 = Slight, 2 = Mild, 3 = Moderate, 4 = Severe)",
+    "postural_instability": "Postural instability (0 = None, 1 = Slight, 2 = Mild, 3 = Moderate, 4 = Severe)",
+    "family_history": "Family history of Parkinson's (1 = Yes, 0 = No)"
+})
+
+# Analysis labels banded by ascending bounds: `x < bound` chains index them with bisect_right and
+# `x > bound` chains with bisect_left, so a value on a bound or NaN lands where the if/elif chain put it
+_BMI_BOUNDS = (18.5, 25, 30)
+_MILD_TO_SEVERE = ("mild", "moderate", "severe")
+_SEVERE_TO_MILD = ("severe", "moderate", "mild")
+
 class HeartDiseasePredictor(BasePredictor):
     """Predicts risk of heart disease including heart attack, arrhythmia, and heart failure"""
     
+    # Model features in schema order, each divided by its scale to land near [0, 1]; flags use 1.0
+    _FEATURE_FIELDS = tuple(_HEART_REQUIRED_FIELDS)
+    _FEATURE_GETTER = itemgetter(*_FEATURE_FIELDS)
+    _FEATURE_SCALES = np.array([100.0, 1.0, 3.0, 200.0, 400.0, 1.0, 2.0, 220.0, 1.0, 5.0, 2.0, 1.0, 1.0])
+    
     def __init__(self):
         super().__init__(
             name="Heart Disease Risk Predictor",
             description="Predicts risk of heart attack, arrhythmia, or heart failure based on clinical and lifestyle factors"
         )
     
-    def get_required_fields(self) -> Dict[str, str]:
-        return {
-            "age": "int",
-            "sex": "int",  # 1 = male, 0 = female
-            "chest_pain_type": "int",  # 0-3
-            "resting_bp": "float",  # resting blood pressure
-            "cholesterol": "float",  # serum cholesterol mg/dl
-            "fasting_blood_sugar": "int",  # > 120 mg/dl (1 = true, 0 = false)
-            "resting_ecg": "int",  # 0-2
-            "max_heart_rate": "float",
-            "exercise_angina": "int",  # 1 = yes, 0 = no
-            "st_depression": "float",
-            "st_slope": "int",  # 0-2
-            "smoking": "int",  # 1 = yes, 0 = no
-            "family_history": "int"  # 1 = yes, 0 = no
-        }
+    def get_required_fields(self) -> Mapping[str, str]:
+        return _HEART_REQUIRED_FIELDS
     
-    def get_field_descriptions(self) -> Dict[str, str]:
-        return {
-            "age": "Age in years",
-            "sex": "Sex (1 = Male, 0 = Female)",
-            "chest_pain_type": "Chest pain type (0 = Typical angina, 1 = Atypical angina, 2 = Non-anginal pain, 3 = Asymptomatic)",
-            "resting_bp": "Resting blood pressure (mm Hg)",
-            "cholesterol": "Serum cholesterol (mg/dl)",
-            "fasting_blood_sugar": "Fasting blood sugar > 120 mg/dl (1 = Yes, 0 = No)",
-            "resting_ecg": "Resting ECG results (0 = Normal, 1 = ST-T wave abnormality, 2 = Left ventricular hypertrophy)",
-            "max_heart_rate": "Maximum heart rate achieved",
-            "exercise_angina": "Exercise induced angina (1 = Yes, 0 = No)",
-            "st_depression": "ST depression induced by exercise relative to rest",
-            "st_slope": "Slope of peak exercise ST segment (0 = Upsloping, 1 = Flat, 2 = Downsloping)",
-            "smoking": "Smoking status (1 = Yes, 0 = No)",
-            "family_history": "Family history of heart disease (1 = Yes, 0 = No)"
-        }
+    def get_field_descriptions(self) -> Mapping[str, str]:
+        return _HEART_FIELD_DESCRIPTIONS
     
     def preprocess_data(self, data: Dict[str, Any]) -> np.ndarray:
-        features = [
-            data["age"] / 100.0,  # Normalize age
-            data["sex"],
-            data["chest_pain_type"] / 3.0,
-            data["resting_bp"] / 200.0,  # Normalize BP
-            data["cholesterol"] / 400.0,  # Normalize cholesterol
-            data["fasting_blood_sugar"],
-            data["resting_ecg"] / 2.0,
-            data["max_heart_rate"] / 220.0,  # Normalize heart rate
-            data["exercise_angina"],
-            data["st_depression"] / 5.0,
-            data["st_slope"] / 2.0,
-            data["smoking"],
-            data["family_history"]
-        ]
-        return np.array(features)
+        return self._fill_scaled_row(data, self._FEATURE_GETTER, self._FEATURE_SCALES)
+
+
+# DiabetesPredictor.predict() inputs in the order it unpacks them, with the value each takes when absent
+_DIABETES_INPUT_DEFAULTS = MappingProxyType({
+    "age": 30,
+    "bmi": 25,
+    "glucose_level": 100,
+    "blood_pressure": 80,
+    "insulin_level": 80,
+    "pregnancies": 0,
+    "skin_thickness": 20,
+    "diabetes_pedigree_function": 0.5,
+    "family_history_diabetes": False,
+    "physical_activity": 3  # hours per week
+})
+_DIABETES_INPUT_GETTER = itemgetter(*_DIABETES_INPUT_DEFAULTS)
+_DIABETES_INPUT_INDEX = {field: i for i, field in enumerate(_DIABETES_INPUT_DEFAULTS)}
+
+# Recommendation rules in report order: (input position, test, recommendation)
+_DIABETES_RECOMMENDATION_RULES = tuple(
+    (_DIABETES_INPUT_INDEX[field], test, recommendation) for field, test, recommendation in (
+        ("glucose_level", partial(le, 100), "Monitor blood glucose levels regularly"),
+        ("bmi", partial(le, 25), "Maintain healthy weight through diet and exercise"),
+        ("physical_activity", partial(gt, 3), "Increase physical activity to at least 150 minutes per week"),
+        ("family_history_diabetes", bool, "Regular screening due to family history")
+    )
+)
+
+# Given to every diabetes prediction after the rule-based recommendations
+_DIABETES_GENERAL_RECOMMENDATIONS = (
+    "Follow a balanced, low-sugar diet",
+    "Regular medical check-ups",
+    "Stress management and adequate sleep"
+)
 
+# Risk factor rules in report order: (field, test, risk factor), with a missing field read as 0
+_DIABETES_RISK_FACTOR_RULES = (
+    ("age", partial(le, 45), "Age over 45"),
+    ("bmi", partial(le, 25), "Overweight or obesity"),
+    ("glucose_level", partial(le, 100), "Elevated glucose levels"),
+    ("family_history_diabetes", bool, "Family history of diabetes"),
+    ("physical_activity", partial(gt, 3), "Sedentary lifestyle"),
+    ("blood_pressure", partial(le, 90), "High blood pressure")
+)
 
 class DiabetesPredictor(BasePredictor):
     """Predicts Type 2 diabetes risk using clinical and lifestyle factors"""
@@ -82,16 +416,9 @@ class DiabetesPredictor(BasePredictor):
         """Predict diabetes risk"""
         try:
             # Extract features
-            age = data.get('age', 30)
-            bmi = data.get('bmi', 25)
-            glucose = data.get('glucose_level', 100)
-            blood_pressure = data.get('blood_pressure', 80)
-            insulin = data.get('insulin_level', 80)
-            pregnancies = data.get('pregnancies', 0)
-            skin_thickness = data.get('skin_thickness', 20)
-            diabetes_pedigree = data.get('diabetes_pedigree_function', 0.5)
-            family_history = data.get('family_history_diabetes', False)
-            physical_activity = data.get('physical_activity', 3)  # hours per week
+            inputs = self._read_inputs(data)
+            (age, bmi, glucose, blood_pressure, insulin, pregnancies, skin_thickness, diabetes_pedigree,
+             family_history, physical_activity) = inputs
             
             # Calculate risk score based on clinical factors
             risk_score = 0.0
@@ -151,21 +478,11 @@ class DiabetesPredictor(BasePredictor):
                 risk_level = "Low"
             
             # Generate recommendations
-            recommendations = []
-            if glucose >= 100:
-                recommendations.append("Monitor blood glucose levels regularly")
-            if bmi >= 25:
-                recommendations.append("Maintain healthy weight through diet and exercise")
-            if physical_activity < 3:
-                recommendations.append("Increase physical activity to at least 150 minutes per week")
-            if family_history:
-                recommendations.append("Regular screening due to family history")
+            recommendations = [
+                recommendation for i, test, recommendation in _DIABETES_RECOMMENDATION_RULES if test(inputs[i])
+            ]
             
-            recommendations.extend([
-                "Follow a balanced, low-sugar diet",
-                "Regular medical check-ups",
-                "Stress management and adequate sleep"
-            ])
+            recommendations.extend(_DIABETES_GENERAL_RECOMMENDATIONS)
             
             return {
                 "risk_score": round(risk_score, 3),
@@ -185,56 +502,26 @@ class DiabetesPredictor(BasePredictor):
                 "confidence": 0.0
             }
     
+    @staticmethod
+    def _read_inputs(data: Dict[str, Any]) -> tuple:
+        """predict()'s inputs in _DIABETES_INPUT_DEFAULTS order, with defaults for absent fields"""
+        try:
+            # Validated input holds every field, so one itemgetter call reads them all
+            return _DIABETES_INPUT_GETTER(data)
+        except KeyError:
+            return tuple(data.get(field, default) for field, default in _DIABETES_INPUT_DEFAULTS.items())
+    
     def _identify_risk_factors(self, data: Dict[str, Any]) -> List[str]:
         """Identify specific risk factors present"""
-        risk_factors = []
-        
-        if data.get('age', 0) >= 45:
-            risk_factors.append("Age over 45")
-        if data.get('bmi', 0) >= 25:
-            risk_factors.append("Overweight or obesity")
-        if data.get('glucose_level', 0) >= 100:
-            risk_factors.append("Elevated glucose levels")
-        if data.get('family_history_diabetes', False):
-            risk_factors.append("Family history of diabetes")
-        if data.get('physical_activity', 0) < 3:
-            risk_factors.append("Sedentary lifestyle")
-        if data.get('blood_pressure', 0) >= 90:
-            risk_factors.append("High blood pressure")
-        
-        return risk_factors
-    
-    def get_required_fields(self) -> Dict[str, str]:
+        return [factor for field, test, factor in _DIABETES_RISK_FACTOR_RULES if test(data.get(field, 0))]
+    
+    def get_required_fields(self) -> Mapping[str, str]:
         """Return dictionary of required input fields and their types"""
-        return {
-            "age": "int",
-            "gender": "str",
-            "bmi": "float",
-            "glucose_level": "float",
-            "blood_pressure": "float",
-            "insulin_level": "float",
-            "family_history_diabetes": "str",
-            "physical_activity": "float",
-            "pregnancies": "int",
-            "skin_thickness": "float",
-            "diabetes_pedigree_function": "float"
-        }
+        return _DIABETES_REQUIRED_FIELDS
     
-    def get_field_descriptions(self) -> Dict[str, str]:
+    def get_field_descriptions(self) -> Mapping[str, str]:
         """Return descriptions for input fields"""
-        return {
-            "age": "Age in years",
-            "gender": "Gender (Male/Female)",
-            "bmi": "Body Mass Index (kg/m²)",
-            "glucose_level": "Fasting blood glucose level (mg/dL)",
-            "blood_pressure": "Diastolic blood pressure (mmHg)",
-            "insulin_level": "Serum insulin level (μU/mL)",
-            "family_history_diabetes": "Family history of diabetes (Yes/No)",
-            "physical_activity": "Physical activity hours per week",
-            "pregnancies": "Number of pregnancies (for women)",
-            "skin_thickness": "Triceps skin fold thickness (mm)",
-            "diabetes_pedigree_function": "Diabetes pedigree function (0.0-2.5)"
-        }
+        return _DIABETES_FIELD_DESCRIPTIONS
     
     def _prepare_features(self, data: Dict[str, Any]) -> np.ndarray:
         """Prepare features for model prediction"""
@@ -972,20 +1259,23 @@ class DiabetesPredictor(BasePredictor):
     def identify_contributing_factors(self, data: Dict[str, Any]) -> List[str]:
         """Identify key contributing factors for heart disease"""
         factors = []
+        age = data.get('age', 0)
+        cholesterol = data.get('cholesterol', 0)
+        resting_bp = data.get('resting_bp', 0)
         
-        if data.get('age', 0) > 65:
+        if age > 65:
             factors.append("Advanced age (>65 years) significantly increases cardiovascular risk")
-        elif data.get('age', 0) > 45:
+        elif age > 45:
             factors.append("Middle age (45-65 years) is a moderate risk factor")
             
-        if data.get('cholesterol', 0) > 240:
+        if cholesterol > 240:
             factors.append("High cholesterol levels (>240 mg/dL) contribute to arterial plaque buildup")
-        elif data.get('cholesterol', 0) > 200:
+        elif cholesterol > 200:
             factors.append("Borderline high cholesterol (200-240 mg/dL) requires monitoring")
             
-        if data.get('resting_bp', 0) > 140:
+        if resting_bp > 140:
             factors.append("High blood pressure (>140 mmHg) strains the cardiovascular system")
-        elif data.get('resting_bp', 0) > 120:
+        elif resting_bp > 120:
             factors.append("Elevated blood pressure (120-140 mmHg) indicates prehypertension")
             
         if data.get('max_heart_rate', 220) < (220 - data.get('age', 50)) * 0.7:
@@ -1152,101 +1442,171 @@ class DiabetesPredictor(BasePredictor):
             "colors": ["#ef4444", "#f97316", "#eab308", "#84cc16", "#22c55e"]
         }
 
+# Stroke metric labels keyed by the coded input; values outside the codes fall back to the last branch
+_STROKE_SMOKING_LABELS = MappingProxyType({
+    0: "Never smoked (protective factor)",
+    1: "Former smoker (risk decreases over time)",
+    2: "Current smoker (major modifiable risk factor)"
+})
+_STROKE_ACTIVITY_LABELS = MappingProxyType({
+    0: "Sedentary (significant stroke risk)",
+    1: "Light activity (some protective benefit)",
+    2: "Moderate activity (good stroke protection)"
+})
+_STROKE_GLUCOSE_BOUNDS = (100, 126)
+_STROKE_GLUCOSE_LABELS = (
+    "Normal (optimal metabolic health)",
+    "Prediabetic range (increased stroke risk)",
+    "Diabetic range (significant stroke risk factor)"
+)
+_STROKE_BMI_LABELS = (
+    "Underweight (may indicate other health issues)",
+    "Normal weight (optimal for stroke prevention)",
+    "Overweight (moderate stroke risk increase)",
+    "Obese (significant stroke risk factor)"
+)
+
+def _stroke_factor_recommendation(factor: str) -> str:
+    """Recommendation for a stroke risk factor, matched on keywords in its description"""
+    factor_name = factor.lower()
+    
+    if 'hypertension' in factor_name or 'blood pressure' in factor_name:
+        return "Monitor blood pressure daily, take medications as prescribed, reduce sodium intake"
+    elif 'glucose' in factor_name or 'diabetes' in factor_name:
+        return "Maintain HbA1c <7%, monitor blood sugar regularly, follow diabetic diet"
+    elif 'smoking' in factor_name:
+        return "Quit smoking immediately - use nicotine replacement, counseling, or prescription aids"
+    elif 'bmi' in factor_name or 'weight' in factor_name:
+        return "Achieve healthy weight through caloric restriction and increased physical activity"
+    elif 'physical activity' in factor_name or 'exercise' in factor_name:
+        return "Engage in 150 minutes moderate aerobic activity weekly plus strength training"
+    elif 'alcohol' in factor_name:
+        return "Limit alcohol to 1 drink daily for women, 2 for men; consider complete abstinence"
+    elif 'heart disease' in factor_name:
+        return "Optimize cardiac medications, consider anticoagulation if indicated by cardiologist"
+    elif 'age' in factor_name:
+        return "Focus on aggressive management of all modifiable risk factors"
+    else:
+        return "Discuss this risk factor with your healthcare provider for personalized management"
+
+# Risk factors are reported by field description, so each description's recommendation is matched once here
+_STROKE_FACTOR_RECOMMENDATIONS = MappingProxyType({
+    description: _stroke_factor_recommendation(description) for description in _STROKE_FIELD_DESCRIPTIONS.values()
+})
+
+# explain_field_risk() texts per field, with {value} filled in from the input
+_STROKE_EXPLANATIONS = MappingProxyType({
+    'age': "Age {value} years - stroke risk doubles every decade after age 55",
+    'hypertension': "Hypertension damages blood vessels and is the #1 modifiable stroke risk factor",
+    'heart_disease': "Heart disease increases stroke risk through embolic events and shared risk factors",
+    'avg_glucose_level': "Glucose {value} mg/dL - diabetes increases stroke risk 2-4 times through vascular damage",
+    'bmi': "BMI {value} - excess weight contributes to hypertension, diabetes, and direct vascular effects",
+    'smoking_status': "Smoking accelerates atherosclerosis and increases blood clotting tendency",
+    'alcohol_consumption': "Heavy alcohol use increases hemorrhagic stroke risk and blood pressure",
+    'physical_activity': "Sedentary lifestyle contributes to multiple stroke risk factors",
+    'family_history_stroke': "Genetic factors account for 40% of stroke risk through inherited predisposition",
+    'gender': "Gender influences stroke risk patterns and hormone-related factors"
+})
+
+# Weight of each field's deviation in its stroke risk contribution; other fields weigh 0.5
+_STROKE_RISK_WEIGHTS = MappingProxyType({
+    'age': 0.9,
+    'hypertension': 0.95,
+    'heart_disease': 0.8,
+    'avg_glucose_level': 0.7,
+    'bmi': 0.6,
+    'smoking_status': 0.85,
+    'alcohol_consumption': 0.5,
+    'physical_activity': 0.6,
+    'family_history_stroke': 0.7,
+    'gender': 0.4,
+    'ever_married': 0.2,
+    'work_type': 0.3,
+    'residence_type': 0.1
+})
+
 class StrokeRiskPredictor(BasePredictor):
     """Predicts stroke risk based on blood pressure, cholesterol, lifestyle, and family history"""
     
+    # Model features in schema order, each divided by its scale to land near [0, 1]; flags use 1.0
+    _FEATURE_FIELDS = tuple(_STROKE_REQUIRED_FIELDS)
+    _FEATURE_GETTER = itemgetter(*_FEATURE_FIELDS)
+    _FEATURE_SCALES = np.array([100.0, 1.0, 1.0, 1.0, 1.0, 4.0, 1.0, 300.0, 50.0, 3.0, 3.0, 3.0, 1.0])
+    
     def __init__(self):
         super().__init__(
             name="Stroke Risk Predictor",
             description="Analyzes blood pressure, cholesterol, lifestyle, and family history to predict stroke risk"
         )
     
-    def get_required_fields(self) -> Dict[str, str]:
-        return {
-            "age": "int",
-            "gender": "int",  # 1 = male, 0 = female
-            "hypertension": "int",  # 1 = yes, 0 = no
-            "heart_disease": "int",  # 1 = yes, 0 = no
-            "ever_married": "int",  # 1 = yes, 0 = no
-            "work_type": "int",  # 0-4 (private, self-employed, govt, children, never worked)
-            "residence_type": "int",  # 1 = urban, 0 = rural
-            "avg_glucose_level": "float",
-            "bmi": "float",
-            "smoking_status": "int",  # 0-3 (never, formerly, smokes, unknown)
-            "alcohol_consumption": "int",  # 0-3 (never, occasional, moderate, heavy)
-            "physical_activity": "int",  # 0-3 (sedentary, light, moderate, vigorous)
-            "family_history_stroke": "int"  # 1 = yes, 0 = no
-        }
+    def get_required_fields(self) -> Mapping[str, str]:
+        return _STROKE_REQUIRED_FIELDS
     
-    def get_field_descriptions(self) -> Dict[str, str]:
-        return {
-            "age": "Age in years",
-            "gender": "Gender (1 = Male, 0 = Female)",
-            "hypertension": "Hypertension (1 = Yes, 0 = No)",
-            "heart_disease": "Heart disease (1 = Yes, 0 = No)",
-            "ever_married": "Ever married (1 = Yes, 0 = No)",
-            "work_type": "Work type (0 = Private, 1 = Self-employed, 2 = Government, 3 = Children, 4 = Never worked)",
-            "residence_type": "Residence type (1 = Urban, 0 = Rural)",
-            "avg_glucose_level": "Average glucose level (mg/dL)",
-            "bmi": "Body Mass Index",
-            "smoking_status": "Smoking status (0 = Never smoked, 1 = Formerly smoked, 2 = Smokes, 3 = Unknown)",
-            "alcohol_consumption": "Alcohol consumption (0 = Never, 1 = Occasional, 2 = Moderate, 3 = Heavy)",
-            "physical_activity": "Physical activity level (0 = Sedentary, 1 = Light, 2 = Moderate, 3 = Vigorous)",
-            "family_history_stroke": "Family history of stroke (1 = Yes, 0 = No)"
-        }
+    def get_field_descriptions(self) -> Mapping[str, str]:
+        return _STROKE_FIELD_DESCRIPTIONS
     
     def preprocess_data(self, data: Dict[str, Any]) -> np.ndarray:
-        features = [
-            data["age"] / 100.0,
-            data["gender"],
-            data["hypertension"],
-            data["heart_disease"],
-            data["ever_married"],
-            data["work_type"] / 4.0,
-            data["residence_type"],
-            data["avg_glucose_level"] / 300.0,
-            data["bmi"] / 50.0,
-            data["smoking_status"] / 3.0,
-            data["alcohol_consumption"] / 3.0,
-            data["physical_activity"] / 3.0,
-            data["family_history_stroke"]
-        ]
-        return np.array(features)
+        return self._fill_scaled_row(data, self._FEATURE_GETTER, self._FEATURE_SCALES)
     
     def identify_contributing_factors(self, data: Dict[str, Any]) -> List[str]:
         """Identify key contributing factors for stroke risk"""
+        return self._contributing_factors(data, *self._shared_fields(data))
+    
+    def analyze_health_metrics(self, data: Dict[str, Any]) -> Dict[str, str]:
+        """Analyze stroke-related health metrics"""
+        return self._health_metrics(*self._shared_fields(data))
+    
+    def analyze_factors_and_metrics(self, data: Dict[str, Any]) -> tuple:
+        """Contributing factors and health metrics from one read of the fields both check"""
+        shared = self._shared_fields(data)
+        return self._contributing_factors(data, *shared), self._health_metrics(*shared)
+    
+    @staticmethod
+    def _shared_fields(data: Dict[str, Any]) -> tuple:
+        """Hypertension, glucose, BMI, smoking status and activity level, each defaulting to 0"""
+        get = data.get
+        return (
+            get('hypertension', 0), get('avg_glucose_level', 0), get('bmi', 0),
+            get('smoking_status', 0), get('physical_activity', 0)
+        )
+    
+    @staticmethod
+    def _contributing_factors(data: Dict[str, Any], hypertension, avg_glucose_level, bmi, smoking_status,
+                              physical_activity) -> List[str]:
+        """Contributing factors, given the shared fields"""
         factors = []
+        age = data.get('age', 0)
         
-        if data.get('age', 0) > 75:
+        if age > 75:
             factors.append("Advanced age (>75 years) significantly increases stroke risk")
-        elif data.get('age', 0) > 55:
+        elif age > 55:
             factors.append("Older age (55-75 years) is a major stroke risk factor")
             
-        if data.get('hypertension', 0) == 1:
+        if hypertension == 1:
             factors.append("Hypertension is the leading modifiable risk factor for stroke")
             
         if data.get('heart_disease', 0) == 1:
             factors.append("Existing heart disease significantly increases stroke risk")
             
-        if data.get('avg_glucose_level', 0) > 140:
+        if avg_glucose_level > 140:
             factors.append("Elevated glucose levels (>140 mg/dL) indicate diabetes risk")
-        elif data.get('avg_glucose_level', 0) > 100:
+        elif avg_glucose_level > 100:
             factors.append("Borderline glucose levels (100-140 mg/dL) require monitoring")
             
-        if data.get('bmi', 0) > 30:
+        if bmi > 30:
             factors.append("Obesity (BMI >30) increases stroke risk through multiple pathways")
-        elif data.get('bmi', 0) > 25:
+        elif bmi > 25:
             factors.append("Overweight status (BMI 25-30) contributes to stroke risk")
             
-        if data.get('smoking_status', 0) == 2:
+        if smoking_status == 2:
             factors.append("Current smoking dramatically increases stroke risk")
-        elif data.get('smoking_status', 0) == 1:
+        elif smoking_status == 1:
             factors.append("Former smoking history still carries residual stroke risk")
             
         if data.get('alcohol_consumption', 0) == 3:
             factors.append("Heavy alcohol consumption increases hemorrhagic stroke risk")
             
-        if data.get('physical_activity', 0) == 0:
+        if physical_activity == 0:
             factors.append("Sedentary lifestyle significantly increases stroke risk")
             
         if data.get('family_history_stroke', 0) == 1:
@@ -1254,57 +1614,28 @@ class StrokeRiskPredictor(BasePredictor):
             
         return factors
     
-    def analyze_health_metrics(self, data: Dict[str, Any]) -> Dict[str, str]:
-        """Analyze stroke-related health metrics"""
+    @staticmethod
+    def _health_metrics(hypertension, glucose, bmi, smoking, activity) -> Dict[str, str]:
+        """Health metrics, given the shared fields"""
         metrics = {}
         
         # Blood Pressure Analysis (inferred from hypertension)
-        if data.get('hypertension', 0) == 1:
+        if hypertension == 1:
             metrics["Blood Pressure"] = "Hypertensive (major stroke risk factor requiring control)"
         else:
             metrics["Blood Pressure"] = "Normal (protective against stroke)"
             
         # Glucose Analysis
-        glucose = data.get('avg_glucose_level', 0)
-        if glucose < 100:
-            metrics["Blood Glucose"] = "Normal (optimal metabolic health)"
-        elif glucose < 126:
-            metrics["Blood Glucose"] = "Prediabetic range (increased stroke risk)"
-        else:
-            metrics["Blood Glucose"] = "Diabetic range (significant stroke risk factor)"
+        metrics["Blood Glucose"] = _STROKE_GLUCOSE_LABELS[bisect_right(_STROKE_GLUCOSE_BOUNDS, glucose)]
             
         # BMI Analysis
-        bmi = data.get('bmi', 0)
-        if bmi < 18.5:
-            metrics["Body Mass Index"] = "Underweight (may indicate other health issues)"
-        elif bmi < 25:
-            metrics["Body Mass Index"] = "Normal weight (optimal for stroke prevention)"
-        elif bmi < 30:
-            metrics["Body Mass Index"] = "Overweight (moderate stroke risk increase)"
-        else:
-            metrics["Body Mass Index"] = "Obese (significant stroke risk factor)"
+        metrics["Body Mass Index"] = _STROKE_BMI_LABELS[bisect_right(_BMI_BOUNDS, bmi)]
             
         # Smoking Status Analysis
-        smoking = data.get('smoking_status', 0)
-        if smoking == 0:
-            metrics["Smoking Status"] = "Never smoked (protective factor)"
-        elif smoking == 1:
-            metrics["Smoking Status"] = "Former smoker (risk decreases over time)"
-        elif smoking == 2:
-            metrics["Smoking Status"] = "Current smoker (major modifiable risk factor)"
-        else:
-            metrics["Smoking Status"] = "Unknown smoking history"
+        metrics["Smoking Status"] = _STROKE_SMOKING_LABELS.get(smoking, "Unknown smoking history")
             
         # Physical Activity Analysis
-        activity = data.get('physical_activity', 0)
-        if activity == 0:
-            metrics["Physical Activity"] = "Sedentary (significant stroke risk)"
-        elif activity == 1:
-            metrics["Physical Activity"] = "Light activity (some protective benefit)"
-        elif activity == 2:
-            metrics["Physical Activity"] = "Moderate activity (good stroke protection)"
-        else:
-            metrics["Physical Activity"] = "Vigorous activity (excellent stroke protection)"
+        metrics["Physical Activity"] = _STROKE_ACTIVITY_LABELS.get(activity, "Vigorous activity (excellent stroke protection)")
             
         return metrics
     
@@ -1334,64 +1665,19 @@ class StrokeRiskPredictor(BasePredictor):
     
     def calculate_field_risk_contribution(self, field_name: str, value: Any, normalized_value: float) -> float:
         """Calculate stroke-specific risk contribution"""
-        risk_weights = {
-            'age': 0.9,
-            'hypertension': 0.95,
-            'heart_disease': 0.8,
-            'avg_glucose_level': 0.7,
-            'bmi': 0.6,
-            'smoking_status': 0.85,
-            'alcohol_consumption': 0.5,
-            'physical_activity': 0.6,
-            'family_history_stroke': 0.7,
-            'gender': 0.4,
-            'ever_married': 0.2,
-            'work_type': 0.3,
-            'residence_type': 0.1
-        }
-        
         base_contribution = abs(normalized_value - 0.5) * 2
-        weight = risk_weights.get(field_name, 0.5)
+        weight = _STROKE_RISK_WEIGHTS.get(field_name, 0.5)
         return base_contribution * weight
     
     def explain_field_risk(self, field_name: str, value: Any) -> str:
         """Explain stroke-specific field risk"""
-        explanations = {
-            'age': f"Age {value} years - stroke risk doubles every decade after age 55",
-            'hypertension': "Hypertension damages blood vessels and is the #1 modifiable stroke risk factor",
-            'heart_disease': "Heart disease increases stroke risk through embolic events and shared risk factors",
-            'avg_glucose_level': f"Glucose {value} mg/dL - diabetes increases stroke risk 2-4 times through vascular damage",
-            'bmi': f"BMI {value} - excess weight contributes to hypertension, diabetes, and direct vascular effects",
-            'smoking_status': "Smoking accelerates atherosclerosis and increases blood clotting tendency",
-            'alcohol_consumption': "Heavy alcohol use increases hemorrhagic stroke risk and blood pressure",
-            'physical_activity': "Sedentary lifestyle contributes to multiple stroke risk factors",
-            'family_history_stroke': "Genetic factors account for 40% of stroke risk through inherited predisposition",
-            'gender': "Gender influences stroke risk patterns and hormone-related factors"
-        }
-        return explanations.get(field_name, f"The value {value} for {field_name} contributes to overall stroke risk assessment.")
+        template = _STROKE_EXPLANATIONS.get(field_name)
+        return template.format(value=value) if template is not None else f"The value {value} for {field_name} contributes to overall stroke risk assessment."
     
     def get_factor_specific_recommendation(self, factor: Dict[str, Any]) -> str:
         """Get stroke-specific recommendations"""
-        factor_name = factor['factor'].lower()
-        
-        if 'hypertension' in factor_name or 'blood pressure' in factor_name:
-            return "Monitor blood pressure daily, take medications as prescribed, reduce sodium intake"
-        elif 'glucose' in factor_name or 'diabetes' in factor_name:
-            return "Maintain HbA1c <7%, monitor blood sugar regularly, follow diabetic diet"
-        elif 'smoking' in factor_name:
-            return "Quit smoking immediately - use nicotine replacement, counseling, or prescription aids"
-        elif 'bmi' in factor_name or 'weight' in factor_name:
-            return "Achieve healthy weight through caloric restriction and increased physical activity"
-        elif 'physical activity' in factor_name or 'exercise' in factor_name:
-            return "Engage in 150 minutes moderate aerobic activity weekly plus strength training"
-        elif 'alcohol' in factor_name:
-            return "Limit alcohol to 1 drink daily for women, 2 for men; consider complete abstinence"
-        elif 'heart disease' in factor_name:
-            return "Optimize cardiac medications, consider anticoagulation if indicated by cardiologist"
-        elif 'age' in factor_name:
-            return "Focus on aggressive management of all modifiable risk factors"
-        else:
-            return "Discuss this risk factor with your healthcare provider for personalized management"
+        recommendation = _STROKE_FACTOR_RECOMMENDATIONS.get(factor['factor'])
+        return recommendation if recommendation is not None else _stroke_factor_recommendation(factor['factor'])
     
     def generate_health_metrics_chart(self, data: Dict[str, Any]) -> Dict[str, Any]:
         """Generate stroke risk specific chart data"""
@@ -1408,104 +1694,120 @@ class StrokeRiskPredictor(BasePredictor):
             "colors": ["#ef4444", "#f97316", "#eab308", "#84cc16", "#22c55e"]
         }
 
+_CANCER_BMI_LABELS = (
+    "Underweight (may indicate underlying health issues)",
+    "Normal weight (optimal for cancer prevention)",
+    "Overweight (moderate cancer risk increase)",
+    "Obese (significant cancer risk factor)"
+)
+
+_CANCER_EXPLANATIONS = MappingProxyType({
+    'age': "Age {value} years - cancer incidence increases exponentially with age due to cellular damage accumulation",
+    'smoking_history': "Smoking level {value} - tobacco contains 70+ carcinogens causing DNA damage in multiple organs",
+    'family_history': "Family history - inherited genetic mutations (BRCA1/2, Lynch syndrome) significantly increase risk",
+    'bmi': "BMI {value} - obesity promotes inflammation, hormone imbalances, and insulin resistance",
+    'occupational_exposure': "Occupational exposure - workplace carcinogens cause cumulative DNA damage",
+    'sun_exposure': "Sun exposure level {value} - UV radiation causes skin DNA damage leading to melanoma",
+    'alcohol_consumption': "Alcohol level {value} - ethanol metabolites damage DNA and impair immune surveillance",
+    'previous_cancer': "Previous cancer - indicates genetic susceptibility and treatment-related secondary cancer risk",
+    'hormonal_factors': "Hormonal factors - estrogen exposure increases breast and endometrial cancer risk"
+})
+
+# Inputs the cancer analyses read, with the value each takes when absent
+_CANCER_ANALYSIS_DEFAULTS = MappingProxyType({
+    'age': 0, 'smoking_history': 0, 'family_history': 0, 'bmi': 25, 'occupational_exposure': 0,
+    'sun_exposure': 0, 'previous_cancer': 0, 'physical_activity': 0, 'diet_quality': 0
+})
+_CANCER_ANALYSIS_GETTER = itemgetter(*_CANCER_ANALYSIS_DEFAULTS)
+
+# Weight of each field's deviation in its cancer risk contribution; other fields weigh 0.5
+_CANCER_RISK_WEIGHTS = MappingProxyType({
+    'age': 0.9,
+    'family_history': 0.8,
+    'smoking_history': 0.85,
+    'previous_cancer': 0.9,
+    'occupational_exposure': 0.7,
+    'bmi': 0.6,
+    'sun_exposure': 0.7,
+    'alcohol_consumption': 0.5,
+    'physical_activity': 0.4,
+    'diet_quality': 0.4,
+    'hormonal_factors': 0.6,
+    'gender': 0.3,
+    'cancer_type': 0.2
+})
+
 class CancerDetectionPredictor(BasePredictor):
     """Predicts cancer risk for breast, lung, prostate, skin, and cervical cancers"""
     
+    # Model features in schema order, each divided by its scale to land near [0, 1]; flags use 1.0
+    _FEATURE_FIELDS = tuple(_CANCER_REQUIRED_FIELDS)
+    _FEATURE_GETTER = itemgetter(*_FEATURE_FIELDS)
+    _FEATURE_SCALES = np.array([
+        100.0, 1.0, 4.0, 1.0, 3.0, 3.0, 50.0, 3.0, 3.0, 3.0, 1.0, 1.0, 1.0
+    ])
+    
     def __init__(self):
         super().__init__(
             name="Cancer Detection & Risk Predictor",
             description="Detects and predicts risk for breast, lung, prostate, skin, and cervical cancers"
         )
     
-    def get_required_fields(self) -> Dict[str, str]:
-        return {
-            "age": "int",
-            "gender": "int",  # 1 = male, 0 = female
-            "cancer_type": "int",  # 0 = breast, 1 = lung, 2 = prostate, 3 = skin, 4 = cervical
-            "family_history": "int",  # 1 = yes, 0 = no
-            "smoking_history": "int",  # 0-3 (never, light, moderate, heavy)
-            "alcohol_consumption": "int",  # 0-3
-            "bmi": "float",
-            "physical_activity": "int",  # 0-3
-            "diet_quality": "int",  # 0-3 (poor, fair, good, excellent)
-            "sun_exposure": "int",  # 0-3 (minimal, moderate, high, extreme)
-            "occupational_exposure": "int",  # 1 = yes, 0 = no
-            "hormonal_factors": "int",  # 1 = yes, 0 = no (for breast/cervical)
-            "previous_cancer": "int"  # 1 = yes, 0 = no
-        }
+    def get_required_fields(self) -> Mapping[str, str]:
+        return _CANCER_REQUIRED_FIELDS
     
-    def get_field_descriptions(self) -> Dict[str, str]:
-        return {
-            "age": "Age in years",
-            "gender": "Gender (1 = Male, 0 = Female)",
-            "cancer_type": "Cancer type to assess (0 = Breast, 1 = Lung, 2 = Prostate, 3 = Skin, 4 = Cervical)",
-            "family_history": "Family history of cancer (1 = Yes, 0 = No)",
-            "smoking_history": "Smoking history (0 = Never, 1 = Light, 2 = Moderate, 3 = Heavy)",
-            "alcohol_consumption": "Alcohol consumption (0 = Never, 1 = Light, 2 = Moderate, 3 = Heavy)",
-            "bmi": "Body Mass Index",
-            "physical_activity": "Physical activity level (0 = Sedentary, 1 = Light, 2 = Moderate, 3 = Vigorous)",
-            "diet_quality": "Diet quality (0 = Poor, 1 = Fair, 2 = Good, 3 = Excellent)",
-            "sun_exposure": "Sun exposure level (0 = Minimal, 1 = Moderate, 2 = High, 3 = Extreme)",
-            "occupational_exposure": "Occupational exposure to carcinogens (1 = Yes, 0 = No)",
-            "hormonal_factors": "Hormonal factors (relevant for breast/cervical cancer) (1 = Yes, 0 = No)",
-            "previous_cancer": "Previous cancer diagnosis (1 = Yes, 0 = No)"
-        }
+    def get_field_descriptions(self) -> Mapping[str, str]:
+        return _CANCER_FIELD_DESCRIPTIONS
     
     def preprocess_data(self, data: Dict[str, Any]) -> np.ndarray:
-        features = [
-            data["age"] / 100.0,
-            data["gender"],
-            data["cancer_type"] / 4.0,
-            data["family_history"],
-            data["smoking_history"] / 3.0,
-            data["alcohol_consumption"] / 3.0,
-            data["bmi"] / 50.0,
-            data["physical_activity"] / 3.0,
-            data["diet_quality"] / 3.0,
-            data["sun_exposure"] / 3.0,
-            data["occupational_exposure"],
-            data["hormonal_factors"],
-            data["previous_cancer"]
-        ]
-        return np.array(features)
+        return self._fill_scaled_row(data, self._FEATURE_GETTER, self._FEATURE_SCALES)
+    
+    @staticmethod
+    def _read_analysis_inputs(data: Dict[str, Any]) -> tuple:
+        """The analyses' inputs in _CANCER_ANALYSIS_DEFAULTS order, with defaults for absent fields"""
+        try:
+            # Validated input holds every field, so one itemgetter call reads them all
+            return _CANCER_ANALYSIS_GETTER(data)
+        except KeyError:
+            return tuple(data.get(field, default) for field, default in _CANCER_ANALYSIS_DEFAULTS.items())
     
     def identify_contributing_factors(self, data: Dict[str, Any]) -> List[str]:
         """Identify key cancer risk factors"""
         factors = []
+        age, smoking, family_history, bmi, occupational_exposure, sun_exposure, previous_cancer, _, _ = (
+            self._read_analysis_inputs(data)
+        )
         
         # Age factor
-        age = data.get('age', 0)
         if age > 65:
             factors.append(f"Advanced age ({age} years) - significantly increases cancer risk")
         elif age > 50:
             factors.append(f"Mature age ({age} years) - moderately increases cancer risk")
         
         # Lifestyle factors
-        smoking = data.get('smoking_history', 0)
         if smoking >= 3:
             factors.append("Heavy smoking history - major lung and multiple cancer risk")
         elif smoking >= 2:
             factors.append("Moderate smoking history - elevated cancer risk")
         
         # Family history
-        if data.get('family_history', 0) == 1:
+        if family_history == 1:
             factors.append("Family history of cancer - genetic predisposition")
         
         # BMI and lifestyle
-        bmi = data.get('bmi', 25)
         if bmi > 30:
             factors.append(f"Obesity (BMI: {bmi}) - increases multiple cancer risks")
         
         # Occupational exposure
-        if data.get('occupational_exposure', 0) == 1:
+        if occupational_exposure == 1:
             factors.append("Occupational carcinogen exposure - environmental risk factor")
         
         # Sun exposure for skin cancer
-        if data.get('sun_exposure', 0) >= 3:
+        if sun_exposure >= 3:
             factors.append("Extreme sun exposure - high skin cancer risk")
         
         # Previous cancer
-        if data.get('previous_cancer', 0) == 1:
+        if previous_cancer == 1:
             factors.append("Previous cancer diagnosis - increased risk of recurrence or secondary cancers")
         
         return factors
@@ -1513,20 +1815,12 @@ class CancerDetectionPredictor(BasePredictor):
     def analyze_health_metrics(self, data: Dict[str, Any]) -> Dict[str, str]:
         """Analyze cancer-related health metrics"""
         metrics = {}
+        _, smoking, _, bmi, _, _, _, activity, diet = self._read_analysis_inputs(data)
         
         # BMI Analysis
-        bmi = data.get('bmi', 25)
-        if bmi < 18.5:
-            metrics["Body Mass Index"] = "Underweight (may indicate underlying health issues)"
-        elif bmi < 25:
-            metrics["Body Mass Index"] = "Normal weight (optimal for cancer prevention)"
-        elif bmi < 30:
-            metrics["Body Mass Index"] = "Overweight (moderate cancer risk increase)"
-        else:
-            metrics["Body Mass Index"] = "Obese (significant cancer risk factor)"
+        metrics["Body Mass Index"] = _CANCER_BMI_LABELS[bisect_right(_BMI_BOUNDS, bmi)]
         
         # Smoking Analysis
-        smoking = data.get('smoking_history', 0)
         if smoking == 0:
             metrics["Smoking Status"] = "Never smoked (protective factor)"
         elif smoking == 1:
@@ -1537,7 +1831,6 @@ class CancerDetectionPredictor(BasePredictor):
             metrics["Smoking Status"] = "Heavy smoking history (major cancer risk factor)"
         
         # Physical Activity Analysis
-        activity = data.get('physical_activity', 0)
         if activity == 0:
             metrics["Physical Activity"] = "Sedentary (increased cancer risk)"
         elif activity == 1:
@@ -1548,7 +1841,6 @@ class CancerDetectionPredictor(BasePredictor):
             metrics["Physical Activity"] = "Vigorous activity (excellent cancer protection)"
         
         # Diet Quality Analysis
-        diet = data.get('diet_quality', 0)
         if diet == 0:
             metrics["Diet Quality"] = "Poor diet (increased cancer risk)"
         elif diet == 1:
@@ -1563,20 +1855,21 @@ class CancerDetectionPredictor(BasePredictor):
     def assess_lifestyle_impact(self, data: Dict[str, Any]) -> str:
         """Assess lifestyle impact on cancer risk"""
         impact_factors = []
+        _, smoking, _, bmi, _, sun_exposure, _, activity, diet = self._read_analysis_inputs(data)
         
-        if data.get('smoking_history', 0) >= 2:
+        if smoking >= 2:
             impact_factors.append("smoking cessation (can reduce risk by 50% within 5 years)")
         
-        if data.get('physical_activity', 0) == 0:
+        if activity == 0:
             impact_factors.append("regular physical activity (can reduce risk by 20-30%)")
         
-        if data.get('bmi', 25) > 25:
+        if bmi > 25:
             impact_factors.append("weight management (maintaining healthy BMI reduces multiple cancer risks)")
         
-        if data.get('diet_quality', 0) <= 1:
+        if diet <= 1:
             impact_factors.append("improved diet quality (fruits, vegetables, whole grains provide cancer protection)")
         
-        if data.get('sun_exposure', 0) >= 3:
+        if sun_exposure >= 3:
             impact_factors.append("sun protection measures (can prevent 90% of skin cancers)")
         
         if impact_factors:
@@ -1586,40 +1879,14 @@ class CancerDetectionPredictor(BasePredictor):
     
     def calculate_field_risk_contribution(self, field_name: str, value: Any, normalized_value: float) -> float:
         """Calculate cancer-specific risk contribution"""
-        risk_weights = {
-            'age': 0.9,
-            'family_history': 0.8,
-            'smoking_history': 0.85,
-            'previous_cancer': 0.9,
-            'occupational_exposure': 0.7,
-            'bmi': 0.6,
-            'sun_exposure': 0.7,
-            'alcohol_consumption': 0.5,
-            'physical_activity': 0.4,
-            'diet_quality': 0.4,
-            'hormonal_factors': 0.6,
-            'gender': 0.3,
-            'cancer_type': 0.2
-        }
-        
         base_contribution = abs(normalized_value - 0.5) * 2
-        weight = risk_weights.get(field_name, 0.5)
+        weight = _CANCER_RISK_WEIGHTS.get(field_name, 0.5)
         return base_contribution * weight
     
     def explain_field_risk(self, field_name: str, value: Any) -> str:
         """Explain cancer-specific field risk"""
-        explanations = {
-            'age': f"Age {value} years - cancer incidence increases exponentially with age due to cellular damage accumulation",
-            'smoking_history': f"Smoking level {value} - tobacco contains 70+ carcinogens causing DNA damage in multiple organs",
-            'family_history': "Family history - inherited genetic mutations (BRCA1/2, Lynch syndrome) significantly increase risk",
-            'bmi': f"BMI {value} - obesity promotes inflammation, hormone imbalances, and insulin resistance",
-            'occupational_exposure': "Occupational exposure - workplace carcinogens cause cumulative DNA damage",
-            'sun_exposure': f"Sun exposure level {value} - UV radiation causes skin DNA damage leading to melanoma",
-            'alcohol_consumption': f"Alcohol level {value} - ethanol metabolites damage DNA and impair immune surveillance",
-            'previous_cancer': "Previous cancer - indicates genetic susceptibility and treatment-related secondary cancer risk",
-            'hormonal_factors': "Hormonal factors - estrogen exposure increases breast and endometrial cancer risk"
-        }
-        return explanations.get(field_name, f"Field {field_name} with value {value} contributes to overall cancer risk assessment")
+        template = _CANCER_EXPLANATIONS.get(field_name)
+        return template.format(value=value) if template is not None else f"Field {field_name} with value {value} contributes to overall cancer risk assessment"
     
     def get_factor_specific_recommendation(self, factor: Dict[str, Any]) -> str:
         """Get cancer-specific recommendations"""
@@ -1662,163 +1929,102 @@ class CancerDetectionPredictor(BasePredictor):
 class KidneyDiseasePredictor(BasePredictor):
     """Predicts chronic kidney disease from blood and urine data"""
     
+    # Model features in schema order, each divided by its scale to land near [0, 1]; flags use 1.0
+    _FEATURE_FIELDS = tuple(_KIDNEY_REQUIRED_FIELDS)
+    _FEATURE_GETTER = itemgetter(*_FEATURE_FIELDS)
+    _FEATURE_SCALES = np.array([
+        100.0, 200.0, 1.0, 5.0, 5.0, 1.0, 1.0, 1.0, 1.0, 500.0, 200.0, 10.0, 200.0, 10.0, 20.0, 100.0,
+        20000.0, 10.0, 1.0, 1.0, 1.0, 1.0, 1.0, 1.0
+    ])
+    
     def __init__(self):
         super().__init__(
             name="Kidney Disease Predictor",
             description="Detects chronic kidney disease from blood and urine test data"
         )
     
-    def get_required_fields(self) -> Dict[str, str]:
-        return {
-            "age": "int",
-            "blood_pressure": "float",
-            "specific_gravity": "float",
-            "albumin": "int",  # 0-5
-            "sugar": "int",  # 0-5
-            "red_blood_cells": "int",  # 1 = normal, 0 = abnormal
-            "pus_cell": "int",  # 1 = normal, 0 = abnormal
-            "pus_cell_clumps": "int",  # 1 = present, 0 = not present
-            "bacteria": "int",  # 1 = present, 0 = not present
-            "blood_glucose_random": "float",
-            "blood_urea": "float",
-            "serum_creatinine": "float",
-            "sodium": "float",
-            "potassium": "float",
-            "hemoglobin": "float",
-            "packed_cell_volume": "float",
-            "white_blood_cell_count": "float",
-            "red_blood_cell_count": "float",
-            "hypertension": "int",  # 1 = yes, 0 = no
-            "diabetes_mellitus": "int",  # 1 = yes, 0 = no
-            "coronary_artery_disease": "int",  # 1 = yes, 0 = no
-            "appetite": "int",  # 1 = good, 0 = poor
-            "pedal_edema": "int",  # 1 = yes, 0 = no
-            "anemia": "int"  # 1 = yes, 0 = no
-        }
+    def get_required_fields(self) -> Mapping[str, str]:
+        return _KIDNEY_REQUIRED_FIELDS
     
-    def get_field_descriptions(self) -> Dict[str, str]:
-        return {
-            "age": "Age in years",
-            "blood_pressure": "Blood pressure (mm Hg)",
-            "specific_gravity": "Specific gravity of urine",
-            "albumin": "Albumin level (0-5 scale)",
-            "sugar": "Sugar level (0-5 scale)",
-            "red_blood_cells": "Red blood cells in urine (1 = Normal, 0 = Abnormal)",
-            "pus_cell": "Pus cells in urine (1 = Normal, 0 = Abnormal)",
-            "pus_cell_clumps": "Pus cell clumps (1 = Present, 0 = Not present)",
-            "bacteria": "Bacteria in urine (1 = Present, 0 = Not present)",
-            "blood_glucose_random": "Random blood glucose (mg/dL)",
-            "blood_urea": "Blood urea (mg/dL)",
-            "serum_creatinine": "Serum creatinine (mg/dL)",
-            "sodium": "Sodium level (mEq/L)",
-            "potassium": "Potassium level (mEq/L)",
-            "hemoglobin": "Hemoglobin (g/dL)",
-            "packed_cell_volume": "Packed cell volume (%)",
-            "white_blood_cell_count": "White blood cell count (cells/cumm)",
-            "red_blood_cell_count": "Red blood cell count (millions/cmm)",
-            "hypertension": "Hypertension (1 = Yes, 0 = No)",
-            "diabetes_mellitus": "Diabetes mellitus (1 = Yes, 0 = No)",
-            "coronary_artery_disease": "Coronary artery disease (1 = Yes, 0 = No)",
-            "appetite": "Appetite (1 = Good, 0 = Poor)",
-            "pedal_edema": "Pedal edema (1 = Yes, 0 = No)",
-            "anemia": "Anemia (1 = Yes, 0 = No)"
-        }
+    def get_field_descriptions(self) -> Mapping[str, str]:
+        return _KIDNEY_FIELD_DESCRIPTIONS
     
     def preprocess_data(self, data: Dict[str, Any]) -> np.ndarray:
-        features = [
-            data["age"] / 100.0,
-            data["blood_pressure"] / 200.0,
-            data["specific_gravity"],
-            data["albumin"] / 5.0,
-            data["sugar"] / 5.0,
-            data["red_blood_cells"],
-            data["pus_cell"],
-            data["pus_cell_clumps"],
-            data["bacteria"],
-            data["blood_glucose_random"] / 500.0,
-            data["blood_urea"] / 200.0,
-            data["serum_creatinine"] / 10.0,
-            data["sodium"] / 200.0,
-            data["potassium"] / 10.0,
-            data["hemoglobin"] / 20.0,
-            data["packed_cell_volume"] / 100.0,
-            data["white_blood_cell_count"] / 20000.0,
-            data["red_blood_cell_count"] / 10.0,
-            data["hypertension"],
-            data["diabetes_mellitus"],
-            data["coronary_artery_disease"],
-            data["appetite"],
-            data["pedal_edema"],
-            data["anemia"]
-        ]
-        return np.array(features)
+        return self._fill_scaled_row(data, self._FEATURE_GETTER, self._FEATURE_SCALES)
+
+_LIVER_ENZYME_SEVERITY_BOUNDS = (80, 120)
+_LIVER_BILIRUBIN_SEVERITY_BOUNDS = (2.0, 3.0)
+_LIVER_ALBUMIN_SEVERITY_BOUNDS = (2.5, 3.0)
+_LIVER_ALP_SEVERITY_BOUNDS = (250, 400)
+_LIVER_JAUNDICE_BOUNDS = (1.5, 2.5)
+_LIVER_JAUNDICE_RISKS = ("low", "moderate", "high")
+_LIVER_MELD_BOUNDS = (10, 15, 20)
+_LIVER_MELD_RISKS = (
+    "Low mortality risk",
+    "Moderate mortality risk",
+    "High mortality risk",
+    "Very high mortality risk - transplant evaluation needed"
+)
+_LIVER_FIBROSIS_BOUNDS = (0.25, 0.5, 0.75)
+_LIVER_FIBROSIS_STAGES = (
+    "F0-F1 (minimal fibrosis)",
+    "F2 (moderate fibrosis)",
+    "F3 (advanced fibrosis)",
+    "F4 (cirrhosis)"
+)
+
+_LIVER_EXPLANATIONS = MappingProxyType({
+    'alamine_aminotransferase': "ALT {value} IU/L - elevated levels indicate hepatocellular damage and inflammation",
+    'aspartate_aminotransferase': "AST {value} IU/L - elevated levels suggest liver cell injury or muscle damage",
+    'total_bilirubin': "Total bilirubin {value} mg/dL - elevated levels indicate impaired bilirubin processing or hemolysis",
+    'albumin': "Albumin {value} g/dL - low levels indicate impaired liver synthetic function",
+    'alkaline_phosphotase': "ALP {value} IU/L - elevated levels suggest cholestatic liver injury or bile duct problems",
+    'alcohol_consumption': "Alcohol level {value} - chronic consumption causes hepatocyte damage and fibrosis",
+    'family_history': "Family history increases genetic predisposition to liver diseases like hemochromatosis",
+    'diabetes': "Diabetes increases risk of non-alcoholic fatty liver disease and steatohepatitis",
+    'bmi': "BMI {value} - obesity promotes hepatic steatosis and inflammatory liver disease",
+    'smoking': "Smoking accelerates liver fibrosis progression and increases oxidative stress"
+})
+
+# Weight of each field's deviation in its liver disease risk contribution; other fields weigh 0.5
+_LIVER_RISK_WEIGHTS = MappingProxyType({
+    'alamine_aminotransferase': 0.9,
+    'aspartate_aminotransferase': 0.9,
+    'total_bilirubin': 0.85,
+    'albumin': 0.8,
+    'alkaline_phosphotase': 0.7,
+    'alcohol_consumption': 0.85,
+    'family_history': 0.6,
+    'diabetes': 0.5,
+    'bmi': 0.6,
+    'age': 0.4,
+    'smoking': 0.4
+})
 
 class LiverDiseasePredictor(BasePredictor):
     """Predicts liver disease including hepatitis, cirrhosis, and fatty liver from lab tests"""
     
+    # Model features in schema order, each divided by its scale to land near [0, 1]; flags use 1.0
+    _FEATURE_FIELDS = tuple(_LIVER_REQUIRED_FIELDS)
+    _FEATURE_GETTER = itemgetter(*_FEATURE_FIELDS)
+    _FEATURE_SCALES = np.array([
+        100.0, 1.0, 10.0, 5.0, 1000.0, 200.0, 200.0, 10.0, 5.0, 3.0, 3.0, 1.0, 50.0, 1.0, 1.0
+    ])
+    
     def __init__(self):
         super().__init__(
             name="Liver Disease Predictor",
             description="Detects hepatitis, cirrhosis, and fatty liver disease from laboratory test results"
         )
     
-    def get_required_fields(self) -> Dict[str, str]:
-        return {
-            "age": "int",
-            "gender": "int",  # 1 = male, 0 = female
-            "total_bilirubin": "float",
-            "direct_bilirubin": "float",
-            "alkaline_phosphotase": "float",
-            "alamine_aminotransferase": "float",
-            "aspartate_aminotransferase": "float",
-            "total_proteins": "float",
-            "albumin": "float",
-            "albumin_globulin_ratio": "float",
-            "alcohol_consumption": "int",  # 0-3
-            "smoking": "int",  # 1 = yes, 0 = no
-            "bmi": "float",
-            "diabetes": "int",  # 1 = yes, 0 = no
-            "family_history": "int"  # 1 = yes, 0 = no
-        }
+    def get_required_fields(self) -> Mapping[str, str]:
+        return _LIVER_REQUIRED_FIELDS
     
-    def get_field_descriptions(self) -> Dict[str, str]:
-        return {
-            "age": "Age in years",
-            "gender": "Gender (1 = Male, 0 = Female)",
-            "total_bilirubin": "Total bilirubin (mg/dL)",
-            "direct_bilirubin": "Direct bilirubin (mg/dL)",
-            "alkaline_phosphotase": "Alkaline phosphatase (IU/L)",
-            "alamine_aminotransferase": "Alanine aminotransferase (IU/L)",
-            "aspartate_aminotransferase": "Aspartate aminotransferase (IU/L)",
-            "total_proteins": "Total proteins (g/dL)",
-            "albumin": "Albumin (g/dL)",
-            "albumin_globulin_ratio": "Albumin/Globulin ratio",
-            "alcohol_consumption": "Alcohol consumption (0 = Never, 1 = Light, 2 = Moderate, 3 = Heavy)",
-            "smoking": "Smoking status (1 = Yes, 0 = No)",
-            "bmi": "Body Mass Index",
-            "diabetes": "Diabetes (1 = Yes, 0 = No)",
-            "family_history": "Family history of liver disease (1 = Yes, 0 = No)"
-        }
+    def get_field_descriptions(self) -> Mapping[str, str]:
+        return _LIVER_FIELD_DESCRIPTIONS
     
     def preprocess_data(self, data: Dict[str, Any]) -> np.ndarray:
-        features = [
-            data["age"] / 100.0,
-            data["gender"],
-            data["total_bilirubin"] / 10.0,
-            data["direct_bilirubin"] / 5.0,
-            data["alkaline_phosphotase"] / 1000.0,
-            data["alamine_aminotransferase"] / 200.0,
-            data["aspartate_aminotransferase"] / 200.0,
-            data["total_proteins"] / 10.0,
-            data["albumin"] / 5.0,
-            data["albumin_globulin_ratio"] / 3.0,
-            data["alcohol_consumption"] / 3.0,
-            data["smoking"],
-            data["bmi"] / 50.0,
-            data["diabetes"],
-            data["family_history"]
-        ]
-        return np.array(features)
+        return self._fill_scaled_row(data, self._FEATURE_GETTER, self._FEATURE_SCALES)
     
     def identify_contributing_factors(self, data: Dict[str, Any]) -> List[Dict[str, Any]]:
         """Identify liver disease contributing factors with detailed analysis"""
@@ -1828,7 +2034,7 @@ class LiverDiseasePredictor(BasePredictor):
         alt = data.get('alamine_aminotransferase', 0)
         ast = data.get('aspartate_aminotransferase', 0)
         if alt > 40 or ast > 40:
-            severity = "severe" if max(alt, ast) > 120 else "moderate" if max(alt, ast) > 80 else "mild"
+            severity = _MILD_TO_SEVERE[bisect_left(_LIVER_ENZYME_SEVERITY_BOUNDS, max(alt, ast))]
             factors.append({
                 "factor": "Elevated liver enzymes",
                 "value": f"ALT: {alt} IU/L, AST: {ast} IU/L",
@@ -1846,7 +2052,7 @@ class LiverDiseasePredictor(BasePredictor):
             factors.append({
                 "factor": "Elevated bilirubin",
                 "value": f"Total: {total_bili} mg/dL, Direct: {direct_bili} mg/dL",
-                "severity": "severe" if total_bili > 3.0 else "moderate" if total_bili > 2.0 else "mild",
+                "severity": _MILD_TO_SEVERE[bisect_left(_LIVER_BILIRUBIN_SEVERITY_BOUNDS, total_bili)],
                 "impact": "high",
                 "description": f"Predominantly {bili_type} hyperbilirubinemia suggesting {'hepatocellular dysfunction' if bili_type == 'conjugated' else 'hemolysis or Gilbert syndrome'}"
             })
@@ -1858,7 +2064,7 @@ class LiverDiseasePredictor(BasePredictor):
             factors.append({
                 "factor": "Hypoalbuminemia",
                 "value": f"Albumin: {albumin} g/dL",
-                "severity": "severe" if albumin < 2.5 else "moderate" if albumin < 3.0 else "mild",
+                "severity": _SEVERE_TO_MILD[bisect_right(_LIVER_ALBUMIN_SEVERITY_BOUNDS, albumin)],
                 "impact": "high",
                 "description": "Reduced albumin synthesis indicating impaired liver synthetic function and potential portal hypertension"
             })
@@ -1869,7 +2075,7 @@ class LiverDiseasePredictor(BasePredictor):
             factors.append({
                 "factor": "Elevated alkaline phosphatase",
                 "value": f"ALP: {alp} IU/L",
-                "severity": "severe" if alp > 400 else "moderate" if alp > 250 else "mild",
+                "severity": _MILD_TO_SEVERE[bisect_left(_LIVER_ALP_SEVERITY_BOUNDS, alp)],
                 "impact": "moderate",
                 "description": "Elevated ALP suggests cholestatic liver injury, bile duct obstruction, or infiltrative liver disease"
             })
@@ -1905,6 +2111,7 @@ class LiverDiseasePredictor(BasePredictor):
         ast = data.get('aspartate_aminotransferase', 0)
         total_bili = data.get('total_bilirubin', 0)
         albumin = data.get('albumin', 0)
+        ast_alt_ratio = ast / alt if alt != 0 else None
         
         # Calculate liver function scores
         child_pugh_score = self._calculate_child_pugh_score(data)
@@ -1915,12 +2122,12 @@ class LiverDiseasePredictor(BasePredictor):
             "liver_enzymes": {
                 "alt": {"value": alt, "normal_range": "7-40 IU/L", "status": "elevated" if alt > 40 else "normal"},
                 "ast": {"value": ast, "normal_range": "10-40 IU/L", "status": "elevated" if ast > 40 else "normal"},
-                "ast_alt_ratio": {"value": round(ast/alt if alt > 0 else 0, 2), "interpretation": self._interpret_ast_alt_ratio(ast, alt)}
+                "ast_alt_ratio": {"value": round(ast_alt_ratio if alt > 0 else 0, 2), "interpretation": self._interpret_ast_alt_ratio(ast_alt_ratio)}
             },
             "bilirubin_metabolism": {
                 "total_bilirubin": {"value": total_bili, "normal_range": "0.2-1.2 mg/dL", "status": "elevated" if total_bili > 1.2 else "normal"},
                 "direct_bilirubin": {"value": data.get('direct_bilirubin', 0), "normal_range": "0.0-0.3 mg/dL"},
-                "jaundice_risk": "high" if total_bili > 2.5 else "moderate" if total_bili > 1.5 else "low"
+                "jaundice_risk": _LIVER_JAUNDICE_RISKS[bisect_left(_LIVER_JAUNDICE_BOUNDS, total_bili)]
             },
             "synthetic_function": {
                 "albumin": {"value": albumin, "normal_range": "3.5-5.0 g/dL", "status": "low" if albumin < 3.5 else "normal"},
@@ -1959,39 +2166,14 @@ class LiverDiseasePredictor(BasePredictor):
     
     def calculate_field_risk_contribution(self, field_name: str, value: Any, normalized_value: float) -> float:
         """Calculate liver disease-specific risk contribution"""
-        risk_weights = {
-            'alamine_aminotransferase': 0.9,
-            'aspartate_aminotransferase': 0.9,
-            'total_bilirubin': 0.85,
-            'albumin': 0.8,
-            'alkaline_phosphotase': 0.7,
-            'alcohol_consumption': 0.85,
-            'family_history': 0.6,
-            'diabetes': 0.5,
-            'bmi': 0.6,
-            'age': 0.4,
-            'smoking': 0.4
-        }
-        
         base_contribution = abs(normalized_value - 0.5) * 2
-        weight = risk_weights.get(field_name, 0.5)
+        weight = _LIVER_RISK_WEIGHTS.get(field_name, 0.5)
         return base_contribution * weight
     
     def explain_field_risk(self, field_name: str, value: Any) -> str:
         """Explain liver disease-specific field risk"""
-        explanations = {
-            'alamine_aminotransferase': f"ALT {value} IU/L - elevated levels indicate hepatocellular damage and inflammation",
-            'aspartate_aminotransferase': f"AST {value} IU/L - elevated levels suggest liver cell injury or muscle damage",
-            'total_bilirubin': f"Total bilirubin {value} mg/dL - elevated levels indicate impaired bilirubin processing or hemolysis",
-            'albumin': f"Albumin {value} g/dL - low levels indicate impaired liver synthetic function",
-            'alkaline_phosphotase': f"ALP {value} IU/L - elevated levels suggest cholestatic liver injury or bile duct problems",
-            'alcohol_consumption': f"Alcohol level {value} - chronic consumption causes hepatocyte damage and fibrosis",
-            'family_history': "Family history increases genetic predisposition to liver diseases like hemochromatosis",
-            'diabetes': "Diabetes increases risk of non-alcoholic fatty liver disease and steatohepatitis",
-            'bmi': f"BMI {value} - obesity promotes hepatic steatosis and inflammatory liver disease",
-            'smoking': "Smoking accelerates liver fibrosis progression and increases oxidative stress"
-        }
-        return explanations.get(field_name, f"Field {field_name} with value {value} contributes to liver disease risk assessment")
+        template = _LIVER_EXPLANATIONS.get(field_name)
+        return template.format(value=value) if template is not None else f"Field {field_name} with value {value} contributes to liver disease risk assessment"
     
     def get_factor_specific_recommendation(self, factor: Dict[str, Any]) -> str:
         """Get liver disease-specific recommendations"""
@@ -2084,10 +2266,9 @@ class LiverDiseasePredictor(BasePredictor):
         
         return score / 4.0
     
-    def _interpret_ast_alt_ratio(self, ast: float, alt: float) -> str:
-        """Interpret AST/ALT ratio"""
-        if alt == 0: return "Cannot calculate"
-        ratio = ast / alt
+    def _interpret_ast_alt_ratio(self, ratio: Optional[float]) -> str:
+        """Interpret AST/ALT ratio, None when ALT is 0"""
+        if ratio is None: return "Cannot calculate"
         
         if ratio < 1:
             return "Suggests hepatocellular injury (viral hepatitis, drug toxicity)"
@@ -2104,90 +2285,80 @@ class LiverDiseasePredictor(BasePredictor):
     
     def _interpret_meld_score(self, score: int) -> str:
         """Interpret MELD score"""
-        if score < 10: return "Low mortality risk"
-        elif score < 15: return "Moderate mortality risk"
-        elif score < 20: return "High mortality risk"
-        else: return "Very high mortality risk - transplant evaluation needed"
+        return _LIVER_MELD_RISKS[bisect_right(_LIVER_MELD_BOUNDS, score)]
     
     def _get_fibrosis_stage(self, score: float) -> str:
         """Get fibrosis stage from score"""
-        if score < 0.25: return "F0-F1 (minimal fibrosis)"
-        elif score < 0.5: return "F2 (moderate fibrosis)"
-        elif score < 0.75: return "F3 (advanced fibrosis)"
-        else: return "F4 (cirrhosis)"
+        return _LIVER_FIBROSIS_STAGES[bisect_right(_LIVER_FIBROSIS_BOUNDS, score)]
+
+_ALZHEIMER_MMSE_SEVERITY_BOUNDS = (18, 21)
+_ALZHEIMER_FUNCTIONAL_SEVERITY_BOUNDS = (4, 6)
+_ALZHEIMER_AGE_BOUNDS = (65, 75, 85)
+_ALZHEIMER_AGE_RISKS = ("low", "moderate", "high", "high")
+_ALZHEIMER_RESERVE_BOUNDS = (0.5, 0.7)
+_ALZHEIMER_RESERVE_LABELS = (
+    "Low cognitive reserve - increased vulnerability to cognitive decline",
+    "Moderate cognitive reserve - some protection against dementia",
+    "High cognitive reserve - strong protection against dementia"
+)
+
+_ALZHEIMER_EXPLANATIONS = MappingProxyType({
+    'mmse_score': "MMSE score {value}/30 - lower scores indicate progressive cognitive decline and dementia",
+    'functional_assessment': "Functional score {value}/10 - reduced ability to perform daily activities indicates dementia progression",
+    'age': "Age {value} years - dementia risk doubles every 5 years after age 65",
+    'family_history_dementia': "Family history increases genetic risk through inherited mutations (APP, PSEN1, PSEN2, APOE4)",
+    'memory_complaints': "Subjective memory complaints may indicate mild cognitive impairment, a dementia precursor",
+    'depression_score': "Depression score {value}/15 - depression accelerates cognitive decline and may be early dementia symptom",
+    'cardiovascular_disease': "Cardiovascular disease reduces brain blood flow and increases vascular dementia risk",
+    'diabetes': "Diabetes causes brain insulin resistance and accelerates Alzheimer's pathology",
+    'social_isolation': "Isolation level {value}/10 - lack of social stimulation accelerates cognitive decline",
+    'sleep_quality': "Sleep quality {value}/10 - poor sleep impairs memory consolidation and increases amyloid accumulation",
+    'physical_activity': "Activity level {value}/3 - exercise promotes neuroplasticity and reduces dementia risk",
+    'education_years': "Education {value} years - higher education builds cognitive reserve protecting against dementia"
+})
+
+# Weight of each field's deviation in its Alzheimer's/dementia risk contribution; other fields weigh 0.5
+_ALZHEIMER_RISK_WEIGHTS = MappingProxyType({
+    'mmse_score': 0.9,
+    'functional_assessment': 0.85,
+    'age': 0.8,
+    'family_history_dementia': 0.75,
+    'memory_complaints': 0.7,
+    'depression_score': 0.6,
+    'cardiovascular_disease': 0.65,
+    'diabetes': 0.6,
+    'hypertension': 0.55,
+    'social_isolation': 0.5,
+    'sleep_quality': 0.5,
+    'physical_activity': 0.45,
+    'education_years': 0.4,
+    'smoking_history': 0.4
+})
 
 class AlzheimerPredictor(BasePredictor):
     """Predicts Alzheimer's and dementia risk using memory and behavioral data"""
     
+    # Model features in schema order, each divided by its scale to land near [0, 1]; flags use 1.0
+    _FEATURE_FIELDS = tuple(_ALZHEIMER_REQUIRED_FIELDS)
+    _FEATURE_GETTER = itemgetter(*_FEATURE_FIELDS)
+    _FEATURE_SCALES = np.array([
+        100.0, 1.0, 20.0, 30.0, 1.0, 10.0, 15.0, 10.0, 10.0, 10.0, 3.0, 1.0, 1.0, 1.0, 1.0, 3.0, 3.0
+    ])
+    
     def __init__(self):
         super().__init__(
             name="Alzheimer's / Dementia Predictor",
             description="Early detection of Alzheimer's and dementia using memory and behavioral assessment data"
         )
     
-    def get_required_fields(self) -> Dict[str, str]:
-        return {
-            "age": "int",
-            "gender": "int",  # 1 = male, 0 = female
-            "education_years": "int",
-            "mmse_score": "int",  # Mini-Mental State Examination (0-30)
-            "memory_complaints": "int",  # 1 = yes, 0 = no
-            "functional_assessment": "int",  # 0-10 scale
-            "depression_score": "int",  # 0-15 scale
-            "anxiety_level": "int",  # 0-10 scale
-            "sleep_quality": "int",  # 0-10 scale
-            "social_isolation": "int",  # 0-10 scale
-            "physical_activity": "int",  # 0-3
-            "family_history_dementia": "int",  # 1 = yes, 0 = no
-            "cardiovascular_disease": "int",  # 1 = yes, 0 = no
-            "diabetes": "int",  # 1 = yes, 0 = no
-            "hypertension": "int",  # 1 = yes, 0 = no
-            "smoking_history": "int",  # 0-3
-            "alcohol_consumption": "int"  # 0-3
-        }
+    def get_required_fields(self) -> Mapping[str, str]:
+        return _ALZHEIMER_REQUIRED_FIELDS
     
-    def get_field_descriptions(self) -> Dict[str, str]:
-        return {
-            "age": "Age in years",
-            "gender": "Gender (1 = Male, 0 = Female)",
-            "education_years": "Years of education",
-            "mmse_score": "Mini-Mental State Examination score (0-30, higher is better)",
-            "memory_complaints": "Subjective memory complaints (1 = Yes, 0 = No)",
-            "functional_assessment": "Functional assessment score (0-10, higher is better)",
-            "depression_score": "Depression assessment score (0-15, higher indicates more depression)",
-            "anxiety_level": "Anxiety level (0-10, higher indicates more anxiety)",
-            "sleep_quality": "Sleep quality (0-10, higher is better)",
-            "social_isolation": "Social isolation level (0-10, higher indicates more isolation)",
-            "physical_activity": "Physical activity level (0 = Sedentary, 1 = Light, 2 = Moderate, 3 = Vigorous)",
-            "family_history_dementia": "Family history of dementia (1 = Yes, 0 = No)",
-            "cardiovascular_disease": "Cardiovascular disease (1 = Yes, 0 = No)",
-            "diabetes": "Diabetes (1 = Yes, 0 = No)",
-            "hypertension": "Hypertension (1 = Yes, 0 = No)",
-            "smoking_history": "Smoking history (0 = Never, 1 = Light, 2 = Moderate, 3 = Heavy)",
-            "alcohol_consumption": "Alcohol consumption (0 = Never, 1 = Light, 2 = Moderate, 3 = Heavy)"
-        }
+    def get_field_descriptions(self) -> Mapping[str, str]:
+        return _ALZHEIMER_FIELD_DESCRIPTIONS
     
     def preprocess_data(self, data: Dict[str, Any]) -> np.ndarray:
-        features = [
-            data["age"] / 100.0,
-            data["gender"],
-            data["education_years"] / 20.0,
-            data["mmse_score"] / 30.0,
-            data["memory_complaints"],
-            data["functional_assessment"] / 10.0,
-            data["depression_score"] / 15.0,
-            data["anxiety_level"] / 10.0,
-            data["sleep_quality"] / 10.0,
-            data["social_isolation"] / 10.0,
-            data["physical_activity"] / 3.0,
-            data["family_history_dementia"],
-            data["cardiovascular_disease"],
-            data["diabetes"],
-            data["hypertension"],
-            data["smoking_history"] / 3.0,
-            data["alcohol_consumption"] / 3.0
-        ]
-        return np.array(features)
+        return self._fill_scaled_row(data, self._FEATURE_GETTER, self._FEATURE_SCALES)
     
     def identify_contributing_factors(self, data: Dict[str, Any]) -> List[Dict[str, Any]]:
         """Identify Alzheimer's/dementia contributing factors with detailed analysis"""
@@ -2196,7 +2367,7 @@ class AlzheimerPredictor(BasePredictor):
         # Cognitive assessment
         mmse = data.get('mmse_score', 30)
         if mmse < 24:
-            severity = "severe" if mmse < 18 else "moderate" if mmse < 21 else "mild"
+            severity = _SEVERE_TO_MILD[bisect_right(_ALZHEIMER_MMSE_SEVERITY_BOUNDS, mmse)]
             factors.append({
                 "factor": "Cognitive impairment",
                 "value": f"MMSE: {mmse}/30",
@@ -2211,7 +2382,7 @@ class AlzheimerPredictor(BasePredictor):
             factors.append({
                 "factor": "Functional decline",
                 "value": f"Functional score: {functional}/10",
-                "severity": "severe" if functional < 4 else "moderate" if functional < 6 else "mild",
+                "severity": _SEVERE_TO_MILD[bisect_right(_ALZHEIMER_FUNCTIONAL_SEVERITY_BOUNDS, functional)],
                 "impact": "high",
                 "description": "Reduced ability to perform activities of daily living, indicating progressive functional impairment"
             })
@@ -2292,10 +2463,16 @@ class AlzheimerPredictor(BasePredictor):
         """Analyze Alzheimer's/dementia-specific health metrics"""
         mmse = data.get('mmse_score', 30)
         functional = data.get('functional_assessment', 10)
+        depression = data.get('depression_score', 0)
+        anxiety = data.get('anxiety_level', 0)
+        sleep = data.get('sleep_quality', 10)
+        age = data.get('age', 0)
+        family_history = data.get('family_history_dementia', 0)
         
         # Calculate cognitive domain scores
+        vascular_factors = self._count_vascular_factors(data)
         cognitive_reserve = self._calculate_cognitive_reserve(data)
-        dementia_risk_score = self._calculate_dementia_risk_score(data)
+        dementia_risk_score = self._calculate_dementia_risk_score(data, vascular_factors)
         
         return {
             "cognitive_assessment": {
@@ -2304,14 +2481,14 @@ class AlzheimerPredictor(BasePredictor):
                 "cognitive_reserve": {"value": cognitive_reserve, "interpretation": self._interpret_cognitive_reserve(cognitive_reserve)}
             },
             "behavioral_symptoms": {
-                "depression_score": {"value": data.get('depression_score', 0), "normal_range": "0-4", "status": "elevated" if data.get('depression_score', 0) > 7 else "normal"},
-                "anxiety_level": {"value": data.get('anxiety_level', 0), "normal_range": "0-3", "status": "elevated" if data.get('anxiety_level', 0) > 6 else "normal"},
-                "sleep_quality": {"value": data.get('sleep_quality', 10), "normal_range": "7-10", "status": "poor" if data.get('sleep_quality', 10) < 6 else "good"}
+                "depression_score": {"value": depression, "normal_range": "0-4", "status": "elevated" if depression > 7 else "normal"},
+                "anxiety_level": {"value": anxiety, "normal_range": "0-3", "status": "elevated" if anxiety > 6 else "normal"},
+                "sleep_quality": {"value": sleep, "normal_range": "7-10", "status": "poor" if sleep < 6 else "good"}
             },
             "risk_factors": {
-                "age_risk": {"value": data.get('age', 0), "risk_level": "high" if data.get('age', 0) > 75 else "moderate" if data.get('age', 0) > 65 else "low"},
-                "family_history": {"present": bool(data.get('family_history_dementia', 0)), "risk_multiplier": 2.5 if data.get('family_history_dementia', 0) else 1.0},
-                "vascular_risk": {"factors": self._count_vascular_factors(data), "impact": "high" if self._count_vascular_factors(data) >= 2 else "moderate"}
+                "age_risk": {"value": age, "risk_level": _ALZHEIMER_AGE_RISKS[bisect_left(_ALZHEIMER_AGE_BOUNDS, age)]},
+                "family_history": {"present": bool(family_history), "risk_multiplier": 2.5 if family_history else 1.0},
+                "vascular_risk": {"factors": vascular_factors, "impact": "high" if vascular_factors >= 2 else "moderate"}
             },
             "dementia_risk_assessment": {
                 "overall_risk_score": {"value": dementia_risk_score, "interpretation": self._interpret_risk_score(dementia_risk_score)},
@@ -2350,44 +2527,14 @@ class AlzheimerPredictor(BasePredictor):
     
     def calculate_field_risk_contribution(self, field_name: str, value: Any, normalized_value: float) -> float:
         """Calculate Alzheimer's/dementia-specific risk contribution"""
-        risk_weights = {
-            'mmse_score': 0.9,
-            'functional_assessment': 0.85,
-            'age': 0.8,
-            'family_history_dementia': 0.75,
-            'memory_complaints': 0.7,
-            'depression_score': 0.6,
-            'cardiovascular_disease': 0.65,
-            'diabetes': 0.6,
-            'hypertension': 0.55,
-            'social_isolation': 0.5,
-            'sleep_quality': 0.5,
-            'physical_activity': 0.45,
-            'education_years': 0.4,
-            'smoking_history': 0.4
-        }
-        
         base_contribution = abs(normalized_value - 0.5) * 2
-        weight = risk_weights.get(field_name, 0.5)
+        weight = _ALZHEIMER_RISK_WEIGHTS.get(field_name, 0.5)
         return base_contribution * weight
     
     def explain_field_risk(self, field_name: str, value: Any) -> str:
         """Explain Alzheimer's/dementia-specific field risk"""
-        explanations = {
-            'mmse_score': f"MMSE score {value}/30 - lower scores indicate progressive cognitive decline and dementia",
-            'functional_assessment': f"Functional score {value}/10 - reduced ability to perform daily activities indicates dementia progression",
-            'age': f"Age {value} years - dementia risk doubles every 5 years after age 65",
-            'family_history_dementia': "Family history increases genetic risk through inherited mutations (APP, PSEN1, PSEN2, APOE4)",
-            'memory_complaints': "Subjective memory complaints may indicate mild cognitive impairment, a dementia precursor",
-            'depression_score': f"Depression score {value}/15 - depression accelerates cognitive decline and may be early dementia symptom",
-            'cardiovascular_disease': "Cardiovascular disease reduces brain blood flow and increases vascular dementia risk",
-            'diabetes': "Diabetes causes brain insulin resistance and accelerates Alzheimer's pathology",
-            'social_isolation': f"Isolation level {value}/10 - lack of social stimulation accelerates cognitive decline",
-            'sleep_quality': f"Sleep quality {value}/10 - poor sleep impairs memory consolidation and increases amyloid accumulation",
-            'physical_activity': f"Activity level {value}/3 - exercise promotes neuroplasticity and reduces dementia risk",
-            'education_years': f"Education {value} years - higher education builds cognitive reserve protecting against dementia"
-        }
-        return explanations.get(field_name, f"Field {field_name} with value {value} contributes to dementia risk assessment")
+        template = _ALZHEIMER_EXPLANATIONS.get(field_name)
+        return template.format(value=value) if template is not None else f"Field {field_name} with value {value} contributes to dementia risk assessment"
     
     def get_factor_specific_recommendation(self, factor: Dict[str, Any]) -> str:
         """Get Alzheimer's/dementia-specific recommendations"""
@@ -2437,15 +2584,12 @@ class AlzheimerPredictor(BasePredictor):
         reserve_score = (education / 20 * 0.4) + (activity / 3 * 0.3) + (social / 10 * 0.3)
         return round(reserve_score, 2)
     
-    def _calculate_dementia_risk_score(self, data: Dict[str, Any]) -> float:
-        """Calculate overall dementia risk score"""
+    def _calculate_dementia_risk_score(self, data: Dict[str, Any], vascular_factors: int) -> float:
+        """Calculate overall dementia risk score, given _count_vascular_factors()"""
         risk_score = 0
         
-        # Age risk
-        age = data.get('age', 0)
-        if age > 85: risk_score += 3
-        elif age > 75: risk_score += 2
-        elif age > 65: risk_score += 1
+        # Age risk: a point per age band passed
+        risk_score += bisect_left(_ALZHEIMER_AGE_BOUNDS, data.get('age', 0))
         
         # Cognitive factors
         if data.get('mmse_score', 30) < 24: risk_score += 3
@@ -2456,7 +2600,7 @@ class AlzheimerPredictor(BasePredictor):
         if data.get('family_history_dementia', 0): risk_score += 2
         
         # Vascular factors
-        risk_score += self._count_vascular_factors(data)
+        risk_score += vascular_factors
         
         # Protective factors (subtract from risk)
         if data.get('education_years', 12) > 16: risk_score -= 1
@@ -2474,9 +2618,7 @@ class AlzheimerPredictor(BasePredictor):
     
     def _interpret_cognitive_reserve(self, score: float) -> str:
         """Interpret cognitive reserve score"""
-        if score > 0.7: return "High cognitive reserve - strong protection against dementia"
-        elif score > 0.5: return "Moderate cognitive reserve - some protection against dementia"
-        else: return "Low cognitive reserve - increased vulnerability to cognitive decline"
+        return _ALZHEIMER_RESERVE_LABELS[bisect_left(_ALZHEIMER_RESERVE_BOUNDS, score)]
     
     def _count_vascular_factors(self, data: Dict[str, Any]) -> int:
         """Count vascular risk factors"""
@@ -2497,108 +2639,25 @@ class AlzheimerPredictor(BasePredictor):
 class ParkinsonPredictor(BasePredictor):
     """Predicts Parkinson's disease using voice patterns, tremor, and movement analysis"""
     
+    # Model features in schema order, each divided by its scale to land near [0, 1]; flags use 1.0
+    _FEATURE_FIELDS = tuple(_PARKINSON_REQUIRED_FIELDS)
+    _FEATURE_GETTER = itemgetter(*_FEATURE_FIELDS)
+    _FEATURE_SCALES = np.array([
+        100.0, 1.0, 300.0, 500.0, 200.0, 10.0, 0.1, 0.1, 0.1, 0.1, 0.1, 2.0, 0.1, 0.1, 0.1, 0.1, 0.1, 50.0,
+        1.0, 1.0, 1.0, 1.0, 5.0, 1.0, 4.0, 4.0, 4.0, 4.0, 1.0
+    ])
+    
     def __init__(self):
         super().__init__(
             name="Parkinson's Disease Predictor",
             description="Detects Parkinson's disease using voice patterns, tremor analysis, and movement assessment"
         )
     
-    def get_required_fields(self) -> Dict[str, str]:
-        return {
-            "age": "int",
-            "gender": "int",  # 1 = male, 0 = female
-            "mdvp_fo": "float",  # Average vocal fundamental frequency
-            "mdvp_fhi": "float",  # Maximum vocal fundamental frequency
-            "mdvp_flo": "float",  # Minimum vocal fundamental frequency
-            "mdvp_jitter_percent": "float",  # Jitter percentage
-            "mdvp_jitter_abs": "float",  # Absolute jitter
-            "mdvp_rap": "float",  # Relative amplitude perturbation
-            "mdvp_ppq": "float",  # Pitch period perturbation quotient
-            "jitter_ddp": "float",  # Jitter DDP
-            "mdvp_shimmer": "float",  # Shimmer
-            "mdvp_shimmer_db": "float",  # Shimmer in dB
-            "shimmer_apq3": "float",  # Shimmer APQ3
-            "shimmer_apq5": "float",  # Shimmer APQ5
-            "mdvp_apq": "float",  # Amplitude perturbation quotient
-            "shimmer_dda": "float",  # Shimmer DDA
-            "nhr": "float",  # Noise-to-harmonics ratio
-            "hnr": "float",  # Harmonics-to-noise ratio
-            "rpde": "float",  # Recurrence period density entropy
-            "dfa": "float",  # Detrended fluctuation analysis
-            "spread1": "float",  # Nonlinear measure of fundamental frequency variation
-            "spread2": "float",  # Nonlinear measure of fundamental frequency variation
-            "d2": "float",  # Correlation dimension
-            "ppe": "float",  # Pitch period entropy
-            "tremor_severity": "int",  # 0-4 scale
-            "rigidity_score": "int",  # 0-4 scale
-            "bradykinesia_score": "int",  # 0-4 scale
-            "postural_instability": "int",  # 0-4 scale
-            "family_history": "int"  # 1 = yes, 0 = no
-        }
+    def get_required_fields(self) -> Mapping[str, str]:
+        return _PARKINSON_REQUIRED_FIELDS
     
-    def get_field_descriptions(self) -> Dict[str, str]:
-        return {
-            "age": "Age in years",
-            "gender": "Gender (1 = Male, 0 = Female)",
-            "mdvp_fo": "Average vocal fundamental frequency (Hz)",
-            "mdvp_fhi": "Maximum vocal fundamental frequency (Hz)",
-            "mdvp_flo": "Minimum vocal fundamental frequency (Hz)",
-            "mdvp_jitter_percent": "Jitter percentage (%)",
-            "mdvp_jitter_abs": "Absolute jitter (ms)",
-            "mdvp_rap": "Relative amplitude perturbation",
-            "mdvp_ppq": "Pitch period perturbation quotient",
-            "jitter_ddp": "Jitter DDP",
-            "mdvp_shimmer": "Shimmer",
-            "mdvp_shimmer_db": "Shimmer in dB",
-            "shimmer_apq3": "Shimmer APQ3",
-            "shimmer_apq5": "Shimmer APQ5",
-            "mdvp_apq": "Amplitude perturbation quotient",
-            "shimmer_dda": "Shimmer DDA",
-            "nhr": "Noise-to-harmonics ratio",
-            "hnr": "Harmonics-to-noise ratio",
-            "rpde": "Recurrence period density entropy",
-            "dfa": "Detrended fluctuation analysis",
-            "spread1": "Nonlinear measure of fundamental frequency variation",
-            "spread2": "Nonlinear measure of fundamental frequency variation",
-            "d2": "Correlation dimension",
-            "ppe": "Pitch period entropy",
-            "tremor_severity": "Tremor severity (0 = None, 1 = Slight, 2 = Mild, 3 = Moderate, 4 = Severe)",
-            "rigidity_score": "Rigidity score (0 = None, 1 = Slight, 2 = Mild, 3 = Moderate, 4 = Severe)",
-            "bradykinesia_score": "Bradykinesia score (0 = None, 1 = Slight, 2 = Mild, 3 = Moderate, 4 = Severe)",
-            "postural_instability": "Postural instability (0 = None, 1 = Slight, 2 = Mild, 3 = Moderate, 4 = Severe)",
-            "family_history": "Family history of Parkinson's (1 = Yes, 0 = No)"
-        }
+    def get_field_descriptions(self) -> Mapping[str, str]:
+        return _PARKINSON_FIELD_DESCRIPTIONS
     
     def preprocess_data(self, data: Dict[str, Any]) -> np.ndarray:
-        features = [
-            data["age"] / 100.0,
-            data["gender"],
-            data["mdvp_fo"] / 300.0,
-            data["mdvp_fhi"] / 500.0,
-            data["mdvp_flo"] / 200.0,
-            data["mdvp_jitter_percent"] / 10.0,
-            data["mdvp_jitter_abs"] / 0.1,
-            data["mdvp_rap"] / 0.1,
-            data["mdvp_ppq"] / 0.1,
-            data["jitter_ddp"] / 0.1,
-            data["mdvp_shimmer"] / 0.1,
-            data["mdvp_shimmer_db"] / 2.0,
-            data["shimmer_apq3"] / 0.1,
-            data["shimmer_apq5"] / 0.1,
-            data["mdvp_apq"] / 0.1,
-            data["shimmer_dda"] / 0.1,
-            data["nhr"] / 0.1,
-            data["hnr"] / 50.0,
-            data["rpde"] / 1.0,
-            data["dfa"] / 1.0,
-            data["spread1"] / 1.0,
-            data["spread2"] / 1.0,
-            data["d2"] / 5.0,
-            data["ppe"] / 1.0,
-            data["tremor_severity"] / 4.0,
-            data["rigidity_score"] / 4.0,
-            data["bradykinesia_score"] / 4.0,
-            data["postural_instability"] / 4.0,
-            data["family_history"]
-        ]
-        return np.array(features)
\ No newline at end of file
+        return self._fill_scaled_row(data, self._FEATURE_GETTER, self._FEATURE_SCALES)
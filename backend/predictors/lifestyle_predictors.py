@@ -1,7 +1,300 @@
 import numpy as np
-from typing import Dict, List, Any
+from operator import itemgetter
+from types import MappingProxyType
+from typing import Dict, List, Any, Mapping
 from .base_predictor import BasePredictor
 
+# Field schemas of the live predictor classes, shared read-only
+_OBESITY_REQUIRED_FIELDS = MappingProxyType({
+    "age": "int",
+    "gender": "int",  # 1 = male, 0 = female
+    "height": "float",  # cm
+    "weight": "float",  # kg
+    "waist_circumference": "float",  # cm
+    "hip_circumference": "float",  # cm
+    "body_fat_percentage": "float",
+    "muscle_mass": "float",  # kg
+    "metabolic_rate": "float",  # kcal/day
+    "physical_activity_level": "int",  # 0-4 scale
+    "sedentary_hours_per_day": "int",
+    "calories_consumed_daily": "int",
+    "fast_food_frequency": "int",  # 0-7 times per week
+    "vegetable_servings_daily": "int",
+    "fruit_servings_daily": "int",
+    "water_intake_liters": "float",
+    "sleep_hours_per_night": "float",
+    "stress_level": "int",  # 0-10 scale
+    "family_history_obesity": "int",  # 1 = yes, 0 = no
+    "diabetes": "int",  # 1 = yes, 0 = no
+    "hypertension": "int",  # 1 = yes, 0 = no
+    "thyroid_disorder": "int",  # 1 = yes, 0 = no
+    "medications_weight_gain": "int",  # 1 = yes, 0 = no
+    "smoking_status": "int",  # 0 = never, 1 = former, 2 = current
+    "alcohol_consumption": "int"  # 0-4 scale
+})
+
+_OBESITY_FIELD_DESCRIPTIONS = MappingProxyType({
+    "age": "Age in years",
+    "gender": "Gender (1 = Male, 0 = Female)",
+    "height": "Height in centimeters",
+    "weight": "Weight in kilograms",
+    "waist_circumference": "Waist circumference in centimeters",
+    "hip_circumference": "Hip circumference in centimeters",
+    "body_fat_percentage": "Body fat percentage (%)",
+    "muscle_mass": "Muscle mass in kilograms",
+    "metabolic_rate": "Basal metabolic rate (kcal/day)",
+    "physical_activity_level": "Physical activity level (0 = Sedentary, 1 = Light, 2 = Moderate, 3 = Active, 4 = Very Active)",
+    "sedentary_hours_per_day": "Hours spent sedentary per day",
+    "calories_consumed_daily": "Average daily calorie intake",
+    "fast_food_frequency": "Fast food consumption frequency (times per week)",
+    "vegetable_servings_daily": "Daily vegetable servings",
+    "fruit_servings_daily": "Daily fruit servings",
+    "water_intake_liters": "Daily water intake in liters",
+    "sleep_hours_per_night": "Average sleep hours per night",
+    "stress_level": "Stress level (0-10, higher indicates more stress)",
+    "family_history_obesity": "Family history of obesity (1 = Yes, 0 = No)",
+    "diabetes": "Diabetes diagnosis (1 = Yes, 0 = No)",
+    "hypertension": "Hypertension diagnosis (1 = Yes, 0 = No)",
+    "thyroid_disorder": "Thyroid disorder (1 = Yes, 0 = No)",
+    "medications_weight_gain": "Taking medications that cause weight gain (1 = Yes, 0 = No)",
+    "smoking_status": "Smoking status (0 = Never, 1 = Former, 2 = Current)",
+    "alcohol_consumption": "Alcohol consumption (0 = None, 1 = Light, 2 = Moderate, 3 = Heavy, 4 = Very Heavy)"
+})
+
+_CHOLESTEROL_REQUIRED_FIELDS = MappingProxyType({
+    "age": "int",
+    "gender": "int",  # 1 = male, 0 = female
+    "total_cholesterol": "float",  # mg/dL
+    "hdl_cholesterol": "float",  # mg/dL
+    "ldl_cholesterol": "float",  # mg/dL
+    "triglycerides": "float",  # mg/dL
+    "bmi": "float",
+    "waist_circumference": "float",
+    "systolic_bp": "float",
+    "diastolic_bp": "float",
+    "smoking_status": "int",  # 0 = never, 1 = former, 2 = current
+    "family_history_heart_disease": "int",  # 1 = yes, 0 = no
+    "diabetes": "int",  # 1 = yes, 0 = no
+    "physical_activity_level": "int",  # 0-4 scale
+    "saturated_fat_intake": "int",  # 0-4 scale (low to very high)
+    "trans_fat_intake": "int",  # 0-4 scale
+    "fiber_intake_grams": "float",  # grams per day
+    "omega3_intake": "int",  # 0-4 scale
+    "alcohol_consumption": "int",  # 0-4 scale
+    "stress_level": "int",  # 0-10 scale
+    "sleep_hours": "float",
+    "medication_statins": "int",  # 1 = yes, 0 = no
+    "c_reactive_protein": "float",  # mg/L
+    "homocysteine": "float",  # μmol/L
+    "lipoprotein_a": "float"  # mg/dL
+})
+
+_CHOLESTEROL_FIELD_DESCRIPTIONS = MappingProxyType({
+    "age": "Age in years",
+    "gender": "Gender (1 = Male, 0 = Female)",
+    "total_cholesterol": "Total cholesterol level (mg/dL)",
+    "hdl_cholesterol": "HDL (good) cholesterol (mg/dL)",
+    "ldl_cholesterol": "LDL (bad) cholesterol (mg/dL)",
+    "triglycerides": "Triglycerides level (mg/dL)",
+    "bmi": "Body Mass Index",
+    "waist_circumference": "Waist circumference (cm)",
+    "systolic_bp": "Systolic blood pressure (mmHg)",
+    "diastolic_bp": "Diastolic blood pressure (mmHg)",
+    "smoking_status": "Smoking status (0 = Never, 1 = Former, 2 = Current)",
+    "family_history_heart_disease": "Family history of heart disease (1 = Yes, 0 = No)",
+    "diabetes": "Diabetes diagnosis (1 = Yes, 0 = No)",
+    "physical_activity_level": "Physical activity level (0-4 scale)",
+    "saturated_fat_intake": "Saturated fat intake level (0 = Low, 1 = Moderate, 2 = High, 3 = Very High, 4 = Excessive)",
+    "trans_fat_intake": "Trans fat intake level (0 = None, 1 = Low, 2 = Moderate, 3 = High, 4 = Very High)",
+    "fiber_intake_grams": "Daily fiber intake (grams)",
+    "omega3_intake": "Omega-3 fatty acid intake (0 = None, 1 = Low, 2 = Moderate, 3 = High, 4 = Very High)",
+    "alcohol_consumption": "Alcohol consumption (0-4 scale)",
+    "stress_level": "Stress level (0-10)",
+    "sleep_hours": "Average sleep hours per night",
+    "medication_statins": "Taking statin medications (1 = Yes, 0 = No)",
+    "c_reactive_protein": "C-reactive protein level (mg/L)",
+    "homocysteine": "Homocysteine level (μmol/L)",
+    "lipoprotein_a": "Lipoprotein(a) level (mg/dL)"
+})
+
+_MENTAL_HEALTH_REQUIRED_FIELDS = MappingProxyType({
+    "age": "int",
+    "gender": "int",  # 1 = male, 0 = female
+    "phq9_score": "int",  # Patient Health Questionnaire-9 (0-27)
+    "gad7_score": "int",  # Generalized Anxiety Disorder-7 (0-21)
+    "sleep_hours_per_night": "float",
+    "sleep_quality_score": "int",  # 0-10 scale
+    "physical_activity_minutes": "int",  # per week
+    "social_interaction_hours": "float",  # per day
+    "work_stress_level": "int",  # 0-10 scale
+    "financial_stress_level": "int",  # 0-10 scale
+    "relationship_satisfaction": "int",  # 0-10 scale
+    "family_history_mental_health": "int",  # 1 = yes, 0 = no
+    "chronic_illness": "int",  # 1 = yes, 0 = no
+    "medication_antidepressants": "int",  # 1 = yes, 0 = no
+    "therapy_sessions": "int",  # sessions per month
+    "substance_use": "int",  # 0-4 scale
+    "alcohol_consumption": "int",  # 0-4 scale
+    "caffeine_intake_mg": "float",  # mg per day
+    "screen_time_hours": "float",  # per day
+    "outdoor_time_hours": "float",  # per day
+    "heart_rate_variability": "float",  # from wearable
+    "resting_heart_rate": "float",  # from wearable
+    "voice_pitch_variance": "float",  # voice analysis metric
+    "speech_rate": "float",  # words per minute
+    "pause_frequency": "float"  # pauses per minute in speech
+})
+
+_MENTAL_HEALTH_FIELD_DESCRIPTIONS = MappingProxyType({
+    "age": "Age in years",
+    "gender": "Gender (1 = Male, 0 = Female)",
+    "phq9_score": "PHQ-9 Depression Score (0-27, higher indicates more depression)",
+    "gad7_score": "GAD-7 Anxiety Score (0-21, higher indicates more anxiety)",
+    "sleep_hours_per_night": "Average sleep hours per night",
+    "sleep_quality_score": "Sleep quality (0-10, higher is better)",
+    "physical_activity_minutes": "Physical activity minutes per week",
+    "social_interaction_hours": "Social interaction hours per day",
+    "work_stress_level": "Work-related stress (0-10)",
+    "financial_stress_level": "Financial stress (0-10)",
+    "relationship_satisfaction": "Relationship satisfaction (0-10)",
+    "family_history_mental_health": "Family history of mental health issues (1 = Yes, 0 = No)",
+    "chronic_illness": "Chronic illness diagnosis (1 = Yes, 0 = No)",
+    "medication_antidepressants": "Taking antidepressant medication (1 = Yes, 0 = No)",
+    "therapy_sessions": "Therapy sessions per month",
+    "substance_use": "Substance use level (0-4 scale)",
+    "alcohol_consumption": "Alcohol consumption (0-4 scale)",
+    "caffeine_intake_mg": "Daily caffeine intake (mg)",
+    "screen_time_hours": "Daily screen time (hours)",
+    "outdoor_time_hours": "Daily outdoor time (hours)",
+    "heart_rate_variability": "Heart rate variability (from wearable device)",
+    "resting_heart_rate": "Resting heart rate (bpm)",
+    "voice_pitch_variance": "Voice pitch variance (voice analysis metric)",
+    "speech_rate": "Speech rate (words per minute)",
+    "pause_frequency": "Speech pause frequency (pauses per minute)"
+})
+
+_HYPERTENSION_REQUIRED_FIELDS = MappingProxyType({
+    "age": "int",
+    "gender": "int",  # 1 = male, 0 = female
+    "systolic_bp": "float",
+    "diastolic_bp": "float",
+    "bmi": "float",
+    "waist_circumference": "float",
+    "family_history_hypertension": "int",  # 1 = yes, 0 = no
+    "sodium_intake_mg": "float",  # mg per day
+    "potassium_intake_mg": "float",  # mg per day
+    "physical_activity_minutes": "int",  # minutes per week
+    "smoking_status": "int",  # 0 = never, 1 = former, 2 = current
+    "alcohol_drinks_per_week": "int",
+    "stress_level": "int",  # 0-10 scale
+    "sleep_quality": "int",  # 0-10 scale
+    "diabetes": "int",  # 1 = yes, 0 = no
+    "kidney_disease": "int",  # 1 = yes, 0 = no
+    "heart_rate": "float",
+    "cholesterol_total": "float",
+    "hdl_cholesterol": "float",
+    "ldl_cholesterol": "float",
+    "triglycerides": "float",
+    "glucose_fasting": "float",
+    "caffeine_intake_mg": "float",  # mg per day
+    "meditation_frequency": "int",  # 0-7 times per week
+    "work_stress_level": "int"  # 0-10 scale
+})
+
+_HYPERTENSION_FIELD_DESCRIPTIONS = MappingProxyType({
+    "age": "Age in years",
+    "gender": "Gender (1 = Male, 0 = Female)",
+    "systolic_bp": "Current systolic blood pressure (mmHg)",
+    "diastolic_bp": "Current diastolic blood pressure (mmHg)",
+    "bmi": "Body Mass Index",
+    "waist_circumference": "Waist circumference (cm)",
+    "family_history_hypertension": "Family history of hypertension (1 = Yes, 0 = No)",
+    "sodium_intake_mg": "Daily sodium intake (mg)",
+    "potassium_intake_mg": "Daily potassium intake (mg)",
+    "physical_activity_minutes": "Physical activity minutes per week",
+    "smoking_status": "Smoking status (0 = Never, 1 = Former, 2 = Current)",
+    "alcohol_drinks_per_week": "Alcoholic drinks per week",
+    "stress_level": "Overall stress level (0-10)",
+    "sleep_quality": "Sleep quality (0-10, higher is better)",
+    "diabetes": "Diabetes diagnosis (1 = Yes, 0 = No)",
+    "kidney_disease": "Kidney disease (1 = Yes, 0 = No)",
+    "heart_rate": "Resting heart rate (bpm)",
+    "cholesterol_total": "Total cholesterol (mg/dL)",
+    "hdl_cholesterol": "HDL cholesterol (mg/dL)",
+    "ldl_cholesterol": "LDL cholesterol (mg/dL)",
+    "triglycerides": "Triglycerides (mg/dL)",
+    "glucose_fasting": "Fasting glucose (mg/dL)",
+    "caffeine_intake_mg": "Daily caffeine intake (mg)",
+    "meditation_frequency": "Meditation frequency (times per week)",
+    "work_stress_level": "Work-related stress level (0-10)"
+})
+
+_SLEEP_APNEA_REQUIRED_FIELDS = MappingProxyType({
+    "age": "int",
+    "gender": "int",  # 1 = male, 0 = female
+    "bmi": "float",
+    "neck_circumference": "float",  # cm
+    "snoring_frequency": "int",  # 0-7 nights per week
+    "snoring_loudness": "int",  # 0-4 scale
+    "witnessed_apneas": "int",  # 1 = yes, 0 = no
+    "gasping_choking": "int",  # 1 = yes, 0 = no
+    "morning_headaches": "int",  # 0-7 days per week
+    "daytime_sleepiness": "int",  # Epworth Sleepiness Scale (0-24)
+    "fatigue_level": "int",  # 0-10 scale
+    "concentration_problems": "int",  # 0-10 scale
+    "sleep_duration_hours": "float",
+    "sleep_efficiency": "float",  # percentage
+    "sleep_latency_minutes": "float",  # time to fall asleep
+    "wake_after_sleep_onset": "float",  # minutes
+    "rem_sleep_percentage": "float",
+    "deep_sleep_percentage": "float",
+    "oxygen_saturation_min": "float",  # minimum SpO2 during sleep
+    "heart_rate_during_sleep": "float",  # average
+    "blood_pressure_systolic": "float",
+    "blood_pressure_diastolic": "float",
+    "diabetes": "int",  # 1 = yes, 0 = no
+    "heart_disease": "int",  # 1 = yes, 0 = no
+    "stroke_history": "int",  # 1 = yes, 0 = no
+    "family_history_sleep_apnea": "int",  # 1 = yes, 0 = no
+    "alcohol_before_bed": "int",  # 1 = yes, 0 = no
+    "smoking_status": "int",  # 0 = never, 1 = former, 2 = current
+    "nasal_congestion": "int",  # 0-10 scale
+    "sleep_position": "int"  # 1 = back, 2 = side, 3 = stomach
+})
+
+_SLEEP_APNEA_FIELD_DESCRIPTIONS = MappingProxyType({
+    "age": "Age in years",
+    "gender": "Gender (1 = Male, 0 = Female)",
+    "bmi": "Body Mass Index",
+    "neck_circumference": "Neck circumference (cm)",
+    "snoring_frequency": "Snoring frequency (nights per week)",
+    "snoring_loudness": "Snoring loudness (0 = None, 1 = Soft, 2 = Moderate, 3 = Loud, 4 = Very Loud)",
+    "witnessed_apneas": "Witnessed breathing pauses during sleep (1 = Yes, 0 = No)",
+    "gasping_choking": "Gasping or choking during sleep (1 = Yes, 0 = No)",
+    "morning_headaches": "Morning headaches frequency (days per week)",
+    "daytime_sleepiness": "Epworth Sleepiness Scale score (0-24)",
+    "fatigue_level": "Fatigue level (0-10)",
+    "concentration_problems": "Concentration problems (0-10)",
+    "sleep_duration_hours": "Average sleep duration (hours)",
+    "sleep_efficiency": "Sleep efficiency percentage (%)",
+    "sleep_latency_minutes": "Time to fall asleep (minutes)",
+    "wake_after_sleep_onset": "Wake time after sleep onset (minutes)",
+    "rem_sleep_percentage": "REM sleep percentage (%)",
+    "deep_sleep_percentage": "Deep sleep percentage (%)",
+    "oxygen_saturation_min": "Minimum oxygen saturation during sleep (%)",
+    "heart_rate_during_sleep": "Average heart rate during sleep (bpm)",
+    "blood_pressure_systolic": "Systolic blood pressure (mmHg)",
+    "blood_pressure_diastolic": "Diastolic blood pressure (mmHg)",
+    "diabetes": "Diabetes diagnosis (1 = Yes, 0 = No)",
+    "heart_disease": "Heart disease (1 = Yes, 0 = No)",
+    "stroke_history": "History of stroke (1 = Yes, 0 = No)",
+    "family_history_sleep_apnea": "Family history of sleep apnea (1 = Yes, 0 = No)",
+    "alcohol_before_bed": "Alcohol consumption before bed (1 = Yes, 0 = No)",
+    "smoking_status": "Smoking status (0 = Never, 1 = Former, 2 = Current)",
+    "nasal_congestion": "Nasal congestion level (0-10)",
+    "sleep_position": "Primary sleep position (1 = Back, 2 = Side, 3 = Stomach)"
+})
+
 class ObesityRiskPredictor(BasePredictor):
     """Predicts obesity risk and long-term obesity complications"""
     
@@ -11,63 +304,11 @@ class ObesityRiskPredictor(BasePredictor):
             description="Predicts obesity risk and long-term complications related to weight management"
         )
     
-    def get_required_fields(self) -> Dict[str, str]:
-        return {
-            "age": "int",
-            "gender": "int",  # 1 = male, 0 = female
-            "height": "float",  # cm
-            "weight": "float",  # kg
-            "waist_circumference": "float",  # cm
-            "hip_circumference": "float",  # cm
-            "body_fat_percentage": "float",
-            "muscle_mass": "float",  # kg
-            "metabolic_rate": "float",  # kcal/day
-            "physical_activity_level": "int",  # 0-4 scale
-            "sedentary_hours_per_day": "int",
-            "calories_consumed_daily": "int",
-            "fast_food_frequency": "int",  # 0-7 times per week
-            "vegetable_servings_daily": "int",
-            "fruit_servings_daily": "int",
-            "water_intake_liters": "float",
-            "sleep_hours_per_night": "float",
-            "stress_level": "int",  # 0-10 scale
-            "family_history_obesity": "int",  # 1 = yes, 0 = no
-            "diabetes": "int",  # 1 = yes, 0 = no
-            "hypertension": "int",  # 1 = yes, 0 = no
-            "thyroid_disorder": "int",  # 1 = yes, 0 = no
-            "medications_weight_gain": "int",  # 1 = yes, 0 = no
-            "smoking_status": "int",  # 0 = never, 1 = former, 2 = current
-            "alcohol_consumption": "int"  # 0-4 scale
-        }
+    def get_required_fields(self) -> Mapping[str, str]:
+        return _OBESITY_REQUIRED_FIELDS
     
-    def get_field_descriptions(self) -> Dict[str, str]:
-        return {
-            "age": "Age in years",
-            "gender": "Gender (1 = Male, 0 = Female)",
-            "height": "Height in centimeters",
-            "weight": "Weight in kilograms",
-            "waist_circumference": "Waist circumference in centimeters",
-            "hip_circumference": "Hip circumference in centimeters",
-            "body_fat_percentage": "Body fat percentage (%)",
-            "muscle_mass": "Muscle mass in kilograms",
-            "metabolic_rate": "Basal metabolic rate (kcal/day)",
-            "physical_activity_level": "Physical activity level (0 = Sedentary, 1 = Light, 2 = Moderate, 3 = Active, 4 = Very Active)",
-            "sedentary_hours_per_day": "Hours spent sedentary per day",
-            "calories_consumed_daily": "Average daily calorie intake",
-            "fast_food_frequency": "Fast food consumption frequency (times per week)",
-            "vegetable_servings_daily": "Daily vegetable servings",
-            "fruit_servings_daily": "Daily fruit servings",
-            "water_intake_liters": "Daily water intake in liters",
-            "sleep_hours_per_night": "Average sleep hours per night",
-            "stress_level": "Stress level (0-10, higher indicates more stress)",
-            "family_history_obesity": "Family history of obesity (1 = Yes, 0 = No)",
-            "diabetes": "Diabetes diagnosis (1 = Yes, 0 = No)",
-            "hypertension": "Hypertension diagnosis (1 = Yes, 0 = No)",
-            "thyroid_disorder": "Thyroid disorder (1 = Yes, 0 = No)",
-            "medications_weight_gain": "Taking medications that cause weight gain (1 = Yes, 0 = No)",
-            "smoking_status": "Smoking status (0 = Never, 1 = Former, 2 = Current)",
-            "alcohol_consumption": "Alcohol consumption (0 = None, 1 = Light, 2 = Moderate, 3 = Heavy, 4 = Very Heavy)"
-        }
+    def get_field_descriptions(self) -> Mapping[str, str]:
+        return _OBESITY_FIELD_DESCRIPTIONS
     
     def preprocess_data(self, data: Dict[str, Any]) -> np.ndarray:
         # Calculate BMI
@@ -102,7 +343,7 @@ class ObesityRiskPredictor(BasePredictor):
             data["smoking_status"] / 2.0,
             data["alcohol_consumption"] / 4.0
         ]
-        return np.array(features)
+        return self._fill_row(features)
 
     def identify_contributing_factors(self, data: Dict[str, Any], prediction_result: Dict[str, Any]) -> List[str]:
         """Identify key factors contributing to sleep apnea risk"""
@@ -382,7 +623,7 @@ class CholesterolRiskPredictor(BasePredictor):
             min(data["homocysteine"], 30) / 30,
             min(data["lipoprotein_a"], 100) / 100
         ]
-        return np.array(features)
+        return self._fill_row(features)
 
     def identify_contributing_factors(self, data: Dict[str, Any], prediction_result: Dict[str, Any]) -> List[str]:
         """Identify key factors contributing to cholesterol and atherosclerosis risk"""
@@ -597,7 +838,7 @@ class MentalHealthPredictor(BasePredictor):
             data["trauma_history"],
             data["family_history_mental_health"]
         ]
-        return np.array(features)
+        return self._fill_row(features)
 
     def identify_contributing_factors(self, data: Dict[str, Any], prediction_result: Dict[str, Any]) -> List[str]:
         """Identify key factors contributing to mental health risk"""
@@ -979,99 +1220,28 @@ class MentalHealthPredictor(BasePredictor):
 class HypertensionPredictor(BasePredictor):
     """Predicts hypertension risk based on lifestyle and genetic factors"""
     
+    # Model features in schema order, each divided by its scale to land near [0, 1]; flags use 1.0
+    _FEATURE_FIELDS = tuple(_HYPERTENSION_REQUIRED_FIELDS)
+    _FEATURE_GETTER = itemgetter(*_FEATURE_FIELDS)
+    _FEATURE_SCALES = np.array([
+        100.0, 1.0, 200.0, 120.0, 50.0, 150.0, 1.0, 5000.0, 5000.0, 300.0, 2.0, 20.0, 10.0, 10.0, 1.0, 1.0,
+        120.0, 400.0, 100.0, 300.0, 500.0, 200.0, 1000.0, 7.0, 10.0
+    ])
+    
     def __init__(self):
         super().__init__(
             name="Hypertension (High Blood Pressure) Predictor",
             description="Predicts hypertension risk using lifestyle and genetic risk factors"
         )
     
-    def get_required_fields(self) -> Dict[str, str]:
-        return {
-            "age": "int",
-            "gender": "int",  # 1 = male, 0 = female
-            "systolic_bp": "float",
-            "diastolic_bp": "float",
-            "bmi": "float",
-            "waist_circumference": "float",
-            "family_history_hypertension": "int",  # 1 = yes, 0 = no
-            "sodium_intake_mg": "float",  # mg per day
-            "potassium_intake_mg": "float",  # mg per day
-            "physical_activity_minutes": "int",  # minutes per week
-            "smoking_status": "int",  # 0 = never, 1 = former, 2 = current
-            "alcohol_drinks_per_week": "int",
-            "stress_level": "int",  # 0-10 scale
-            "sleep_quality": "int",  # 0-10 scale
-            "diabetes": "int",  # 1 = yes, 0 = no
-            "kidney_disease": "int",  # 1 = yes, 0 = no
-            "heart_rate": "float",
-            "cholesterol_total": "float",
-            "hdl_cholesterol": "float",
-            "ldl_cholesterol": "float",
-            "triglycerides": "float",
-            "glucose_fasting": "float",
-            "caffeine_intake_mg": "float",  # mg per day
-            "meditation_frequency": "int",  # 0-7 times per week
-            "work_stress_level": "int"  # 0-10 scale
-        }
+    def get_required_fields(self) -> Mapping[str, str]:
+        return _HYPERTENSION_REQUIRED_FIELDS
     
-    def get_field_descriptions(self) -> Dict[str, str]:
-        return {
-            "age": "Age in years",
-            "gender": "Gender (1 = Male, 0 = Female)",
-            "systolic_bp": "Current systolic blood pressure (mmHg)",
-            "diastolic_bp": "Current diastolic blood pressure (mmHg)",
-            "bmi": "Body Mass Index",
-            "waist_circumference": "Waist circumference (cm)",
-            "family_history_hypertension": "Family history of hypertension (1 = Yes, 0 = No)",
-            "sodium_intake_mg": "Daily sodium intake (mg)",
-            "potassium_intake_mg": "Daily potassium intake (mg)",
-            "physical_activity_minutes": "Physical activity minutes per week",
-            "smoking_status": "Smoking status (0 = Never, 1 = Former, 2 = Current)",
-            "alcohol_drinks_per_week": "Alcoholic drinks per week",
-            "stress_level": "Overall stress level (0-10)",
-            "sleep_quality": "Sleep quality (0-10, higher is better)",
-            "diabetes": "Diabetes diagnosis (1 = Yes, 0 = No)",
-            "kidney_disease": "Kidney disease (1 = Yes, 0 = No)",
-            "heart_rate": "Resting heart rate (bpm)",
-            "cholesterol_total": "Total cholesterol (mg/dL)",
-            "hdl_cholesterol": "HDL cholesterol (mg/dL)",
-            "ldl_cholesterol": "LDL cholesterol (mg/dL)",
-            "triglycerides": "Triglycerides (mg/dL)",
-            "glucose_fasting": "Fasting glucose (mg/dL)",
-            "caffeine_intake_mg": "Daily caffeine intake (mg)",
-            "meditation_frequency": "Meditation frequency (times per week)",
-            "work_stress_level": "Work-related stress level (0-10)"
-        }
+    def get_field_descriptions(self) -> Mapping[str, str]:
+        return _HYPERTENSION_FIELD_DESCRIPTIONS
     
     def preprocess_data(self, data: Dict[str, Any]) -> np.ndarray:
-        features = [
-            data["age"] / 100.0,
-            data["gender"],
-            data["systolic_bp"] / 200.0,
-            data["diastolic_bp"] / 120.0,
-            data["bmi"] / 50.0,
-            data["waist_circumference"] / 150.0,
-            data["family_history_hypertension"],
-            data["sodium_intake_mg"] / 5000.0,
-            data["potassium_intake_mg"] / 5000.0,
-            data["physical_activity_minutes"] / 300.0,
-            data["smoking_status"] / 2.0,
-            data["alcohol_drinks_per_week"] / 20.0,
-            data["stress_level"] / 10.0,
-            data["sleep_quality"] / 10.0,
-            data["diabetes"],
-            data["kidney_disease"],
-            data["heart_rate"] / 120.0,
-            data["cholesterol_total"] / 400.0,
-            data["hdl_cholesterol"] / 100.0,
-            data["ldl_cholesterol"] / 300.0,
-            data["triglycerides"] / 500.0,
-            data["glucose_fasting"] / 200.0,
-            data["caffeine_intake_mg"] / 1000.0,
-            data["meditation_frequency"] / 7.0,
-            data["work_stress_level"] / 10.0
-        ]
-        return np.array(features)
+        return self._fill_scaled_row(data, self._FEATURE_GETTER, self._FEATURE_SCALES)
 
 class CholesterolRiskPredictor(BasePredictor):
     """Predicts cholesterol and atherosclerosis risk leading to stroke/heart attack"""
@@ -1082,63 +1252,11 @@ class CholesterolRiskPredictor(BasePredictor):
             description="Predicts cholesterol levels and atherosclerosis risk that can lead to stroke or heart attack"
         )
     
-    def get_required_fields(self) -> Dict[str, str]:
-        return {
-            "age": "int",
-            "gender": "int",  # 1 = male, 0 = female
-            "total_cholesterol": "float",  # mg/dL
-            "hdl_cholesterol": "float",  # mg/dL
-            "ldl_cholesterol": "float",  # mg/dL
-            "triglycerides": "float",  # mg/dL
-            "bmi": "float",
-            "waist_circumference": "float",
-            "systolic_bp": "float",
-            "diastolic_bp": "float",
-            "smoking_status": "int",  # 0 = never, 1 = former, 2 = current
-            "family_history_heart_disease": "int",  # 1 = yes, 0 = no
-            "diabetes": "int",  # 1 = yes, 0 = no
-            "physical_activity_level": "int",  # 0-4 scale
-            "saturated_fat_intake": "int",  # 0-4 scale (low to very high)
-            "trans_fat_intake": "int",  # 0-4 scale
-            "fiber_intake_grams": "float",  # grams per day
-            "omega3_intake": "int",  # 0-4 scale
-            "alcohol_consumption": "int",  # 0-4 scale
-            "stress_level": "int",  # 0-10 scale
-            "sleep_hours": "float",
-            "medication_statins": "int",  # 1 = yes, 0 = no
-            "c_reactive_protein": "float",  # mg/L
-            "homocysteine": "float",  # μmol/L
-            "lipoprotein_a": "float"  # mg/dL
-        }
+    def get_required_fields(self) -> Mapping[str, str]:
+        return _CHOLESTEROL_REQUIRED_FIELDS
     
-    def get_field_descriptions(self) -> Dict[str, str]:
-        return {
-            "age": "Age in years",
-            "gender": "Gender (1 = Male, 0 = Female)",
-            "total_cholesterol": "Total cholesterol level (mg/dL)",
-            "hdl_cholesterol": "HDL (good) cholesterol (mg/dL)",
-            "ldl_cholesterol": "LDL (bad) cholesterol (mg/dL)",
-            "triglycerides": "Triglycerides level (mg/dL)",
-            "bmi": "Body Mass Index",
-            "waist_circumference": "Waist circumference (cm)",
-            "systolic_bp": "Systolic blood pressure (mmHg)",
-            "diastolic_bp": "Diastolic blood pressure (mmHg)",
-            "smoking_status": "Smoking status (0 = Never, 1 = Former, 2 = Current)",
-            "family_history_heart_disease": "Family history of heart disease (1 = Yes, 0 = No)",
-            "diabetes": "Diabetes diagnosis (1 = Yes, 0 = No)",
-            "physical_activity_level": "Physical activity level (0-4 scale)",
-            "saturated_fat_intake": "Saturated fat intake level (0 = Low, 1 = Moderate, 2 = High, 3 = Very High, 4 = Excessive)",
-            "trans_fat_intake": "Trans fat intake level (0 = None, 1 = Low, 2 = Moderate, 3 = High, 4 = Very High)",
-            "fiber_intake_grams": "Daily fiber intake (grams)",
-            "omega3_intake": "Omega-3 fatty acid intake (0 = None, 1 = Low, 2 = Moderate, 3 = High, 4 = Very High)",
-            "alcohol_consumption": "Alcohol consumption (0-4 scale)",
-            "stress_level": "Stress level (0-10)",
-            "sleep_hours": "Average sleep hours per night",
-            "medication_statins": "Taking statin medications (1 = Yes, 0 = No)",
-            "c_reactive_protein": "C-reactive protein level (mg/L)",
-            "homocysteine": "Homocysteine level (μmol/L)",
-            "lipoprotein_a": "Lipoprotein(a) level (mg/dL)"
-        }
+    def get_field_descriptions(self) -> Mapping[str, str]:
+        return _CHOLESTEROL_FIELD_DESCRIPTIONS
     
     def preprocess_data(self, data: Dict[str, Any]) -> np.ndarray:
         # Calculate cholesterol ratios
@@ -1174,213 +1292,56 @@ class CholesterolRiskPredictor(BasePredictor):
             data["homocysteine"] / 50.0,
             data["lipoprotein_a"] / 100.0
         ]
-        return np.array(features)
+        return self._fill_row(features)
 
 class MentalHealthPredictor(BasePredictor):
     """Predicts depression and anxiety from surveys, voice, and wearable data"""
     
+    # Model features in schema order, each divided by its scale to land near [0, 1]; flags use 1.0
+    _FEATURE_FIELDS = tuple(_MENTAL_HEALTH_REQUIRED_FIELDS)
+    _FEATURE_GETTER = itemgetter(*_FEATURE_FIELDS)
+    _FEATURE_SCALES = np.array([
+        100.0, 1.0, 27.0, 21.0, 12.0, 10.0, 300.0, 12.0, 10.0, 10.0, 10.0, 1.0, 1.0, 1.0, 10.0, 4.0, 4.0,
+        1000.0, 16.0, 8.0, 100.0, 120.0, 100.0, 200.0, 20.0
+    ])
+    
     def __init__(self):
         super().__init__(
             name="Mental Health Predictor",
             description="Detects depression and anxiety using survey data, voice patterns, and wearable device metrics"
         )
     
-    def get_required_fields(self) -> Dict[str, str]:
-        return {
-            "age": "int",
-            "gender": "int",  # 1 = male, 0 = female
-            "phq9_score": "int",  # Patient Health Questionnaire-9 (0-27)
-            "gad7_score": "int",  # Generalized Anxiety Disorder-7 (0-21)
-            "sleep_hours_per_night": "float",
-            "sleep_quality_score": "int",  # 0-10 scale
-            "physical_activity_minutes": "int",  # per week
-            "social_interaction_hours": "float",  # per day
-            "work_stress_level": "int",  # 0-10 scale
-            "financial_stress_level": "int",  # 0-10 scale
-            "relationship_satisfaction": "int",  # 0-10 scale
-            "family_history_mental_health": "int",  # 1 = yes, 0 = no
-            "chronic_illness": "int",  # 1 = yes, 0 = no
-            "medication_antidepressants": "int",  # 1 = yes, 0 = no
-            "therapy_sessions": "int",  # sessions per month
-            "substance_use": "int",  # 0-4 scale
-            "alcohol_consumption": "int",  # 0-4 scale
-            "caffeine_intake_mg": "float",  # mg per day
-            "screen_time_hours": "float",  # per day
-            "outdoor_time_hours": "float",  # per day
-            "heart_rate_variability": "float",  # from wearable
-            "resting_heart_rate": "float",  # from wearable
-            "voice_pitch_variance": "float",  # voice analysis metric
-            "speech_rate": "float",  # words per minute
-            "pause_frequency": "float"  # pauses per minute in speech
-        }
+    def get_required_fields(self) -> Mapping[str, str]:
+        return _MENTAL_HEALTH_REQUIRED_FIELDS
     
-    def get_field_descriptions(self) -> Dict[str, str]:
-        return {
-            "age": "Age in years",
-            "gender": "Gender (1 = Male, 0 = Female)",
-            "phq9_score": "PHQ-9 Depression Score (0-27, higher indicates more depression)",
-            "gad7_score": "GAD-7 Anxiety Score (0-21, higher indicates more anxiety)",
-            "sleep_hours_per_night": "Average sleep hours per night",
-            "sleep_quality_score": "Sleep quality (0-10, higher is better)",
-            "physical_activity_minutes": "Physical activity minutes per week",
-            "social_interaction_hours": "Social interaction hours per day",
-            "work_stress_level": "Work-related stress (0-10)",
-            "financial_stress_level": "Financial stress (0-10)",
-            "relationship_satisfaction": "Relationship satisfaction (0-10)",
-            "family_history_mental_health": "Family history of mental health issues (1 = Yes, 0 = No)",
-            "chronic_illness": "Chronic illness diagnosis (1 = Yes, 0 = No)",
-            "medication_antidepressants": "Taking antidepressant medication (1 = Yes, 0 = No)",
-            "therapy_sessions": "Therapy sessions per month",
-            "substance_use": "Substance use level (0-4 scale)",
-            "alcohol_consumption": "Alcohol consumption (0-4 scale)",
-            "caffeine_intake_mg": "Daily caffeine intake (mg)",
-            "screen_time_hours": "Daily screen time (hours)",
-            "outdoor_time_hours": "Daily outdoor time (hours)",
-            "heart_rate_variability": "Heart rate variability (from wearable device)",
-            "resting_heart_rate": "Resting heart rate (bpm)",
-            "voice_pitch_variance": "Voice pitch variance (voice analysis metric)",
-            "speech_rate": "Speech rate (words per minute)",
-            "pause_frequency": "Speech pause frequency (pauses per minute)"
-        }
+    def get_field_descriptions(self) -> Mapping[str, str]:
+        return _MENTAL_HEALTH_FIELD_DESCRIPTIONS
     
     def preprocess_data(self, data: Dict[str, Any]) -> np.ndarray:
-        features = [
-            data["age"] / 100.0,
-            data["gender"],
-            data["phq9_score"] / 27.0,
-            data["gad7_score"] / 21.0,
-            data["sleep_hours_per_night"] / 12.0,
-            data["sleep_quality_score"] / 10.0,
-            data["physical_activity_minutes"] / 300.0,
-            data["social_interaction_hours"] / 12.0,
-            data["work_stress_level"] / 10.0,
-            data["financial_stress_level"] / 10.0,
-            data["relationship_satisfaction"] / 10.0,
-            data["family_history_mental_health"],
-            data["chronic_illness"],
-            data["medication_antidepressants"],
-            data["therapy_sessions"] / 10.0,
-            data["substance_use"] / 4.0,
-            data["alcohol_consumption"] / 4.0,
-            data["caffeine_intake_mg"] / 1000.0,
-            data["screen_time_hours"] / 16.0,
-            data["outdoor_time_hours"] / 8.0,
-            data["heart_rate_variability"] / 100.0,
-            data["resting_heart_rate"] / 120.0,
-            data["voice_pitch_variance"] / 100.0,
-            data["speech_rate"] / 200.0,
-            data["pause_frequency"] / 20.0
-        ]
-        return np.array(features)
+        return self._fill_scaled_row(data, self._FEATURE_GETTER, self._FEATURE_SCALES)
 
 class SleepApneaPredictor(BasePredictor):
     """Predicts sleep apnea and sleep disorders using wearable or questionnaire data"""
     
+    # Model features in schema order, each divided by its scale to land near [0, 1]; flags use 1.0
+    _FEATURE_FIELDS = tuple(_SLEEP_APNEA_REQUIRED_FIELDS)
+    _FEATURE_GETTER = itemgetter(*_FEATURE_FIELDS)
+    _FEATURE_SCALES = np.array([
+        100.0, 1.0, 50.0, 50.0, 7.0, 4.0, 1.0, 1.0, 7.0, 24.0, 10.0, 10.0, 12.0, 100.0, 120.0, 120.0, 100.0,
+        100.0, 100.0, 120.0, 200.0, 120.0, 1.0, 1.0, 1.0, 1.0, 1.0, 2.0, 10.0, 3.0
+    ])
+    
     def __init__(self):
         super().__init__(
             name="Sleep Apnea & Sleep Disorder Predictor",
             description="Predicts sleep apnea and other sleep disorders using wearable data or questionnaire responses"
         )
     
-    def get_required_fields(self) -> Dict[str, str]:
-        return {
-            "age": "int",
-            "gender": "int",  # 1 = male, 0 = female
-            "bmi": "float",
-            "neck_circumference": "float",  # cm
-            "snoring_frequency": "int",  # 0-7 nights per week
-            "snoring_loudness": "int",  # 0-4 scale
-            "witnessed_apneas": "int",  # 1 = yes, 0 = no
-            "gasping_choking": "int",  # 1 = yes, 0 = no
-            "morning_headaches": "int",  # 0-7 days per week
-            "daytime_sleepiness": "int",  # Epworth Sleepiness Scale (0-24)
-            "fatigue_level": "int",  # 0-10 scale
-            "concentration_problems": "int",  # 0-10 scale
-            "sleep_duration_hours": "float",
-            "sleep_efficiency": "float",  # percentage
-            "sleep_latency_minutes": "float",  # time to fall asleep
-            "wake_after_sleep_onset": "float",  # minutes
-            "rem_sleep_percentage": "float",
-            "deep_sleep_percentage": "float",
-            "oxygen_saturation_min": "float",  # minimum SpO2 during sleep
-            "heart_rate_during_sleep": "float",  # average
-            "blood_pressure_systolic": "float",
-            "blood_pressure_diastolic": "float",
-            "diabetes": "int",  # 1 = yes, 0 = no
-            "heart_disease": "int",  # 1 = yes, 0 = no
-            "stroke_history": "int",  # 1 = yes, 0 = no
-            "family_history_sleep_apnea": "int",  # 1 = yes, 0 = no
-            "alcohol_before_bed": "int",  # 1 = yes, 0 = no
-            "smoking_status": "int",  # 0 = never, 1 = former, 2 = current
-            "nasal_congestion": "int",  # 0-10 scale
-            "sleep_position": "int"  # 1 = back, 2 = side, 3 = stomach
-        }
+    def get_required_fields(self) -> Mapping[str, str]:
+        return _SLEEP_APNEA_REQUIRED_FIELDS
     
-    def get_field_descriptions(self) -> Dict[str, str]:
-        return {
-            "age": "Age in years",
-            "gender": "Gender (1 = Male, 0 = Female)",
-            "bmi": "Body Mass Index",
-            "neck_circumference": "Neck circumference (cm)",
-            "snoring_frequency": "Snoring frequency (nights per week)",
-            "snoring_loudness": "Snoring loudness (0 = None, 1 = Soft, 2 = Moderate, 3 = Loud, 4 = Very Loud)",
-            "witnessed_apneas": "Witnessed breathing pauses during sleep (1 = Yes, 0 = No)",
-            "gasping_choking": "Gasping or choking during sleep (1 = Yes, 0 = No)",
-            "morning_headaches": "Morning headaches frequency (days per week)",
-            "daytime_sleepiness": "Epworth Sleepiness Scale score (0-24)",
-            "fatigue_level": "Fatigue level (0-10)",
-            "concentration_problems": "Concentration problems (0-10)",
-            "sleep_duration_hours": "Average sleep duration (hours)",
-            "sleep_efficiency": "Sleep efficiency percentage (%)",
-            "sleep_latency_minutes": "Time to fall asleep (minutes)",
-            "wake_after_sleep_onset": "Wake time after sleep onset (minutes)",
-            "rem_sleep_percentage": "REM sleep percentage (%)",
-            "deep_sleep_percentage": "Deep sleep percentage (%)",
-            "oxygen_saturation_min": "Minimum oxygen saturation during sleep (%)",
-            "heart_rate_during_sleep": "Average heart rate during sleep (bpm)",
-            "blood_pressure_systolic": "Systolic blood pressure (mmHg)",
-            "blood_pressure_diastolic": "Diastolic blood pressure (mmHg)",
-            "diabetes": "Diabetes diagnosis (1 = Yes, 0 = No)",
-            "heart_disease": "Heart disease (1 = Yes, 0 = No)",
-            "stroke_history": "History of stroke (1 = Yes, 0 = No)",
-            "family_history_sleep_apnea": "Family history of sleep apnea (1 = Yes, 0 = No)",
-            "alcohol_before_bed": "Alcohol consumption before bed (1 = Yes, 0 = No)",
-            "smoking_status": "Smoking status (0 = Never, 1 = Former, 2 = Current)",
-            "nasal_congestion": "Nasal congestion level (0-10)",
-            "sleep_position": "Primary sleep position (1 = Back, 2 = Side, 3 = Stomach)"
-        }
+    def get_field_descriptions(self) -> Mapping[str, str]:
+        return _SLEEP_APNEA_FIELD_DESCRIPTIONS
     
     def preprocess_data(self, data: Dict[str, Any]) -> np.ndarray:
-        features = [
-            data["age"] / 100.0,
-            data["gender"],
-            data["bmi"] / 50.0,
-            data["neck_circumference"] / 50.0,
-            data["snoring_frequency"] / 7.0,
-            data["snoring_loudness"] / 4.0,
-            data["witnessed_apneas"],
-            data["gasping_choking"],
-            data["morning_headaches"] / 7.0,
-            data["daytime_sleepiness"] / 24.0,
-            data["fatigue_level"] / 10.0,
-            data["concentration_problems"] / 10.0,
-            data["sleep_duration_hours"] / 12.0,
-            data["sleep_efficiency"] / 100.0,
-            data["sleep_latency_minutes"] / 120.0,
-            data["wake_after_sleep_onset"] / 120.0,
-            data["rem_sleep_percentage"] / 100.0,
-            data["deep_sleep_percentage"] / 100.0,
-            data["oxygen_saturation_min"] / 100.0,
-            data["heart_rate_during_sleep"] / 120.0,
-            data["blood_pressure_systolic"] / 200.0,
-            data["blood_pressure_diastolic"] / 120.0,
-            data["diabetes"],
-            data["heart_disease"],
-            data["stroke_history"],
-            data["family_history_sleep_apnea"],
-            data["alcohol_before_bed"],
-            data["smoking_status"] / 2.0,
-            data["nasal_congestion"] / 10.0,
-            data["sleep_position"] / 3.0
-        ]
-        return np.array(features)
\ No newline at end of file
+        return self._fill_scaled_row(data, self._FEATURE_GETTER, self._FEATURE_SCALES)
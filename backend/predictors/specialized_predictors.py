@@ -1,133 +1,404 @@
 import numpy as np
-from typing import Dict, List, Any
+from operator import itemgetter
+from types import MappingProxyType
+from typing import Dict, List, Any, Mapping
 from .base_predictor import BasePredictor
 
+# Read-only field schemas, returned as-is by get_required_fields() and get_field_descriptions()
+_COVID_REQUIRED_FIELDS = MappingProxyType({
+    "age": "int",
+    "gender": "int",  # 1 = male, 0 = female
+    "bmi": "float",
+    "temperature": "float",  # Celsius
+    "oxygen_saturation": "float",  # percentage
+    "heart_rate": "float",
+    "respiratory_rate": "float",
+    "blood_pressure_systolic": "float",
+    "blood_pressure_diastolic": "float",
+    "cough": "int",  # 1 = yes, 0 = no
+    "shortness_of_breath": "int",  # 1 = yes, 0 = no
+    "fatigue": "int",  # 0-10 scale
+    "fever_duration_days": "int",
+    "loss_of_taste_smell": "int",  # 1 = yes, 0 = no
+    "chest_pain": "int",  # 1 = yes, 0 = no
+    "headache": "int",  # 1 = yes, 0 = no
+    "muscle_aches": "int",  # 1 = yes, 0 = no
+    "diabetes": "int",  # 1 = yes, 0 = no
+    "hypertension": "int",  # 1 = yes, 0 = no
+    "heart_disease": "int",  # 1 = yes, 0 = no
+    "lung_disease": "int",  # 1 = yes, 0 = no
+    "kidney_disease": "int",  # 1 = yes, 0 = no
+    "liver_disease": "int",  # 1 = yes, 0 = no
+    "cancer": "int",  # 1 = yes, 0 = no
+    "immunocompromised": "int",  # 1 = yes, 0 = no
+    "vaccination_status": "int",  # 0 = none, 1 = partial, 2 = full, 3 = boosted
+    "smoking_status": "int",  # 0 = never, 1 = former, 2 = current
+    "white_blood_cells": "float",  # cells/μL
+    "lymphocytes": "float",  # cells/μL
+    "platelets": "float",  # cells/μL
+    "c_reactive_protein": "float",  # mg/L
+    "d_dimer": "float",  # mg/L
+    "lactate_dehydrogenase": "float",  # U/L
+    "ferritin": "float",  # ng/mL
+    "procalcitonin": "float"  # ng/mL
+})
+
+_COVID_FIELD_DESCRIPTIONS = MappingProxyType({
+    "age": "Age in years",
+    "gender": "Gender (1 = Male, 0 = Female)",
+    "bmi": "Body Mass Index",
+    "temperature": "Body temperature (Celsius)",
+    "oxygen_saturation": "Oxygen saturation (%)",
+    "heart_rate": "Heart rate (bpm)",
+    "respiratory_rate": "Respiratory rate (breaths per minute)",
+    "blood_pressure_systolic": "Systolic blood pressure (mmHg)",
+    "blood_pressure_diastolic": "Diastolic blood pressure (mmHg)",
+    "cough": "Presence of cough (1 = Yes, 0 = No)",
+    "shortness_of_breath": "Shortness of breath (1 = Yes, 0 = No)",
+    "fatigue": "Fatigue level (0-10)",
+    "fever_duration_days": "Duration of fever (days)",
+    "loss_of_taste_smell": "Loss of taste or smell (1 = Yes, 0 = No)",
+    "chest_pain": "Chest pain (1 = Yes, 0 = No)",
+    "headache": "Headache (1 = Yes, 0 = No)",
+    "muscle_aches": "Muscle aches (1 = Yes, 0 = No)",
+    "diabetes": "Diabetes (1 = Yes, 0 = No)",
+    "hypertension": "Hypertension (1 = Yes, 0 = No)",
+    "heart_disease": "Heart disease (1 = Yes, 0 = No)",
+    "lung_disease": "Lung disease (1 = Yes, 0 = No)",
+    "kidney_disease": "Kidney disease (1 = Yes, 0 = No)",
+    "liver_disease": "Liver disease (1 = Yes, 0 = No)",
+    "cancer": "Cancer diagnosis (1 = Yes, 0 = No)",
+    "immunocompromised": "Immunocompromised status (1 = Yes, 0 = No)",
+    "vaccination_status": "COVID-19 vaccination status (0 = None, 1 = Partial, 2 = Full, 3 = Boosted)",
+    "smoking_status": "Smoking status (0 = Never, 1 = Former, 2 = Current)",
+    "white_blood_cells": "White blood cell count (cells/μL)",
+    "lymphocytes": "Lymphocyte count (cells/μL)",
+    "platelets": "Platelet count (cells/μL)",
+    "c_reactive_protein": "C-reactive protein (mg/L)",
+    "d_dimer": "D-dimer (mg/L)",
+    "lactate_dehydrogenase": "Lactate dehydrogenase (U/L)",
+    "ferritin": "Ferritin (ng/mL)",
+    "procalcitonin": "Procalcitonin (ng/mL)"
+})
+
+_ASTHMA_COPD_REQUIRED_FIELDS = MappingProxyType({
+    "age": "int",
+    "gender": "int",  # 1 = male, 0 = female
+    "smoking_pack_years": "float",
+    "current_smoking_status": "int",  # 0 = never, 1 = former, 2 = current
+    "occupational_exposure": "int",  # 1 = yes, 0 = no
+    "family_history_respiratory": "int",  # 1 = yes, 0 = no
+    "fev1_percent_predicted": "float",  # Forced Expiratory Volume
+    "fvc_percent_predicted": "float",  # Forced Vital Capacity
+    "fev1_fvc_ratio": "float",
+    "peak_flow_rate": "float",  # L/min
+    "oxygen_saturation_rest": "float",
+    "oxygen_saturation_exercise": "float",
+    "shortness_of_breath_scale": "int",  # 0-4 mMRC scale
+    "cough_frequency": "int",  # 0-4 scale
+    "sputum_production": "int",  # 0-4 scale
+    "wheezing_frequency": "int",  # 0-4 scale
+    "chest_tightness": "int",  # 0-4 scale
+    "exercise_tolerance": "int",  # 0-4 scale
+    "sleep_disturbance": "int",  # 0-4 scale
+    "rescue_inhaler_use": "int",  # uses per week
+    "exacerbations_last_year": "int",
+    "hospitalizations_last_year": "int",
+    "steroid_courses_last_year": "int",
+    "allergies": "int",  # 1 = yes, 0 = no
+    "eosinophil_count": "float",  # cells/μL
+    "ige_level": "float",  # IU/mL
+    "vitamin_d_level": "float",  # ng/mL
+    "bmi": "float",
+    "air_quality_exposure": "int",  # 0-4 scale
+    "seasonal_variation": "int",  # 1 = yes, 0 = no
+    "medication_adherence": "int"  # 0-4 scale
+})
+
+_ASTHMA_COPD_FIELD_DESCRIPTIONS = MappingProxyType({
+    "age": "Age in years",
+    "gender": "Gender (1 = Male, 0 = Female)",
+    "smoking_pack_years": "Smoking history (pack-years)",
+    "current_smoking_status": "Current smoking status (0 = Never, 1 = Former, 2 = Current)",
+    "occupational_exposure": "Occupational exposure to irritants (1 = Yes, 0 = No)",
+    "family_history_respiratory": "Family history of respiratory disease (1 = Yes, 0 = No)",
+    "fev1_percent_predicted": "FEV1 as percentage of predicted value (%)",
+    "fvc_percent_predicted": "FVC as percentage of predicted value (%)",
+    "fev1_fvc_ratio": "FEV1/FVC ratio",
+    "peak_flow_rate": "Peak expiratory flow rate (L/min)",
+    "oxygen_saturation_rest": "Oxygen saturation at rest (%)",
+    "oxygen_saturation_exercise": "Oxygen saturation during exercise (%)",
+    "shortness_of_breath_scale": "mMRC Dyspnea Scale (0-4)",
+    "cough_frequency": "Cough frequency (0 = None, 1 = Rare, 2 = Occasional, 3 = Frequent, 4 = Constant)",
+    "sputum_production": "Sputum production (0-4 scale)",
+    "wheezing_frequency": "Wheezing frequency (0-4 scale)",
+    "chest_tightness": "Chest tightness (0-4 scale)",
+    "exercise_tolerance": "Exercise tolerance (0 = Poor, 4 = Excellent)",
+    "sleep_disturbance": "Sleep disturbance due to symptoms (0-4 scale)",
+    "rescue_inhaler_use": "Rescue inhaler uses per week",
+    "exacerbations_last_year": "Number of exacerbations in the last year",
+    "hospitalizations_last_year": "Hospitalizations in the last year",
+    "steroid_courses_last_year": "Oral steroid courses in the last year",
+    "allergies": "Known allergies (1 = Yes, 0 = No)",
+    "eosinophil_count": "Eosinophil count (cells/μL)",
+    "ige_level": "Total IgE level (IU/mL)",
+    "vitamin_d_level": "Vitamin D level (ng/mL)",
+    "bmi": "Body Mass Index",
+    "air_quality_exposure": "Air quality exposure (0 = Excellent, 4 = Very Poor)",
+    "seasonal_variation": "Seasonal symptom variation (1 = Yes, 0 = No)",
+    "medication_adherence": "Medication adherence (0 = Poor, 4 = Excellent)"
+})
+
+_ANEMIA_REQUIRED_FIELDS = MappingProxyType({
+    "age": "int",
+    "gender": "int",  # 1 = male, 0 = female
+    "hemoglobin": "float",  # g/dL
+    "hematocrit": "float",  # percentage
+    "red_blood_cell_count": "float",  # million cells/μL
+    "mean_corpuscular_volume": "float",  # fL
+    "mean_corpuscular_hemoglobin": "float",  # pg
+    "mean_corpuscular_hemoglobin_concentration": "float",  # g/dL
+    "red_cell_distribution_width": "float",  # percentage
+    "reticulocyte_count": "float",  # percentage
+    "serum_iron": "float",  # μg/dL
+    "total_iron_binding_capacity": "float",  # μg/dL
+    "transferrin_saturation": "float",  # percentage
+    "ferritin": "float",  # ng/mL
+    "vitamin_b12": "float",  # pg/mL
+    "folate": "float",  # ng/mL
+    "lactate_dehydrogenase": "float",  # U/L
+    "bilirubin_total": "float",  # mg/dL
+    "bilirubin_indirect": "float",  # mg/dL
+    "haptoglobin": "float",  # mg/dL
+    "fatigue_level": "int",  # 0-10 scale
+    "shortness_of_breath": "int",  # 1 = yes, 0 = no
+    "pale_skin": "int",  # 1 = yes, 0 = no
+    "cold_hands_feet": "int",  # 1 = yes, 0 = no
+    "brittle_nails": "int",  # 1 = yes, 0 = no
+    "strange_cravings": "int",  # 1 = yes, 0 = no (ice, starch, etc.)
+    "heavy_menstrual_periods": "int",  # 1 = yes, 0 = no/not applicable
+    "gastrointestinal_bleeding": "int",  # 1 = yes, 0 = no
+    "chronic_kidney_disease": "int",  # 1 = yes, 0 = no
+    "chronic_inflammatory_disease": "int",  # 1 = yes, 0 = no
+    "family_history_anemia": "int",  # 1 = yes, 0 = no
+    "vegetarian_diet": "int",  # 1 = yes, 0 = no
+    "alcohol_consumption": "int"  # 0-4 scale
+})
+
+_ANEMIA_FIELD_DESCRIPTIONS = MappingProxyType({
+    "age": "Age in years",
+    "gender": "Gender (1 = Male, 0 = Female)",
+    "hemoglobin": "Hemoglobin level (g/dL)",
+    "hematocrit": "Hematocrit percentage (%)",
+    "red_blood_cell_count": "Red blood cell count (million cells/μL)",
+    "mean_corpuscular_volume": "Mean corpuscular volume (fL)",
+    "mean_corpuscular_hemoglobin": "Mean corpuscular hemoglobin (pg)",
+    "mean_corpuscular_hemoglobin_concentration": "MCHC (g/dL)",
+    "red_cell_distribution_width": "Red cell distribution width (%)",
+    "reticulocyte_count": "Reticulocyte count (%)",
+    "serum_iron": "Serum iron level (μg/dL)",
+    "total_iron_binding_capacity": "Total iron binding capacity (μg/dL)",
+    "transferrin_saturation": "Transferrin saturation (%)",
+    "ferritin": "Ferritin level (ng/mL)",
+    "vitamin_b12": "Vitamin B12 level (pg/mL)",
+    "folate": "Folate level (ng/mL)",
+    "lactate_dehydrogenase": "LDH level (U/L)",
+    "bilirubin_total": "Total bilirubin (mg/dL)",
+    "bilirubin_indirect": "Indirect bilirubin (mg/dL)",
+    "haptoglobin": "Haptoglobin level (mg/dL)",
+    "fatigue_level": "Fatigue level (0-10)",
+    "shortness_of_breath": "Shortness of breath (1 = Yes, 0 = No)",
+    "pale_skin": "Pale skin (1 = Yes, 0 = No)",
+    "cold_hands_feet": "Cold hands and feet (1 = Yes, 0 = No)",
+    "brittle_nails": "Brittle or spoon-shaped nails (1 = Yes, 0 = No)",
+    "strange_cravings": "Cravings for ice, starch, or non-food items (1 = Yes, 0 = No)",
+    "heavy_menstrual_periods": "Heavy menstrual periods (1 = Yes, 0 = No/Not applicable)",
+    "gastrointestinal_bleeding": "History of GI bleeding (1 = Yes, 0 = No)",
+    "chronic_kidney_disease": "Chronic kidney disease (1 = Yes, 0 = No)",
+    "chronic_inflammatory_disease": "Chronic inflammatory disease (1 = Yes, 0 = No)",
+    "family_history_anemia": "Family history of anemia (1 = Yes, 0 = No)",
+    "vegetarian_diet": "Vegetarian or vegan diet (1 = Yes, 0 = No)",
+    "alcohol_consumption": "Alcohol consumption (0-4 scale)"
+})
+
+_THYROID_REQUIRED_FIELDS = MappingProxyType({
+    "age": "int",
+    "gender": "int",  # 1 = male, 0 = female
+    "tsh": "float",  # mIU/L
+    "free_t4": "float",  # ng/dL
+    "free_t3": "float",  # pg/mL
+    "total_t4": "float",  # μg/dL
+    "total_t3": "float",  # ng/dL
+    "thyroid_peroxidase_antibody": "float",  # IU/mL
+    "thyroglobulin_antibody": "float",  # IU/mL
+    "tsh_receptor_antibody": "float",  # IU/L
+    "weight_change_kg": "float",  # positive = gain, negative = loss
+    "heart_rate": "float",
+    "blood_pressure_systolic": "float",
+    "blood_pressure_diastolic": "float",
+    "body_temperature": "float",  # Celsius
+    "fatigue_level": "int",  # 0-10 scale
+    "anxiety_level": "int",  # 0-10 scale
+    "depression_symptoms": "int",  # 0-10 scale
+    "sleep_quality": "int",  # 0-10 scale
+    "hair_loss": "int",  # 1 = yes, 0 = no
+    "dry_skin": "int",  # 1 = yes, 0 = no
+    "cold_intolerance": "int",  # 1 = yes, 0 = no
+    "heat_intolerance": "int",  # 1 = yes, 0 = no
+    "constipation": "int",  # 1 = yes, 0 = no
+    "diarrhea": "int",  # 1 = yes, 0 = no
+    "muscle_weakness": "int",  # 1 = yes, 0 = no
+    "tremor": "int",  # 1 = yes, 0 = no
+    "goiter": "int",  # 1 = yes, 0 = no
+    "eye_problems": "int",  # 1 = yes, 0 = no
+    "menstrual_irregularities": "int",  # 1 = yes, 0 = no/not applicable
+    "family_history_thyroid": "int",  # 1 = yes, 0 = no
+    "autoimmune_disease": "int",  # 1 = yes, 0 = no
+    "iodine_intake": "int",  # 0-4 scale
+    "stress_level": "int",  # 0-10 scale
+    "smoking_status": "int"  # 0 = never, 1 = former, 2 = current
+})
+
+_THYROID_FIELD_DESCRIPTIONS = MappingProxyType({
+    "age": "Age in years",
+    "gender": "Gender (1 = Male, 0 = Female)",
+    "tsh": "Thyroid Stimulating Hormone (mIU/L)",
+    "free_t4": "Free T4 (ng/dL)",
+    "free_t3": "Free T3 (pg/mL)",
+    "total_t4": "Total T4 (μg/dL)",
+    "total_t3": "Total T3 (ng/dL)",
+    "thyroid_peroxidase_antibody": "Anti-TPO antibody (IU/mL)",
+    "thyroglobulin_antibody": "Anti-thyroglobulin antibody (IU/mL)",
+    "tsh_receptor_antibody": "TSH receptor antibody (IU/L)",
+    "weight_change_kg": "Weight change in last 6 months (kg, + = gain, - = loss)",
+    "heart_rate": "Resting heart rate (bpm)",
+    "blood_pressure_systolic": "Systolic blood pressure (mmHg)",
+    "blood_pressure_diastolic": "Diastolic blood pressure (mmHg)",
+    "body_temperature": "Average body temperature (Celsius)",
+    "fatigue_level": "Fatigue level (0-10)",
+    "anxiety_level": "Anxiety level (0-10)",
+    "depression_symptoms": "Depression symptoms (0-10)",
+    "sleep_quality": "Sleep quality (0-10, higher is better)",
+    "hair_loss": "Hair loss or thinning (1 = Yes, 0 = No)",
+    "dry_skin": "Dry skin (1 = Yes, 0 = No)",
+    "cold_intolerance": "Cold intolerance (1 = Yes, 0 = No)",
+    "heat_intolerance": "Heat intolerance (1 = Yes, 0 = No)",
+    "constipation": "Constipation (1 = Yes, 0 = No)",
+    "diarrhea": "Diarrhea (1 = Yes, 0 = No)",
+    "muscle_weakness": "Muscle weakness (1 = Yes, 0 = No)",
+    "tremor": "Hand tremor (1 = Yes, 0 = No)",
+    "goiter": "Enlarged thyroid (goiter) (1 = Yes, 0 = No)",
+    "eye_problems": "Eye problems (bulging, dryness) (1 = Yes, 0 = No)",
+    "menstrual_irregularities": "Menstrual irregularities (1 = Yes, 0 = No/Not applicable)",
+    "family_history_thyroid": "Family history of thyroid disease (1 = Yes, 0 = No)",
+    "autoimmune_disease": "Other autoimmune diseases (1 = Yes, 0 = No)",
+    "iodine_intake": "Iodine intake level (0 = Low, 1 = Normal, 2 = High, 3 = Very High, 4 = Excessive)",
+    "stress_level": "Stress level (0-10)",
+    "smoking_status": "Smoking status (0 = Never, 1 = Former, 2 = Current)"
+})
+
+_CANCER_RECURRENCE_REQUIRED_FIELDS = MappingProxyType({
+    "age_at_diagnosis": "int",
+    "gender": "int",  # 1 = male, 0 = female
+    "cancer_type": "int",  # 0 = breast, 1 = lung, 2 = colon, 3 = prostate, 4 = other
+    "cancer_stage": "int",  # 1-4
+    "tumor_size_cm": "float",
+    "lymph_nodes_positive": "int",
+    "lymph_nodes_examined": "int",
+    "histologic_grade": "int",  # 1-3
+    "hormone_receptor_positive": "int",  # 1 = yes, 0 = no/not applicable
+    "her2_positive": "int",  # 1 = yes, 0 = no/not applicable
+    "ki67_percentage": "float",  # proliferation marker
+    "months_since_treatment": "int",
+    "treatment_surgery": "int",  # 1 = yes, 0 = no
+    "treatment_chemotherapy": "int",  # 1 = yes, 0 = no
+    "treatment_radiation": "int",  # 1 = yes, 0 = no
+    "treatment_hormone_therapy": "int",  # 1 = yes, 0 = no
+    "treatment_immunotherapy": "int",  # 1 = yes, 0 = no
+    "treatment_targeted_therapy": "int",  # 1 = yes, 0 = no
+    "complete_response": "int",  # 1 = yes, 0 = no
+    "cea_level": "float",  # ng/mL (carcinoembryonic antigen)
+    "ca_125_level": "float",  # U/mL
+    "ca_19_9_level": "float",  # U/mL
+    "psa_level": "float",  # ng/mL (for prostate cancer)
+    "circulating_tumor_cells": "int",  # cells per 7.5 mL
+    "family_history_cancer": "int",  # 1 = yes, 0 = no
+    "genetic_mutations": "int",  # 1 = yes, 0 = no (BRCA, p53, etc.)
+    "smoking_status": "int",  # 0 = never, 1 = former, 2 = current
+    "alcohol_consumption": "int",  # 0-4 scale
+    "bmi": "float",
+    "physical_activity_level": "int",  # 0-4 scale
+    "stress_level": "int",  # 0-10 scale
+    "sleep_quality": "int",  # 0-10 scale
+    "immune_function_score": "int",  # 0-10 scale
+    "comorbidities_count": "int",
+    "medication_adherence": "int"  # 0-4 scale
+})
+
+_CANCER_RECURRENCE_FIELD_DESCRIPTIONS = MappingProxyType({
+    "age_at_diagnosis": "Age at initial cancer diagnosis",
+    "gender": "Gender (1 = Male, 0 = Female)",
+    "cancer_type": "Cancer type (0 = Breast, 1 = Lung, 2 = Colon, 3 = Prostate, 4 = Other)",
+    "cancer_stage": "Cancer stage at diagnosis (1-4)",
+    "tumor_size_cm": "Primary tumor size (cm)",
+    "lymph_nodes_positive": "Number of positive lymph nodes",
+    "lymph_nodes_examined": "Total lymph nodes examined",
+    "histologic_grade": "Histologic grade (1 = Well differentiated, 2 = Moderately differentiated, 3 = Poorly differentiated)",
+    "hormone_receptor_positive": "Hormone receptor positive (1 = Yes, 0 = No/Not applicable)",
+    "her2_positive": "HER2 positive (1 = Yes, 0 = No/Not applicable)",
+    "ki67_percentage": "Ki-67 proliferation index (%)",
+    "months_since_treatment": "Months since treatment completion",
+    "treatment_surgery": "Received surgery (1 = Yes, 0 = No)",
+    "treatment_chemotherapy": "Received chemotherapy (1 = Yes, 0 = No)",
+    "treatment_radiation": "Received radiation therapy (1 = Yes, 0 = No)",
+    "treatment_hormone_therapy": "Received hormone therapy (1 = Yes, 0 = No)",
+    "treatment_immunotherapy": "Received immunotherapy (1 = Yes, 0 = No)",
+    "treatment_targeted_therapy": "Received targeted therapy (1 = Yes, 0 = No)",
+    "complete_response": "Achieved complete response (1 = Yes, 0 = No)",
+    "cea_level": "CEA tumor marker level (ng/mL)",
+    "ca_125_level": "CA-125 tumor marker level (U/mL)",
+    "ca_19_9_level": "CA 19-9 tumor marker level (U/mL)",
+    "psa_level": "PSA level for prostate cancer (ng/mL)",
+    "circulating_tumor_cells": "Circulating tumor cells count (per 7.5 mL)",
+    "family_history_cancer": "Family history of cancer (1 = Yes, 0 = No)",
+    "genetic_mutations": "Known cancer-related genetic mutations (1 = Yes, 0 = No)",
+    "smoking_status": "Smoking status (0 = Never, 1 = Former, 2 = Current)",
+    "alcohol_consumption": "Alcohol consumption (0-4 scale)",
+    "bmi": "Body Mass Index",
+    "physical_activity_level": "Physical activity level (0-4 scale)",
+    "stress_level": "Stress level (0-10)",
+    "sleep_quality": "Sleep quality (0-10)",
+    "immune_function_score": "Immune function assessment (0-10)",
+    "comorbidities_count": "Number of comorbid conditions",
+    "medication_adherence": "Medication adherence (0-4 scale)"
+})
+
 class CovidRiskPredictor(BasePredictor):
     """Predicts COVID-19 severity and hospitalization risk"""
     
+    # Model features in schema order, each divided by its scale to land near [0, 1]; flags use 1.0
+    _FEATURE_FIELDS = tuple(_COVID_REQUIRED_FIELDS)
+    _FEATURE_GETTER = itemgetter(*_FEATURE_FIELDS)
+    _FEATURE_SCALES = np.array([
+        100.0, 1.0, 50.0, 42.0, 100.0, 150.0, 40.0, 200.0, 120.0, 1.0, 1.0, 10.0, 14.0, 1.0, 1.0, 1.0, 1.0,
+        1.0, 1.0, 1.0, 1.0, 1.0, 1.0, 1.0, 1.0, 3.0, 2.0, 15000.0, 4000.0, 500000.0, 200.0, 10.0, 1000.0,
+        5000.0, 10.0
+    ])
+    
     def __init__(self):
         super().__init__(
             name="COVID-19 / Infectious Disease Predictor",
             description="Predicts COVID-19 severity, hospitalization risk, and outcomes for infectious diseases"
         )
     
-    def get_required_fields(self) -> Dict[str, str]:
-        return {
-            "age": "int",
-            "gender": "int",  # 1 = male, 0 = female
-            "bmi": "float",
-            "temperature": "float",  # Celsius
-            "oxygen_saturation": "float",  # percentage
-            "heart_rate": "float",
-            "respiratory_rate": "float",
-            "blood_pressure_systolic": "float",
-            "blood_pressure_diastolic": "float",
-            "cough": "int",  # 1 = yes, 0 = no
-            "shortness_of_breath": "int",  # 1 = yes, 0 = no
-            "fatigue": "int",  # 0-10 scale
-            "fever_duration_days": "int",
-            "loss_of_taste_smell": "int",  # 1 = yes, 0 = no
-            "chest_pain": "int",  # 1 = yes, 0 = no
-            "headache": "int",  # 1 = yes, 0 = no
-            "muscle_aches": "int",  # 1 = yes, 0 = no
-            "diabetes": "int",  # 1 = yes, 0 = no
-            "hypertension": "int",  # 1 = yes, 0 = no
-            "heart_disease": "int",  # 1 = yes, 0 = no
-            "lung_disease": "int",  # 1 = yes, 0 = no
-            "kidney_disease": "int",  # 1 = yes, 0 = no
-            "liver_disease": "int",  # 1 = yes, 0 = no
-            "cancer": "int",  # 1 = yes, 0 = no
-            "immunocompromised": "int",  # 1 = yes, 0 = no
-            "vaccination_status": "int",  # 0 = none, 1 = partial, 2 = full, 3 = boosted
-            "smoking_status": "int",  # 0 = never, 1 = former, 2 = current
-            "white_blood_cells": "float",  # cells/μL
-            "lymphocytes": "float",  # cells/μL
-            "platelets": "float",  # cells/μL
-            "c_reactive_protein": "float",  # mg/L
-            "d_dimer": "float",  # mg/L
-            "lactate_dehydrogenase": "float",  # U/L
-            "ferritin": "float",  # ng/mL
-            "procalcitonin": "float"  # ng/mL
-        }
+    def get_required_fields(self) -> Mapping[str, str]:
+        return _COVID_REQUIRED_FIELDS
     
-    def get_field_descriptions(self) -> Dict[str, str]:
-        return {
-            "age": "Age in years",
-            "gender": "Gender (1 = Male, 0 = Female)",
-            "bmi": "Body Mass Index",
-            "temperature": "Body temperature (Celsius)",
-            "oxygen_saturation": "Oxygen saturation (%)",
-            "heart_rate": "Heart rate (bpm)",
-            "respiratory_rate": "Respiratory rate (breaths per minute)",
-            "blood_pressure_systolic": "Systolic blood pressure (mmHg)",
-            "blood_pressure_diastolic": "Diastolic blood pressure (mmHg)",
-            "cough": "Presence of cough (1 = Yes, 0 = No)",
-            "shortness_of_breath": "Shortness of breath (1 = Yes, 0 = No)",
-            "fatigue": "Fatigue level (0-10)",
-            "fever_duration_days": "Duration of fever (days)",
-            "loss_of_taste_smell": "Loss of taste or smell (1 = Yes, 0 = No)",
-            "chest_pain": "Chest pain (1 = Yes, 0 = No)",
-            "headache": "Headache (1 = Yes, 0 = No)",
-            "muscle_aches": "Muscle aches (1 = Yes, 0 = No)",
-            "diabetes": "Diabetes (1 = Yes, 0 = No)",
-            "hypertension": "Hypertension (1 = Yes, 0 = No)",
-            "heart_disease": "Heart disease (1 = Yes, 0 = No)",
-            "lung_disease": "Lung disease (1 = Yes, 0 = No)",
-            "kidney_disease": "Kidney disease (1 = Yes, 0 = No)",
-            "liver_disease": "Liver disease (1 = Yes, 0 = No)",
-            "cancer": "Cancer diagnosis (1 = Yes, 0 = No)",
-            "immunocompromised": "Immunocompromised status (1 = Yes, 0 = No)",
-            "vaccination_status": "COVID-19 vaccination status (0 = None, 1 = Partial, 2 = Full, 3 = Boosted)",
-            "smoking_status": "Smoking status (0 = Never, 1 = Former, 2 = Current)",
-            "white_blood_cells": "White blood cell count (cells/μL)",
-            "lymphocytes": "Lymphocyte count (cells/μL)",
-            "platelets": "Platelet count (cells/μL)",
-            "c_reactive_protein": "C-reactive protein (mg/L)",
-            "d_dimer": "D-dimer (mg/L)",
-            "lactate_dehydrogenase": "Lactate dehydrogenase (U/L)",
-            "ferritin": "Ferritin (ng/mL)",
-            "procalcitonin": "Procalcitonin (ng/mL)"
-        }
+    def get_field_descriptions(self) -> Mapping[str, str]:
+        return _COVID_FIELD_DESCRIPTIONS
     
     def preprocess_data(self, data: Dict[str, Any]) -> np.ndarray:
-        features = [
-            data["age"] / 100.0,
-            data["gender"],
-            data["bmi"] / 50.0,
-            data["temperature"] / 42.0,
-            data["oxygen_saturation"] / 100.0,
-            data["heart_rate"] / 150.0,
-            data["respiratory_rate"] / 40.0,
-            data["blood_pressure_systolic"] / 200.0,
-            data["blood_pressure_diastolic"] / 120.0,
-            data["cough"],
-            data["shortness_of_breath"],
-            data["fatigue"] / 10.0,
-            data["fever_duration_days"] / 14.0,
-            data["loss_of_taste_smell"],
-            data["chest_pain"],
-            data["headache"],
-            data["muscle_aches"],
-            data["diabetes"],
-            data["hypertension"],
-            data["heart_disease"],
-            data["lung_disease"],
-            data["kidney_disease"],
-            data["liver_disease"],
-            data["cancer"],
-            data["immunocompromised"],
-            data["vaccination_status"] / 3.0,
-            data["smoking_status"] / 2.0,
-            data["white_blood_cells"] / 15000.0,
-            data["lymphocytes"] / 4000.0,
-            data["platelets"] / 500000.0,
-            data["c_reactive_protein"] / 200.0,
-            data["d_dimer"] / 10.0,
-            data["lactate_dehydrogenase"] / 1000.0,
-            data["ferritin"] / 5000.0,
-            data["procalcitonin"] / 10.0
-        ]
-        return np.array(features)
+        return self._fill_scaled_row(data, self._FEATURE_GETTER, self._FEATURE_SCALES)
     
     def identify_contributing_factors(self, data: Dict[str, Any]) -> List[Dict[str, Any]]:
         """Identify key factors contributing to cancer recurrence risk"""
@@ -861,117 +1132,28 @@ class CovidRiskPredictor(BasePredictor):
 class AsthmaCopdPredictor(BasePredictor):
     """Predicts asthma and COPD progression and exacerbation risk"""
     
+    # Model features in schema order, each divided by its scale to land near [0, 1]; flags use 1.0
+    _FEATURE_FIELDS = tuple(_ASTHMA_COPD_REQUIRED_FIELDS)
+    _FEATURE_GETTER = itemgetter(*_FEATURE_FIELDS)
+    _FEATURE_SCALES = np.array([
+        100.0, 1.0, 100.0, 2.0, 1.0, 1.0, 100.0, 100.0, 1.0, 600.0, 100.0, 100.0, 4.0, 4.0, 4.0, 4.0, 4.0,
+        4.0, 4.0, 20.0, 10.0, 5.0, 10.0, 1.0, 1000.0, 1000.0, 100.0, 50.0, 4.0, 1.0, 4.0
+    ])
+    
     def __init__(self):
         super().__init__(
             name="Asthma & COPD Predictor",
             description="Predicts respiratory disease progression and exacerbation risk for asthma and COPD"
         )
     
-    def get_required_fields(self) -> Dict[str, str]:
-        return {
-            "age": "int",
-            "gender": "int",  # 1 = male, 0 = female
-            "smoking_pack_years": "float",
-            "current_smoking_status": "int",  # 0 = never, 1 = former, 2 = current
-            "occupational_exposure": "int",  # 1 = yes, 0 = no
-            "family_history_respiratory": "int",  # 1 = yes, 0 = no
-            "fev1_percent_predicted": "float",  # Forced Expiratory Volume
-            "fvc_percent_predicted": "float",  # Forced Vital Capacity
-            "fev1_fvc_ratio": "float",
-            "peak_flow_rate": "float",  # L/min
-            "oxygen_saturation_rest": "float",
-            "oxygen_saturation_exercise": "float",
-            "shortness_of_breath_scale": "int",  # 0-4 mMRC scale
-            "cough_frequency": "int",  # 0-4 scale
-            "sputum_production": "int",  # 0-4 scale
-            "wheezing_frequency": "int",  # 0-4 scale
-            "chest_tightness": "int",  # 0-4 scale
-            "exercise_tolerance": "int",  # 0-4 scale
-            "sleep_disturbance": "int",  # 0-4 scale
-            "rescue_inhaler_use": "int",  # uses per week
-            "exacerbations_last_year": "int",
-            "hospitalizations_last_year": "int",
-            "steroid_courses_last_year": "int",
-            "allergies": "int",  # 1 = yes, 0 = no
-            "eosinophil_count": "float",  # cells/μL
-            "ige_level": "float",  # IU/mL
-            "vitamin_d_level": "float",  # ng/mL
-            "bmi": "float",
-            "air_quality_exposure": "int",  # 0-4 scale
-            "seasonal_variation": "int",  # 1 = yes, 0 = no
-            "medication_adherence": "int"  # 0-4 scale
-        }
+    def get_required_fields(self) -> Mapping[str, str]:
+        return _ASTHMA_COPD_REQUIRED_FIELDS
     
-    def get_field_descriptions(self) -> Dict[str, str]:
-        return {
-            "age": "Age in years",
-            "gender": "Gender (1 = Male, 0 = Female)",
-            "smoking_pack_years": "Smoking history (pack-years)",
-            "current_smoking_status": "Current smoking status (0 = Never, 1 = Former, 2 = Current)",
-            "occupational_exposure": "Occupational exposure to irritants (1 = Yes, 0 = No)",
-            "family_history_respiratory": "Family history of respiratory disease (1 = Yes, 0 = No)",
-            "fev1_percent_predicted": "FEV1 as percentage of predicted value (%)",
-            "fvc_percent_predicted": "FVC as percentage of predicted value (%)",
-            "fev1_fvc_ratio": "FEV1/FVC ratio",
-            "peak_flow_rate": "Peak expiratory flow rate (L/min)",
-            "oxygen_saturation_rest": "Oxygen saturation at rest (%)",
-            "oxygen_saturation_exercise": "Oxygen saturation during exercise (%)",
-            "shortness_of_breath_scale": "mMRC Dyspnea Scale (0-4)",
-            "cough_frequency": "Cough frequency (0 = None, 1 = Rare, 2 = Occasional, 3 = Frequent, 4 = Constant)",
-            "sputum_production": "Sputum production (0-4 scale)",
-            "wheezing_frequency": "Wheezing frequency (0-4 scale)",
-            "chest_tightness": "Chest tightness (0-4 scale)",
-            "exercise_tolerance": "Exercise tolerance (0 = Poor, 4 = Excellent)",
-            "sleep_disturbance": "Sleep disturbance due to symptoms (0-4 scale)",
-            "rescue_inhaler_use": "Rescue inhaler uses per week",
-            "exacerbations_last_year": "Number of exacerbations in the last year",
-            "hospitalizations_last_year": "Hospitalizations in the last year",
-            "steroid_courses_last_year": "Oral steroid courses in the last year",
-            "allergies": "Known allergies (1 = Yes, 0 = No)",
-            "eosinophil_count": "Eosinophil count (cells/μL)",
-            "ige_level": "Total IgE level (IU/mL)",
-            "vitamin_d_level": "Vitamin D level (ng/mL)",
-            "bmi": "Body Mass Index",
-            "air_quality_exposure": "Air quality exposure (0 = Excellent, 4 = Very Poor)",
-            "seasonal_variation": "Seasonal symptom variation (1 = Yes, 0 = No)",
-            "medication_adherence": "Medication adherence (0 = Poor, 4 = Excellent)"
-        }
+    def get_field_descriptions(self) -> Mapping[str, str]:
+        return _ASTHMA_COPD_FIELD_DESCRIPTIONS
     
     def preprocess_data(self, data: Dict[str, Any]) -> np.ndarray:
-        features = [
-            data["age"] / 100.0,
-            data["gender"],
-            data["smoking_pack_years"] / 100.0,
-            data["current_smoking_status"] / 2.0,
-            data["occupational_exposure"],
-            data["family_history_respiratory"],
-            data["fev1_percent_predicted"] / 100.0,
-            data["fvc_percent_predicted"] / 100.0,
-            data["fev1_fvc_ratio"],
-            data["peak_flow_rate"] / 600.0,
-            data["oxygen_saturation_rest"] / 100.0,
-            data["oxygen_saturation_exercise"] / 100.0,
-            data["shortness_of_breath_scale"] / 4.0,
-            data["cough_frequency"] / 4.0,
-            data["sputum_production"] / 4.0,
-            data["wheezing_frequency"] / 4.0,
-            data["chest_tightness"] / 4.0,
-            data["exercise_tolerance"] / 4.0,
-            data["sleep_disturbance"] / 4.0,
-            data["rescue_inhaler_use"] / 20.0,
-            data["exacerbations_last_year"] / 10.0,
-            data["hospitalizations_last_year"] / 5.0,
-            data["steroid_courses_last_year"] / 10.0,
-            data["allergies"],
-            data["eosinophil_count"] / 1000.0,
-            data["ige_level"] / 1000.0,
-            data["vitamin_d_level"] / 100.0,
-            data["bmi"] / 50.0,
-            data["air_quality_exposure"] / 4.0,
-            data["seasonal_variation"],
-            data["medication_adherence"] / 4.0
-        ]
-        return np.array(features)
+        return self._fill_scaled_row(data, self._FEATURE_GETTER, self._FEATURE_SCALES)
     
     def identify_contributing_factors(self, data: Dict[str, Any]) -> List[Dict[str, Any]]:
         """Identify key factors contributing to asthma/COPD risk"""
@@ -1324,79 +1506,11 @@ class AnemiaPredictor(BasePredictor):
             description="Predicts anemia and its type using blood test values and clinical indicators"
         )
     
-    def get_required_fields(self) -> Dict[str, str]:
-        return {
-            "age": "int",
-            "gender": "int",  # 1 = male, 0 = female
-            "hemoglobin": "float",  # g/dL
-            "hematocrit": "float",  # percentage
-            "red_blood_cell_count": "float",  # million cells/μL
-            "mean_corpuscular_volume": "float",  # fL
-            "mean_corpuscular_hemoglobin": "float",  # pg
-            "mean_corpuscular_hemoglobin_concentration": "float",  # g/dL
-            "red_cell_distribution_width": "float",  # percentage
-            "reticulocyte_count": "float",  # percentage
-            "serum_iron": "float",  # μg/dL
-            "total_iron_binding_capacity": "float",  # μg/dL
-            "transferrin_saturation": "float",  # percentage
-            "ferritin": "float",  # ng/mL
-            "vitamin_b12": "float",  # pg/mL
-            "folate": "float",  # ng/mL
-            "lactate_dehydrogenase": "float",  # U/L
-            "bilirubin_total": "float",  # mg/dL
-            "bilirubin_indirect": "float",  # mg/dL
-            "haptoglobin": "float",  # mg/dL
-            "fatigue_level": "int",  # 0-10 scale
-            "shortness_of_breath": "int",  # 1 = yes, 0 = no
-            "pale_skin": "int",  # 1 = yes, 0 = no
-            "cold_hands_feet": "int",  # 1 = yes, 0 = no
-            "brittle_nails": "int",  # 1 = yes, 0 = no
-            "strange_cravings": "int",  # 1 = yes, 0 = no (ice, starch, etc.)
-            "heavy_menstrual_periods": "int",  # 1 = yes, 0 = no/not applicable
-            "gastrointestinal_bleeding": "int",  # 1 = yes, 0 = no
-            "chronic_kidney_disease": "int",  # 1 = yes, 0 = no
-            "chronic_inflammatory_disease": "int",  # 1 = yes, 0 = no
-            "family_history_anemia": "int",  # 1 = yes, 0 = no
-            "vegetarian_diet": "int",  # 1 = yes, 0 = no
-            "alcohol_consumption": "int"  # 0-4 scale
-        }
+    def get_required_fields(self) -> Mapping[str, str]:
+        return _ANEMIA_REQUIRED_FIELDS
     
-    def get_field_descriptions(self) -> Dict[str, str]:
-        return {
-            "age": "Age in years",
-            "gender": "Gender (1 = Male, 0 = Female)",
-            "hemoglobin": "Hemoglobin level (g/dL)",
-            "hematocrit": "Hematocrit percentage (%)",
-            "red_blood_cell_count": "Red blood cell count (million cells/μL)",
-            "mean_corpuscular_volume": "Mean corpuscular volume (fL)",
-            "mean_corpuscular_hemoglobin": "Mean corpuscular hemoglobin (pg)",
-            "mean_corpuscular_hemoglobin_concentration": "MCHC (g/dL)",
-            "red_cell_distribution_width": "Red cell distribution width (%)",
-            "reticulocyte_count": "Reticulocyte count (%)",
-            "serum_iron": "Serum iron level (μg/dL)",
-            "total_iron_binding_capacity": "Total iron binding capacity (μg/dL)",
-            "transferrin_saturation": "Transferrin saturation (%)",
-            "ferritin": "Ferritin level (ng/mL)",
-            "vitamin_b12": "Vitamin B12 level (pg/mL)",
-            "folate": "Folate level (ng/mL)",
-            "lactate_dehydrogenase": "LDH level (U/L)",
-            "bilirubin_total": "Total bilirubin (mg/dL)",
-            "bilirubin_indirect": "Indirect bilirubin (mg/dL)",
-            "haptoglobin": "Haptoglobin level (mg/dL)",
-            "fatigue_level": "Fatigue level (0-10)",
-            "shortness_of_breath": "Shortness of breath (1 = Yes, 0 = No)",
-            "pale_skin": "Pale skin (1 = Yes, 0 = No)",
-            "cold_hands_feet": "Cold hands and feet (1 = Yes, 0 = No)",
-            "brittle_nails": "Brittle or spoon-shaped nails (1 = Yes, 0 = No)",
-            "strange_cravings": "Cravings for ice, starch, or non-food items (1 = Yes, 0 = No)",
-            "heavy_menstrual_periods": "Heavy menstrual periods (1 = Yes, 0 = No/Not applicable)",
-            "gastrointestinal_bleeding": "History of GI bleeding (1 = Yes, 0 = No)",
-            "chronic_kidney_disease": "Chronic kidney disease (1 = Yes, 0 = No)",
-            "chronic_inflammatory_disease": "Chronic inflammatory disease (1 = Yes, 0 = No)",
-            "family_history_anemia": "Family history of anemia (1 = Yes, 0 = No)",
-            "vegetarian_diet": "Vegetarian or vegan diet (1 = Yes, 0 = No)",
-            "alcohol_consumption": "Alcohol consumption (0-4 scale)"
-        }
+    def get_field_descriptions(self) -> Mapping[str, str]:
+        return _ANEMIA_FIELD_DESCRIPTIONS
     
     def preprocess_data(self, data: Dict[str, Any]) -> np.ndarray:
         # Calculate iron saturation if not provided
@@ -1437,7 +1551,7 @@ class AnemiaPredictor(BasePredictor):
             data["vegetarian_diet"],
             data["alcohol_consumption"] / 4.0
         ]
-        return np.array(features)
+        return self._fill_row(features)
     
     def identify_contributing_factors(self, data: Dict[str, Any]) -> List[Dict[str, Any]]:
         """Identify key factors contributing to anemia risk"""
@@ -1808,83 +1922,11 @@ class ThyroidDisorderPredictor(BasePredictor):
             description="Predicts hyperthyroidism and hypothyroidism using clinical and laboratory data"
         )
     
-    def get_required_fields(self) -> Dict[str, str]:
-        return {
-            "age": "int",
-            "gender": "int",  # 1 = male, 0 = female
-            "tsh": "float",  # mIU/L
-            "free_t4": "float",  # ng/dL
-            "free_t3": "float",  # pg/mL
-            "total_t4": "float",  # μg/dL
-            "total_t3": "float",  # ng/dL
-            "thyroid_peroxidase_antibody": "float",  # IU/mL
-            "thyroglobulin_antibody": "float",  # IU/mL
-            "tsh_receptor_antibody": "float",  # IU/L
-            "weight_change_kg": "float",  # positive = gain, negative = loss
-            "heart_rate": "float",
-            "blood_pressure_systolic": "float",
-            "blood_pressure_diastolic": "float",
-            "body_temperature": "float",  # Celsius
-            "fatigue_level": "int",  # 0-10 scale
-            "anxiety_level": "int",  # 0-10 scale
-            "depression_symptoms": "int",  # 0-10 scale
-            "sleep_quality": "int",  # 0-10 scale
-            "hair_loss": "int",  # 1 = yes, 0 = no
-            "dry_skin": "int",  # 1 = yes, 0 = no
-            "cold_intolerance": "int",  # 1 = yes, 0 = no
-            "heat_intolerance": "int",  # 1 = yes, 0 = no
-            "constipation": "int",  # 1 = yes, 0 = no
-            "diarrhea": "int",  # 1 = yes, 0 = no
-            "muscle_weakness": "int",  # 1 = yes, 0 = no
-            "tremor": "int",  # 1 = yes, 0 = no
-            "goiter": "int",  # 1 = yes, 0 = no
-            "eye_problems": "int",  # 1 = yes, 0 = no
-            "menstrual_irregularities": "int",  # 1 = yes, 0 = no/not applicable
-            "family_history_thyroid": "int",  # 1 = yes, 0 = no
-            "autoimmune_disease": "int",  # 1 = yes, 0 = no
-            "iodine_intake": "int",  # 0-4 scale
-            "stress_level": "int",  # 0-10 scale
-            "smoking_status": "int"  # 0 = never, 1 = former, 2 = current
-        }
+    def get_required_fields(self) -> Mapping[str, str]:
+        return _THYROID_REQUIRED_FIELDS
     
-    def get_field_descriptions(self) -> Dict[str, str]:
-        return {
-            "age": "Age in years",
-            "gender": "Gender (1 = Male, 0 = Female)",
-            "tsh": "Thyroid Stimulating Hormone (mIU/L)",
-            "free_t4": "Free T4 (ng/dL)",
-            "free_t3": "Free T3 (pg/mL)",
-            "total_t4": "Total T4 (μg/dL)",
-            "total_t3": "Total T3 (ng/dL)",
-            "thyroid_peroxidase_antibody": "Anti-TPO antibody (IU/mL)",
-            "thyroglobulin_antibody": "Anti-thyroglobulin antibody (IU/mL)",
-            "tsh_receptor_antibody": "TSH receptor antibody (IU/L)",
-            "weight_change_kg": "Weight change in last 6 months (kg, + = gain, - = loss)",
-            "heart_rate": "Resting heart rate (bpm)",
-            "blood_pressure_systolic": "Systolic blood pressure (mmHg)",
-            "blood_pressure_diastolic": "Diastolic blood pressure (mmHg)",
-            "body_temperature": "Average body temperature (Celsius)",
-            "fatigue_level": "Fatigue level (0-10)",
-            "anxiety_level": "Anxiety level (0-10)",
-            "depression_symptoms": "Depression symptoms (0-10)",
-            "sleep_quality": "Sleep quality (0-10, higher is better)",
-            "hair_loss": "Hair loss or thinning (1 = Yes, 0 = No)",
-            "dry_skin": "Dry skin (1 = Yes, 0 = No)",
-            "cold_intolerance": "Cold intolerance (1 = Yes, 0 = No)",
-            "heat_intolerance": "Heat intolerance (1 = Yes, 0 = No)",
-            "constipation": "Constipation (1 = Yes, 0 = No)",
-            "diarrhea": "Diarrhea (1 = Yes, 0 = No)",
-            "muscle_weakness": "Muscle weakness (1 = Yes, 0 = No)",
-            "tremor": "Hand tremor (1 = Yes, 0 = No)",
-            "goiter": "Enlarged thyroid (goiter) (1 = Yes, 0 = No)",
-            "eye_problems": "Eye problems (bulging, dryness) (1 = Yes, 0 = No)",
-            "menstrual_irregularities": "Menstrual irregularities (1 = Yes, 0 = No/Not applicable)",
-            "family_history_thyroid": "Family history of thyroid disease (1 = Yes, 0 = No)",
-            "autoimmune_disease": "Other autoimmune diseases (1 = Yes, 0 = No)",
-            "iodine_intake": "Iodine intake level (0 = Low, 1 = Normal, 2 = High, 3 = Very High, 4 = Excessive)",
-            "stress_level": "Stress level (0-10)",
-            "smoking_status": "Smoking status (0 = Never, 1 = Former, 2 = Current)"
-        }
+    def get_field_descriptions(self) -> Mapping[str, str]:
+        return _THYROID_FIELD_DESCRIPTIONS
     
     def preprocess_data(self, data: Dict[str, Any]) -> np.ndarray:
         features = [
@@ -1924,7 +1966,7 @@ class ThyroidDisorderPredictor(BasePredictor):
             data["stress_level"] / 10.0,
             data["smoking_status"] / 2.0
         ]
-        return np.array(features)
+        return self._fill_row(features)
     
     def identify_contributing_factors(self, data: Dict[str, Any]) -> List[Dict[str, Any]]:
         """Identify key factors contributing to thyroid disorder risk"""
@@ -2326,83 +2368,11 @@ class CancerRecurrencePredictor(BasePredictor):
             description="Predicts the likelihood of cancer recurrence after treatment completion"
         )
     
-    def get_required_fields(self) -> Dict[str, str]:
-        return {
-            "age_at_diagnosis": "int",
-            "gender": "int",  # 1 = male, 0 = female
-            "cancer_type": "int",  # 0 = breast, 1 = lung, 2 = colon, 3 = prostate, 4 = other
-            "cancer_stage": "int",  # 1-4
-            "tumor_size_cm": "float",
-            "lymph_nodes_positive": "int",
-            "lymph_nodes_examined": "int",
-            "histologic_grade": "int",  # 1-3
-            "hormone_receptor_positive": "int",  # 1 = yes, 0 = no/not applicable
-            "her2_positive": "int",  # 1 = yes, 0 = no/not applicable
-            "ki67_percentage": "float",  # proliferation marker
-            "months_since_treatment": "int",
-            "treatment_surgery": "int",  # 1 = yes, 0 = no
-            "treatment_chemotherapy": "int",  # 1 = yes, 0 = no
-            "treatment_radiation": "int",  # 1 = yes, 0 = no
-            "treatment_hormone_therapy": "int",  # 1 = yes, 0 = no
-            "treatment_immunotherapy": "int",  # 1 = yes, 0 = no
-            "treatment_targeted_therapy": "int",  # 1 = yes, 0 = no
-            "complete_response": "int",  # 1 = yes, 0 = no
-            "cea_level": "float",  # ng/mL (carcinoembryonic antigen)
-            "ca_125_level": "float",  # U/mL
-            "ca_19_9_level": "float",  # U/mL
-            "psa_level": "float",  # ng/mL (for prostate cancer)
-            "circulating_tumor_cells": "int",  # cells per 7.5 mL
-            "family_history_cancer": "int",  # 1 = yes, 0 = no
-            "genetic_mutations": "int",  # 1 = yes, 0 = no (BRCA, p53, etc.)
-            "smoking_status": "int",  # 0 = never, 1 = former, 2 = current
-            "alcohol_consumption": "int",  # 0-4 scale
-            "bmi": "float",
-            "physical_activity_level": "int",  # 0-4 scale
-            "stress_level": "int",  # 0-10 scale
-            "sleep_quality": "int",  # 0-10 scale
-            "immune_function_score": "int",  # 0-10 scale
-            "comorbidities_count": "int",
-            "medication_adherence": "int"  # 0-4 scale
-        }
+    def get_required_fields(self) -> Mapping[str, str]:
+        return _CANCER_RECURRENCE_REQUIRED_FIELDS
     
-    def get_field_descriptions(self) -> Dict[str, str]:
-        return {
-            "age_at_diagnosis": "Age at initial cancer diagnosis",
-            "gender": "Gender (1 = Male, 0 = Female)",
-            "cancer_type": "Cancer type (0 = Breast, 1 = Lung, 2 = Colon, 3 = Prostate, 4 = Other)",
-            "cancer_stage": "Cancer stage at diagnosis (1-4)",
-            "tumor_size_cm": "Primary tumor size (cm)",
-            "lymph_nodes_positive": "Number of positive lymph nodes",
-            "lymph_nodes_examined": "Total lymph nodes examined",
-            "histologic_grade": "Histologic grade (1 = Well differentiated, 2 = Moderately differentiated, 3 = Poorly differentiated)",
-            "hormone_receptor_positive": "Hormone receptor positive (1 = Yes, 0 = No/Not applicable)",
-            "her2_positive": "HER2 positive (1 = Yes, 0 = No/Not applicable)",
-            "ki67_percentage": "Ki-67 proliferation index (%)",
-            "months_since_treatment": "Months since treatment completion",
-            "treatment_surgery": "Received surgery (1 = Yes, 0 = No)",
-            "treatment_chemotherapy": "Received chemotherapy (1 = Yes, 0 = No)",
-            "treatment_radiation": "Received radiation therapy (1 = Yes, 0 = No)",
-            "treatment_hormone_therapy": "Received hormone therapy (1 = Yes, 0 = No)",
-            "treatment_immunotherapy": "Received immunotherapy (1 = Yes, 0 = No)",
-            "treatment_targeted_therapy": "Received targeted therapy (1 = Yes, 0 = No)",
-            "complete_response": "Achieved complete response (1 = Yes, 0 = No)",
-            "cea_level": "CEA tumor marker level (ng/mL)",
-            "ca_125_level": "CA-125 tumor marker level (U/mL)",
-            "ca_19_9_level": "CA 19-9 tumor marker level (U/mL)",
-            "psa_level": "PSA level for prostate cancer (ng/mL)",
-            "circulating_tumor_cells": "Circulating tumor cells count (per 7.5 mL)",
-            "family_history_cancer": "Family history of cancer (1 = Yes, 0 = No)",
-            "genetic_mutations": "Known cancer-related genetic mutations (1 = Yes, 0 = No)",
-            "smoking_status": "Smoking status (0 = Never, 1 = Former, 2 = Current)",
-            "alcohol_consumption": "Alcohol consumption (0-4 scale)",
-            "bmi": "Body Mass Index",
-            "physical_activity_level": "Physical activity level (0-4 scale)",
-            "stress_level": "Stress level (0-10)",
-            "sleep_quality": "Sleep quality (0-10)",
-            "immune_function_score": "Immune function assessment (0-10)",
-            "comorbidities_count": "Number of comorbid conditions",
-            "medication_adherence": "Medication adherence (0-4 scale)"
-        }
+    def get_field_descriptions(self) -> Mapping[str, str]:
+        return _CANCER_RECURRENCE_FIELD_DESCRIPTIONS
     
     def preprocess_data(self, data: Dict[str, Any]) -> np.ndarray:
         # Calculate lymph node ratio
@@ -2445,4 +2415,4 @@ class CancerRecurrencePredictor(BasePredictor):
             data["comorbidities_count"] / 10.0,
             data["medication_adherence"] / 4.0
         ]
-        return np.array(features)
\ No newline at end of file
+        return self._fill_row(features)
\ No newline at end of file
@@ -0,0 +1,120 @@
+import numpy as np
+from typing import Optional
+from ._kernels import NUMBA_AVAILABLE, njit
+
+
+def _leaves_hold_fractions() -> bool:
+    """Whether fitted tree leaves store class fractions rather than class counts"""
+    # Before scikit-learn 1.4 tree leaves stored class counts and predict_proba normalized them per call;
+    # from 1.4 on they store the fractions themselves. Only called with a fitted forest in hand, so
+    # sklearn is already loaded
+    import sklearn
+    return tuple(int(part) for part in sklearn.__version__.split('.')[:2]) >= (1, 4)
+
+
+def _float32_floor(values: np.ndarray) -> np.ndarray:
+    """Largest float32 at or below each value, so a float32 x <= value exactly when x <= the result"""
+    rounded = values.astype(np.float32)
+    return np.where(rounded > values, np.nextafter(rounded, np.float32(-np.inf)), rounded)
+
+
+# fastmath is left off since it would reorder the per-tree sum and change the probabilities. The loop is
+# serial and runs without the GIL, so concurrent requests each walk their own rows on their own thread;
+# a parallel=True kernel would share numba's one thread pool, which is unsafe to launch from several
+# threads at once
+@njit(cache=True, nogil=True)
+def _forest_proba(X, roots, feature, threshold, left, right, leaf_proba):
+    """Walk every tree for each row until it reaches a leaf, summing leaf probabilities in tree order"""
+    n_rows = X.shape[0]
+    n_classes = leaf_proba.shape[1]
+    out = np.zeros((n_rows, n_classes))
+    for r in range(n_rows):
+        for t in range(roots.shape[0]):
+            node = roots[t]
+            while left[node] != node:
+                if X[r, feature[node]] <= threshold[node]:
+                    node = left[node]
+                else:
+                    node = right[node]
+            for c in range(n_classes):
+                out[r, c] += leaf_proba[node, c]
+        for c in range(n_classes):
+            out[r, c] /= roots.shape[0]
+    return out
+
+
+class CompiledForest:
+    """A fitted random forest flattened into node arrays and walked for all trees at once"""
+
+    def __init__(self, estimators, n_features: int, model_name: str = 'RandomForestClassifier'):
+        offsets = np.cumsum([0] + [est.tree_.node_count for est in estimators])
+        n_nodes = offsets[-1]
+        self.n_features = n_features
+        self.model_name = model_name
+        self.n_trees = len(estimators)
+        self.roots = offsets[:-1].astype(np.intp)
+        self.feature = np.zeros(n_nodes, dtype=np.intp)
+        # Features are float32, so thresholds rounded down to float32 split them exactly as the float64
+        # originals do at half the size
+        self.threshold = np.zeros(n_nodes, dtype=np.float32)
+        self.left = np.arange(n_nodes, dtype=np.intp)
+        self.right = np.arange(n_nodes, dtype=np.intp)
+        self.proba = np.zeros((n_nodes, estimators[0].n_classes_), dtype=np.float64)
+        self.depth = 0
+        leaves_hold_fractions = _leaves_hold_fractions()
+
+        for est, offset in zip(estimators, offsets[:-1]):
+            tree = est.tree_
+            nodes = slice(offset, offset + tree.node_count)
+            split = tree.children_left != -1
+            # Leaves point back at themselves, so extra steps past a shallow tree's depth are no-ops
+            self.feature[nodes] = np.where(split, tree.feature, 0)
+            self.threshold[nodes] = _float32_floor(tree.threshold)
+            self.left[nodes] = np.where(split, tree.children_left + offset, self.left[nodes])
+            self.right[nodes] = np.where(split, tree.children_right + offset, self.right[nodes])
+
+            proba = tree.value[:, 0, :est.n_classes_].astype(np.float64)
+            if not leaves_hold_fractions:
+                normalizer = proba.sum(axis=1)[:, np.newaxis]
+                normalizer[normalizer == 0.0] = 1.0
+                proba /= normalizer
+            self.proba[nodes] = proba
+            self.depth = max(self.depth, tree.max_depth)
+
+    @classmethod
+    def from_sklearn(cls, model) -> Optional['CompiledForest']:
+        """Compile a fitted single-output forest classifier, or None if the model isn't one"""
+        estimators = getattr(model, 'estimators_', None)
+        if not estimators or getattr(model, 'n_outputs_', 1) != 1:
+            return None
+        if not all(hasattr(est, 'tree_') and est.n_classes_ == estimators[0].n_classes_ for est in estimators):
+            return None
+        return cls(estimators, model.n_features_in_, type(model).__name__)
+
+    def predict_proba(self, X: np.ndarray) -> np.ndarray:
+        """Class probabilities for each row, equal to the forest's own predict_proba"""
+        # The forest works on float32 features, which the float32 thresholds are rounded for
+        X = np.asarray(X, dtype=np.float32)
+        # Checked up front as sklearn does: a narrower X would index past its columns and a wider one
+        # would quietly ignore the extras
+        if X.ndim != 2 or X.shape[1] != self.n_features:
+            n_columns = X.shape[1] if X.ndim == 2 else X.shape[-1]
+            raise ValueError(
+                f"X has {n_columns} features, but {self.model_name} is expecting {self.n_features} features as input."
+            )
+        if NUMBA_AVAILABLE:
+            return _forest_proba(X, self.roots, self.feature, self.threshold, self.left, self.right, self.proba)
+        
+        rows = np.arange(X.shape[0])[:, np.newaxis]
+        nodes = np.broadcast_to(self.roots, (X.shape[0], self.n_trees))
+        for _ in range(self.depth):
+            go_left = X[rows, self.feature[nodes]] <= self.threshold[nodes]
+            nodes = np.where(go_left, self.left[nodes], self.right[nodes])
+
+        # Trees are summed one at a time in order and then averaged, exactly as the forest accumulates them
+        leaf_proba = self.proba[nodes]
+        proba = np.zeros((X.shape[0], self.proba.shape[1]), dtype=np.float64)
+        for t in range(self.n_trees):
+            proba += leaf_proba[:, t]
+        proba /= self.n_trees
+        return proba
@@ -0,0 +1,99 @@
+import hashlib
+import json
+import os
+import re
+import tempfile
+import threading
+import time
+from typing import Any, Dict, Optional
+
+# Report keys and job ids are both 32 hex digits; anything else never names a file in the cache
+_HEX_ID = re.compile(r'[0-9a-f]{32}')
+
+
+class ReportCache:
+    """On-disk cache of rendered PDF reports keyed by their full input"""
+
+    def __init__(self, directory: str, ttl: float = 600.0, prune_interval: float = 60.0):
+        self.directory = directory
+        self.ttl = ttl
+        self.prune_interval = prune_interval
+        self._lock = threading.Lock()
+        self._last_prune = 0.0
+        os.makedirs(directory, exist_ok=True)
+
+    @staticmethod
+    def make_key(prediction_data: Dict[str, Any], user_data: Dict[str, Any], generated_at: str) -> str:
+        """Build a stable file key from everything that appears in the rendered report"""
+        canonical = json.dumps([prediction_data, user_data, generated_at], sort_keys=True, default=str).encode()
+        return hashlib.blake2b(canonical, digest_size=16).hexdigest()
+
+    def path(self, key: str) -> str:
+        """Return the file path a report with this key is stored at"""
+        return os.path.join(self.directory, f"{key}.pdf")
+
+    def get(self, key: str) -> Optional[str]:
+        """Return the cached report path for key, or None on a miss"""
+        path = self.path(key)
+        return path if os.path.exists(path) else None
+
+    def put(self, key: str, pdf_buffer) -> str:
+        """Write a rendered report atomically and return its path"""
+        self._write(self.path(key), pdf_buffer.getbuffer())
+        self._maybe_prune()
+        return self.path(key)
+
+    def job_path(self, job_id: str) -> str:
+        """Return the file path a report job record is stored at"""
+        return os.path.join(self.directory, f"{job_id}.job")
+
+    def put_job(self, job_id: str, record: Dict[str, Any]):
+        """Write a report job record where every worker sharing the directory can read it"""
+        self._write(self.job_path(job_id), json.dumps(record).encode())
+
+    def get_job(self, job_id: str) -> Optional[Dict[str, Any]]:
+        """Return the record for a report job, or None if it doesn't exist or has expired"""
+        if not _HEX_ID.fullmatch(job_id):
+            return None
+        try:
+            with open(self.job_path(job_id), 'rb') as f:
+                record = json.load(f)
+        except FileNotFoundError:
+            return None
+        if record.get('key') is not None and not _HEX_ID.fullmatch(record['key']):
+            return None
+        return record
+
+    def remove_job(self, job_id: str):
+        """Delete a report job record once it has been claimed"""
+        try:
+            os.unlink(self.job_path(job_id))
+        except FileNotFoundError:
+            # Already claimed by another request
+            pass
+
+    def _write(self, path: str, data):
+        """Write data to path atomically so readers never see a partial file"""
+        fd, tmp_path = tempfile.mkstemp(dir=self.directory, suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                f.write(data)
+            os.replace(tmp_path, path)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+
+    def _maybe_prune(self):
+        """Delete expired reports, at most once per prune interval"""
+        now = time.time()
+        with self._lock:
+            if now - self._last_prune < self.prune_interval:
+                return
+            self._last_prune = now
+        for entry in os.scandir(self.directory):
+            try:
+                if now - entry.stat().st_mtime > self.ttl:
+                    os.unlink(entry.path)
+            except OSError:
+                # Already removed by another worker
+                pass
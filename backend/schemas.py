@@ -0,0 +1,91 @@
+import json
+from dataclasses import dataclass, field
+from typing import Any, Dict
+
+try:
+    import orjson
+except ImportError:  # Fall back to the stdlib decoder when orjson isn't installed
+    orjson = None
+
+
+class SchemaError(ValueError):
+    """Raised when a request body doesn't match the expected schema"""
+
+
+def _load_object(raw: bytes) -> Dict[str, Any]:
+    """Decode a JSON request body that must be an object"""
+    if not raw:
+        raise SchemaError("No data provided")
+    try:
+        body = orjson.loads(raw) if orjson is not None else json.loads(raw)
+    except ValueError as e:
+        raise SchemaError(f"Invalid JSON: {e}")
+    if not isinstance(body, dict):
+        raise SchemaError("Request body must be a JSON object")
+    return body
+
+
+def _require_object(body: Dict[str, Any], name: str, message: str) -> Dict[str, Any]:
+    """Return body[name] if it is a non-empty object, otherwise raise SchemaError"""
+    value = body.get(name)
+    if not value:
+        raise SchemaError(message)
+    if not isinstance(value, dict):
+        raise SchemaError(f"'{name}' must be a JSON object")
+    return value
+
+
+@dataclass
+class PredictRequest:
+    """Body of a /predict request"""
+    predictor_type: str
+    data: Dict[str, Any]
+    include_analysis: bool = True
+
+    @classmethod
+    def from_json(cls, raw: bytes) -> 'PredictRequest':
+        body = _load_object(raw)
+        predictor_type = body.get("predictor_type")
+        if not isinstance(predictor_type, str):
+            raise SchemaError("'predictor_type' must be a string")
+        return cls(
+            predictor_type=predictor_type,
+            data=_require_object(body, "data", "Input data is required"),
+            include_analysis=bool(body.get("include_analysis", True))
+        )
+
+
+@dataclass
+class AnalyzeRequest:
+    """Body of an /analyze request"""
+    predictor_type: str
+    data: Dict[str, Any]
+
+    @classmethod
+    def from_json(cls, raw: bytes) -> 'AnalyzeRequest':
+        body = _load_object(raw)
+        predictor_type = body.get("predictor_type")
+        if not isinstance(predictor_type, str):
+            raise SchemaError("'predictor_type' must be a string")
+        return cls(
+            predictor_type=predictor_type,
+            data=_require_object(body, "data", "Input data is required")
+        )
+
+
+@dataclass
+class ReportRequest:
+    """Body of a /download-report request"""
+    prediction_data: Dict[str, Any]
+    user_data: Dict[str, Any] = field(default_factory=dict)
+
+    @classmethod
+    def from_json(cls, raw: bytes) -> 'ReportRequest':
+        body = _load_object(raw)
+        user_data = body.get("user_data") or {}
+        if not isinstance(user_data, dict):
+            raise SchemaError("'user_data' must be a JSON object")
+        return cls(
+            prediction_data=_require_object(body, "prediction_data", "Prediction data is required"),
+            user_data=user_data
+        )
@@ -0,0 +1,55 @@
+#!/usr/bin/env python3
+"""
+Tests for ETag revalidation of the static predictor metadata endpoints
+"""
+
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+import pytest
+
+import app as app_module
+
+_STATIC_URLS = ["/predictors", "/predictor/sepsis/fields"]
+
+
+@pytest.fixture
+def client():
+    return app_module.app.test_client()
+
+
+@pytest.mark.parametrize("url", _STATIC_URLS)
+def test_matching_etag_gets_304(client, url):
+    first = client.get(url)
+    assert first.status_code == 200
+    etag = first.headers["ETag"]
+    assert first.headers["Cache-Control"] == "public, max-age=3600"
+
+    revalidated = client.get(url, headers={"If-None-Match": etag})
+    assert revalidated.status_code == 304
+    assert revalidated.data == b""
+    assert revalidated.headers["ETag"] == etag
+
+
+@pytest.mark.parametrize("url", _STATIC_URLS)
+def test_weak_and_listed_etags_match(client, url):
+    etag = client.get(url).headers["ETag"]
+    assert client.get(url, headers={"If-None-Match": f"W/{etag}"}).status_code == 304
+    assert client.get(url, headers={"If-None-Match": f'"stale", {etag}'}).status_code == 304
+
+
+@pytest.mark.parametrize("url", _STATIC_URLS)
+def test_stale_etag_gets_the_body(client, url):
+    response = client.get(url, headers={"If-None-Match": '"stale"'})
+    assert response.status_code == 200
+    assert response.get_json()
+
+
+def test_etags_differ_per_payload(client):
+    tags = {client.get(url).headers["ETag"] for url in _STATIC_URLS + ["/predictor/anemia/fields"]}
+    assert len(tags) == 3
+
+
+def test_unknown_predictor_fields_is_not_found(client):
+    assert client.get("/predictor/unknown/fields").status_code == 404
@@ -0,0 +1,103 @@
+#!/usr/bin/env python3
+"""
+Tests for PredictionBatcher, which coalesces concurrent predict requests
+"""
+
+import sys
+import os
+import threading
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from batching import PredictionBatcher
+from predictors.base_predictor import PREDICTION_SECTIONS
+from predictors.condition_predictors import SepsisPredictor
+from predictors.disease_predictors import DiabetesPredictor
+
+
+class RecordingPredictor:
+    """Doubles every input's value and records the batches it was called with"""
+
+    def __init__(self, fail_on=None):
+        self.fail_on = fail_on
+        self.batches = []
+        self.includes = []
+        self._gate = threading.Event()
+
+    def predict_batch(self, rows, include=None):
+        # Hold the first call until the test has queued everything, so later rows pile up
+        self._gate.wait(timeout=5)
+        self.batches.append(len(rows))
+        self.includes.append(include)
+        if any(row["value"] == self.fail_on for row in rows):
+            raise ValueError(f"bad value {self.fail_on}")
+        return [{"value": row["value"] * 2} for row in rows]
+
+
+def test_results_go_to_their_own_callers():
+    predictor = RecordingPredictor()
+    batcher = PredictionBatcher(predictor, max_batch=8, max_wait_ms=50)
+    futures = [batcher.submit({"value": n}) for n in range(20)]
+    predictor._gate.set()
+
+    assert [future.result(timeout=5) for future in futures] == [{"value": n * 2} for n in range(20)]
+    assert sum(predictor.batches) == 20
+    assert max(predictor.batches) <= 8
+    assert len(predictor.batches) < 20
+
+
+def test_a_failing_input_only_fails_its_own_caller():
+    predictor = RecordingPredictor(fail_on=3)
+    batcher = PredictionBatcher(predictor, max_batch=8, max_wait_ms=50)
+    futures = [batcher.submit({"value": n}) for n in range(6)]
+    predictor._gate.set()
+
+    for n, future in enumerate(futures):
+        if n == 3:
+            assert isinstance(future.exception(timeout=5), ValueError)
+        else:
+            assert future.result(timeout=5) == {"value": n * 2}
+
+
+def test_include_is_passed_through():
+    predictor = RecordingPredictor()
+    predictor._gate.set()
+    sections = frozenset({"risk_score"})
+
+    PredictionBatcher(predictor, include=sections).submit({"value": 1}).result(timeout=5)
+    PredictionBatcher(predictor).submit({"value": 1}).result(timeout=5)
+    assert predictor.includes == [sections, None]
+
+
+def test_matches_direct_predictions():
+    predictor = SepsisPredictor()
+    batcher = PredictionBatcher(predictor, max_batch=4, max_wait_ms=20, workers=2)
+    rows = []
+    for age in range(20, 40):
+        data = predictor.get_dummy_input()
+        data["age"] = age
+        rows.append(data)
+
+    futures = [batcher.submit(dict(data)) for data in rows]
+    batched = [future.result(timeout=30) for future in futures]
+    assert batched == [predictor.predict(dict(data)) for data in rows]
+
+
+def test_custom_predict_results_follow_include():
+    """Predictors with their own predict() drop the optional sections a batch didn't ask for"""
+    predictor = DiabetesPredictor()
+    data = predictor.get_dummy_input()
+    full = predictor.predict(dict(data))
+    assert {"recommendations", "explanation"} <= full.keys()
+
+    [batched] = predictor.predict_batch([dict(data)], include=("recommendations",))
+    assert batched == {key: value for key, value in full.items() if key != "explanation"}
+    [bare] = predictor.predict_batch([dict(data)], include=())
+    assert bare == {key: value for key, value in full.items() if key not in ("recommendations", "explanation")}
+    assert predictor.predict_batch([dict(data)]) == [full]
+
+
+def test_batched_sections_match_across_predictors():
+    sections = ("recommendations",)
+    for predictor in (SepsisPredictor(), DiabetesPredictor()):
+        [result] = predictor.predict_batch([predictor.get_dummy_input()], include=sections)
+        assert result.keys() & set(PREDICTION_SECTIONS) == set(sections)
@@ -0,0 +1,80 @@
+#!/usr/bin/env python3
+"""
+Tests for CompiledForest, the array form of a fitted random forest used for inference
+"""
+
+import sys
+import os
+from concurrent.futures import ThreadPoolExecutor
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+import numpy as np
+import pytest
+from sklearn.ensemble import RandomForestClassifier
+
+from predictors.tree_runtime import CompiledForest
+
+
+def _fitted_forest(n_features=6, n_estimators=10, seed=0):
+    rng = np.random.default_rng(seed)
+    X = (rng.random((500, n_features)) * rng.choice([1, 100, 1e4], n_features)).astype(np.float32)
+    y = (X.sum(axis=1) + rng.normal(0, X.sum(axis=1).std(), 500) > X.sum(axis=1).mean()).astype(int)
+    return RandomForestClassifier(n_estimators=n_estimators, max_depth=6, random_state=seed).fit(X, y), X
+
+
+def test_matches_sklearn_predict_proba():
+    model, X = _fitted_forest()
+    forest = CompiledForest.from_sklearn(model)
+    rng = np.random.default_rng(1)
+    rows = (rng.random((2000, X.shape[1])) * X.max(axis=0)).astype(np.float32)
+    assert np.array_equal(forest.predict_proba(rows), model.predict_proba(rows))
+
+
+def test_matches_sklearn_on_split_thresholds():
+    """Rows exactly on a split threshold, and one float32 step above it, go the same way as in sklearn"""
+    model, X = _fitted_forest()
+    forest = CompiledForest.from_sklearn(model)
+    thresholds = np.concatenate([
+        est.tree_.threshold[est.tree_.children_left != -1] for est in model.estimators_
+    ]).astype(np.float32)
+    rng = np.random.default_rng(2)
+    rows = rng.choice(thresholds, size=(1000, X.shape[1]))
+    rows[1::2] = np.nextafter(rows[1::2], np.float32(np.inf))
+    assert np.array_equal(forest.predict_proba(rows), model.predict_proba(rows))
+
+
+def test_single_row():
+    model, X = _fitted_forest()
+    forest = CompiledForest.from_sklearn(model)
+    assert np.array_equal(forest.predict_proba(X[:1]), model.predict_proba(X[:1]))
+
+
+@pytest.mark.parametrize("n_columns", [5, 7])
+def test_rejects_wrong_feature_count(n_columns):
+    """A feature count the forest wasn't fitted on raises ValueError, as sklearn does"""
+    model, X = _fitted_forest(n_features=6)
+    forest = CompiledForest.from_sklearn(model)
+    rows = np.zeros((3, n_columns), dtype=np.float32)
+    with pytest.raises(ValueError) as compiled_error:
+        forest.predict_proba(rows)
+    with pytest.raises(ValueError) as sklearn_error:
+        model.predict_proba(rows)
+    assert str(compiled_error.value) == str(sklearn_error.value)
+
+
+def test_from_sklearn_rejects_unfitted_model():
+    assert CompiledForest.from_sklearn(RandomForestClassifier()) is None
+
+
+def test_concurrent_predict_proba():
+    """Several threads scoring through the same forest at once each get sklearn's answer"""
+    model, X = _fitted_forest()
+    forest = CompiledForest.from_sklearn(model)
+    rng = np.random.default_rng(3)
+    batches = [(rng.random((n, X.shape[1])) * X.max(axis=0)).astype(np.float32) for n in (1, 7, 300, 2000) * 4]
+    expected = [model.predict_proba(rows) for rows in batches]
+
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        for _ in range(5):
+            results = list(pool.map(forest.predict_proba, batches))
+            assert all(np.array_equal(result, want) for result, want in zip(results, expected))
@@ -0,0 +1,33 @@
+#!/usr/bin/env python3
+"""
+Tests for the shared synthetic default model
+"""
+
+import sys
+import os
+import tempfile
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from predictors import base_predictor
+from predictors.condition_predictors import SepsisPredictor
+
+
+def test_default_model_is_shared_in_memory():
+    first = SepsisPredictor()
+    second = SepsisPredictor()
+    first.predict(first.get_dummy_input())
+    second.predict(second.get_dummy_input())
+    assert first.model is second.model
+    assert first._fast_predictor is second._fast_predictor
+
+
+def test_default_model_never_touches_the_temp_dir(monkeypatch, tmp_path):
+    """The default model is trained in process, never loaded from or written to a shared directory"""
+    monkeypatch.setattr(base_predictor, "_DEFAULT_MODEL_CACHE", {})
+    monkeypatch.setattr(tempfile, "tempdir", str(tmp_path))
+
+    predictor = SepsisPredictor()
+    predictor.predict(predictor.get_dummy_input())
+
+    assert predictor.is_trained
+    assert list(tmp_path.iterdir()) == []
@@ -0,0 +1,59 @@
+#!/usr/bin/env python3
+"""
+Tests for the feature tables (_FEATURE_FIELDS / _FEATURE_SCALES) predictors declare for preprocessing
+"""
+
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+import numpy as np
+import pytest
+
+import predictors
+
+_TABLE_PREDICTORS = [
+    cls for cls in (getattr(predictors, name) for name in predictors.__all__)
+    if cls._FEATURE_FIELDS is not None
+]
+
+
+def _random_rows(predictor, n=50, seed=0):
+    rng = np.random.default_rng(seed)
+    rows = []
+    for _ in range(n):
+        data = predictor.get_dummy_input()
+        for field, field_type in predictor.get_required_fields().items():
+            value = rng.choice([0, 1, 3, 17.25, 99.9, 1234.5678]) * rng.random() * 10
+            data[field] = int(value) if field_type == "int" else float(value)
+        rows.append(data)
+    return rows
+
+
+@pytest.mark.parametrize("cls", _TABLE_PREDICTORS, ids=lambda cls: cls.__name__)
+def test_table_follows_the_schema(cls):
+    predictor = cls()
+    assert cls._FEATURE_FIELDS == tuple(predictor.get_required_fields())
+    assert cls._FEATURE_SCALES.shape == (len(cls._FEATURE_FIELDS),)
+    assert cls._FEATURE_GETTER(predictor.get_dummy_input()) == tuple(predictor.get_dummy_input().values())
+
+
+@pytest.mark.parametrize("cls", _TABLE_PREDICTORS, ids=lambda cls: cls.__name__)
+def test_each_feature_is_its_field_over_its_scale(cls):
+    """Divided in float64 and rounded once to float32, as the per-field Python division was"""
+    predictor = cls()
+    for data in _random_rows(predictor, n=5):
+        expected = np.array(
+            [data[field] / scale for field, scale in zip(cls._FEATURE_FIELDS, cls._FEATURE_SCALES.tolist())],
+            dtype=np.float32
+        )
+        assert np.array_equal(predictor.preprocess_data(data)[0], expected)
+
+
+@pytest.mark.parametrize("cls", _TABLE_PREDICTORS, ids=lambda cls: cls.__name__)
+def test_batch_matches_rows(cls):
+    predictor = cls()
+    rows = _random_rows(predictor)
+    batch = predictor.preprocess_batch(rows)
+    assert batch.dtype == np.float32
+    assert np.array_equal(batch, np.vstack([predictor.preprocess_data(data).copy() for data in rows]))
@@ -0,0 +1,67 @@
+#!/usr/bin/env python3
+"""
+Tests for saving and loading predictor model files
+"""
+
+import sys
+import os
+import logging
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+import joblib
+import numpy as np
+import pytest
+
+from predictors.condition_predictors import SepsisPredictor
+
+
+@pytest.fixture
+def trained():
+    predictor = SepsisPredictor()
+    predictor.predict(predictor.get_dummy_input())
+    return predictor
+
+
+def _assert_same_model(loaded, trained):
+    X = np.random.default_rng(0).random((20, len(trained.get_required_fields())), dtype=np.float32)
+    assert loaded.is_trained
+    assert np.array_equal(loaded.model.predict_proba(X), trained.model.predict_proba(X))
+    assert np.array_equal(loaded._fast_predictor.predict_proba(X), trained.model.predict_proba(X))
+
+
+def test_save_and_load_round_trip(trained, tmp_path, caplog):
+    path = str(tmp_path / "sepsis.pkl")
+    trained.save_model(path)
+
+    loaded = SepsisPredictor()
+    with caplog.at_level(logging.WARNING, logger="predictors.base_predictor"):
+        assert loaded.load_model(path)
+    assert caplog.records == []
+    _assert_same_model(loaded, trained)
+
+
+@pytest.mark.parametrize("compress", [0, 3])
+def test_loads_joblib_files_and_logs_the_fallback(trained, tmp_path, caplog, compress):
+    path = str(tmp_path / "sepsis.joblib")
+    joblib.dump({
+        'model': trained.model,
+        'scaler': trained.scaler,
+        'feature_names': trained.feature_names,
+        'is_trained': trained.is_trained
+    }, path, compress=compress)
+
+    loaded = SepsisPredictor()
+    with caplog.at_level(logging.WARNING, logger="predictors.base_predictor"):
+        assert loaded.load_model(path)
+    assert "reading it with joblib" in caplog.text
+    _assert_same_model(loaded, trained)
+
+
+def test_unreadable_file_is_not_retried_with_joblib(tmp_path):
+    """Errors other than a non-pickle format surface as they are"""
+    with pytest.raises(IsADirectoryError):
+        SepsisPredictor().load_model(str(tmp_path))
+
+
+def test_missing_file_is_not_loaded(tmp_path):
+    assert SepsisPredictor().load_model(str(tmp_path / "missing.pkl")) is False
@@ -0,0 +1,48 @@
+#!/usr/bin/env python3
+"""
+Tests for the PDF health report generator
+"""
+
+import sys
+import os
+from datetime import datetime
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from pdf_generator import HealthReportGenerator
+
+
+def _report(prediction_data, user_data=None):
+    return HealthReportGenerator().generate_report(
+        prediction_data, user_data, generated_at=datetime(2024, 1, 1, 12, 0)
+    ).getvalue()
+
+
+def test_generates_pdf():
+    pdf = _report(
+        {
+            "predictor_type": "heart_disease",
+            "risk_score": 0.42,
+            "risk_level": "Moderate",
+            "confidence": 0.8,
+            "recommendations": ["Exercise regularly", "Eat a balanced diet"]
+        },
+        {"age": 45, "gender": 1, "bmi": 24.5}
+    )
+    assert pdf.startswith(b"%PDF")
+
+
+def test_user_supplied_markup_is_rendered_as_text():
+    """Values that look like reportlab markup must not break the report"""
+    pdf = _report({
+        "predictor_type": "heart_<b>disease",
+        "risk_score": 0.9,
+        "risk_level": "High <b",
+        "confidence": 0.5,
+        "recommendations": ["Keep salt < 5g & sugar low", "<i>unclosed", "</para>"]
+    })
+    assert pdf.startswith(b"%PDF")
+
+
+def test_unknown_risk_level_and_no_recommendations():
+    pdf = _report({"predictor_type": "sepsis", "risk_score": 0.1, "risk_level": "Unknown & odd"})
+    assert pdf.startswith(b"%PDF")
@@ -0,0 +1,72 @@
+#!/usr/bin/env python3
+"""
+Tests for column-wise DataFrame scoring with BasePredictor.predict_frame
+"""
+
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from predictors import CancerDetectionPredictor, DiabetesPredictor, SepsisPredictor
+
+
+def _frame(predictor, n=20, seed=0):
+    rng = np.random.default_rng(seed)
+    rows = []
+    for _ in range(n):
+        data = predictor.get_dummy_input()
+        for field, field_type in predictor.get_required_fields().items():
+            if field_type == "int":
+                data[field] = int(rng.integers(0, 4))
+            elif field_type == "float":
+                data[field] = float(rng.random() * 100)
+        rows.append(data)
+    return pd.DataFrame(rows, index=[f"patient-{i}" for i in range(n)])
+
+
+@pytest.mark.parametrize("cls", [CancerDetectionPredictor, SepsisPredictor, DiabetesPredictor],
+                         ids=lambda cls: cls.__name__)
+def test_frame_matches_predict(cls):
+    predictor = cls()
+    df = _frame(predictor)
+    scored = predictor.predict_frame(df)
+
+    assert list(scored.columns) == ["risk_score", "risk_level"]
+    assert list(scored.index) == list(df.index)
+    for (_, row), (_, result) in zip(df.iterrows(), scored.iterrows()):
+        expected = predictor.predict(row.to_dict())
+        assert result["risk_score"] == expected["risk_score"]
+        assert result["risk_level"] == expected["risk_level"]
+
+
+def test_frame_cells_are_coerced_like_validated_rows():
+    predictor = CancerDetectionPredictor()
+    df = _frame(predictor, n=3)
+    df["age"] = df["age"].astype(float)
+    df.loc["patient-0", "age"] = 61.9
+    df.loc["patient-1", "bmi"] = np.nan
+    df["smoking_history"] = df["smoking_history"].astype(object)
+    df.loc["patient-2", "smoking_history"] = "not a number"
+
+    coerced = df.to_dict("records")
+    coerced[0]["age"] = 61
+    coerced[1]["bmi"] = 0.0
+    coerced[2]["smoking_history"] = 0
+    scored = predictor.predict_frame(df)
+    assert scored["risk_score"].tolist() == [predictor.predict(data)["risk_score"] for data in coerced]
+
+
+def test_missing_column_is_rejected():
+    predictor = CancerDetectionPredictor()
+    with pytest.raises(ValueError, match="Missing required field: bmi"):
+        predictor.predict_frame(_frame(predictor).drop(columns="bmi"))
+
+
+def test_empty_frame():
+    scored = CancerDetectionPredictor().predict_frame(pd.DataFrame())
+    assert scored.empty
+    assert list(scored.columns) == ["risk_score", "risk_level"]
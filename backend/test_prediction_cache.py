@@ -0,0 +1,79 @@
+#!/usr/bin/env python3
+"""
+Tests for the app-level LRU prediction cache
+"""
+
+import sys
+import os
+import threading
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from prediction_cache import PredictionCache
+
+
+def test_make_key_ignores_field_order():
+    first = PredictionCache.make_key("sepsis", {"age": 50, "heart_rate": 90})
+    second = PredictionCache.make_key("sepsis", {"heart_rate": 90, "age": 50})
+    assert first == second
+
+
+def test_make_key_separates_predictors_kinds_and_values():
+    data = {"age": 50}
+    keys = {
+        PredictionCache.make_key("sepsis", data),
+        PredictionCache.make_key("anemia", data),
+        PredictionCache.make_key("sepsis", data, kind="analysis"),
+        PredictionCache.make_key("sepsis", {"age": 51}),
+    }
+    assert len(keys) == 4
+
+
+def test_evicts_least_recently_used():
+    cache = PredictionCache(maxsize=2)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    assert cache.get("a") == 1  # "b" is now the least recently used
+    cache.set("c", 3)
+    assert cache.get("b") is None
+    assert cache.get("a") == 1
+    assert cache.get("c") == 3
+
+
+def test_set_refreshes_an_existing_key():
+    cache = PredictionCache(maxsize=2)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    cache.set("a", 10)
+    cache.set("c", 3)
+    assert cache.get("a") == 10
+    assert cache.get("b") is None
+
+
+def test_stats_and_clear():
+    cache = PredictionCache(maxsize=8)
+    cache.set("a", 1)
+    cache.get("a")
+    cache.get("missing")
+    assert cache.stats() == {"size": 1, "maxsize": 8, "hits": 1, "misses": 1, "hit_rate": 0.5}
+
+    cache.clear()
+    assert cache.stats() == {"size": 0, "maxsize": 8, "hits": 0, "misses": 0, "hit_rate": 0.0}
+
+
+def test_concurrent_use_stays_bounded():
+    cache = PredictionCache(maxsize=64)
+
+    def worker(offset):
+        for i in range(2000):
+            cache.set((offset, i), i)
+            cache.get((offset, i // 2))
+
+    threads = [threading.Thread(target=worker, args=(n,)) for n in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    stats = cache.stats()
+    assert stats["size"] == 64
+    assert stats["hits"] + stats["misses"] == 8 * 2000
@@ -0,0 +1,68 @@
+#!/usr/bin/env python3
+"""
+Tests for the on-disk cache of rendered PDF reports
+"""
+
+import sys
+import os
+import io
+import time
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from report_cache import ReportCache
+
+
+def test_make_key_is_stable_and_input_sensitive():
+    key = ReportCache.make_key({"risk_score": 0.4, "risk_level": "Low"}, {"age": 40}, "2024-01-01T12:00:00")
+    assert key == ReportCache.make_key({"risk_level": "Low", "risk_score": 0.4}, {"age": 40}, "2024-01-01T12:00:00")
+    assert key != ReportCache.make_key({"risk_score": 0.4, "risk_level": "Low"}, {"age": 41}, "2024-01-01T12:00:00")
+    assert key != ReportCache.make_key({"risk_score": 0.4, "risk_level": "Low"}, {"age": 40}, "2024-01-01T12:01:00")
+
+
+def test_put_then_get(tmp_path):
+    cache = ReportCache(str(tmp_path))
+    assert cache.get("a" * 32) is None
+
+    path = cache.put("a" * 32, io.BytesIO(b"%PDF-1.4 report"))
+    assert cache.get("a" * 32) == path
+    with open(path, "rb") as f:
+        assert f.read() == b"%PDF-1.4 report"
+    # Writes go through a temporary file that is renamed into place
+    assert sorted(os.listdir(tmp_path)) == ["a" * 32 + ".pdf"]
+
+
+def _age(path, seconds):
+    past = time.time() - seconds
+    os.utime(path, (past, past))
+
+
+def test_expired_reports_are_pruned(tmp_path):
+    cache = ReportCache(str(tmp_path), ttl=60, prune_interval=0)
+    stale = cache.put("a" * 32, io.BytesIO(b"old"))
+    _age(stale, 120)
+
+    cache.put("b" * 32, io.BytesIO(b"new"))
+    assert cache.get("a" * 32) is None
+    assert cache.get("b" * 32) is not None
+
+
+def test_pruning_runs_at_most_once_per_interval(tmp_path):
+    cache = ReportCache(str(tmp_path), ttl=60, prune_interval=3600)
+    cache.put("a" * 32, io.BytesIO(b"first"))  # Prunes, starting the interval
+    _age(cache.path("a" * 32), 120)
+
+    cache.put("b" * 32, io.BytesIO(b"second"))
+    assert cache.get("a" * 32) is not None
+
+    cache._last_prune -= 3600
+    cache.put("c" * 32, io.BytesIO(b"third"))
+    assert cache.get("a" * 32) is None
+
+
+def test_expired_job_records_are_pruned(tmp_path):
+    cache = ReportCache(str(tmp_path), ttl=60, prune_interval=0)
+    cache.put_job("d" * 32, {"status": "pending"})
+    _age(cache.job_path("d" * 32), 120)
+
+    cache.put("a" * 32, io.BytesIO(b"report"))
+    assert cache.get_job("d" * 32) is None
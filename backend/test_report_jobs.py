@@ -0,0 +1,91 @@
+#!/usr/bin/env python3
+"""
+Tests for async PDF report jobs, which must be downloadable from any worker
+"""
+
+import sys
+import os
+import io
+import uuid
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+import pytest
+
+import app as app_module
+from report_cache import ReportCache
+
+_REPORT = {
+    "prediction_data": {
+        "predictor_type": "heart_disease",
+        "risk_score": 0.42,
+        "risk_level": "Moderate",
+        "confidence": 0.8,
+        "recommendations": ["Exercise regularly"]
+    },
+    "user_data": {"age": 45}
+}
+
+
+@pytest.fixture
+def client(monkeypatch, tmp_path):
+    monkeypatch.setattr(app_module, "report_cache", ReportCache(str(tmp_path)))
+    return app_module.app.test_client()
+
+
+def test_async_report_round_trip(client, tmp_path):
+    started = client.post("/download-report/async", json=_REPORT)
+    assert started.status_code == 202
+    job_id = started.get_json()["job_id"]
+
+    response = client.get(f"/download-report/{job_id}")
+    assert response.status_code == 200
+    assert response.data.startswith(b"%PDF")
+    assert "heart_disease_report_" in response.headers["Content-Disposition"]
+
+    # Jobs are claimed once and their record removed
+    assert not os.path.exists(os.path.join(tmp_path, f"{job_id}.job"))
+    assert client.get(f"/download-report/{job_id}").status_code == 404
+
+
+def test_job_started_by_another_worker(client, tmp_path):
+    """A job recorded by a different process sharing the cache directory is served from disk"""
+    other_worker = ReportCache(str(tmp_path))
+    job_id = uuid.uuid4().hex
+    key = ReportCache.make_key({}, {}, "2024-01-01T12:00:00")
+    other_worker.put(key, io.BytesIO(b"%PDF-1.4 other worker"))
+    other_worker.put_job(job_id, {"status": "done", "filename": "other_report.pdf", "key": key})
+
+    response = client.get(f"/download-report/{job_id}")
+    assert response.status_code == 200
+    assert response.data == b"%PDF-1.4 other worker"
+    assert "other_report.pdf" in response.headers["Content-Disposition"]
+
+
+def test_failed_job_reports_its_error(client, tmp_path):
+    job_id = uuid.uuid4().hex
+    ReportCache(str(tmp_path)).put_job(job_id, {"status": "error", "filename": "x.pdf", "error": "boom"})
+
+    response = client.get(f"/download-report/{job_id}")
+    assert response.status_code == 500
+    assert "boom" in response.get_json()["error"]
+
+
+def test_pending_job_times_out(client, tmp_path, monkeypatch):
+    monkeypatch.setattr(app_module, "PDF_JOB_TIMEOUT", 0.1)
+    job_id = uuid.uuid4().hex
+    ReportCache(str(tmp_path)).put_job(job_id, {"status": "pending"})
+
+    assert client.get(f"/download-report/{job_id}").status_code == 500
+
+
+@pytest.mark.parametrize("job_id", ["missing", uuid.uuid4().hex, "..", "A" * 32])
+def test_unknown_job_is_not_found(client, job_id):
+    assert client.get(f"/download-report/{job_id}").status_code == 404
+
+
+def test_job_record_with_a_foreign_key_is_ignored(tmp_path):
+    """A record can only point at a report inside the cache directory"""
+    cache = ReportCache(str(tmp_path))
+    job_id = uuid.uuid4().hex
+    cache.put_job(job_id, {"status": "done", "filename": "x.pdf", "key": "../../etc/passwd"})
+    assert cache.get_job(job_id) is None
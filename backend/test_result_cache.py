@@ -0,0 +1,98 @@
+#!/usr/bin/env python3
+"""
+Tests for the per-predictor prediction result cache
+"""
+
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from predictors.condition_predictors import SepsisPredictor
+
+
+def test_cached_result_is_not_shared_with_callers():
+    """Changing a returned result must not change what the next identical predict() returns"""
+    predictor = SepsisPredictor()
+    data = predictor.get_dummy_input()
+
+    first = predictor.predict(dict(data))
+    expected_recommendations = list(first["recommendations"])
+    expected_risk_factors = list(first["risk_factors"])
+    first["recommendations"].append("INJECTED")
+    first["risk_factors"].clear()
+    first["detailed_analysis"]["contributing_factors"].append("INJECTED")
+
+    second = predictor.predict(dict(data))
+    assert second["recommendations"] == expected_recommendations
+    assert second["risk_factors"] == expected_risk_factors
+    assert "INJECTED" not in second["detailed_analysis"]["contributing_factors"]
+
+    # A cache hit hands out its own copy as well
+    second["recommendations"].append("INJECTED")
+    assert predictor.predict(dict(data))["recommendations"] == expected_recommendations
+
+
+def test_cache_clear_forgets_results():
+    predictor = SepsisPredictor()
+    data = predictor.get_dummy_input()
+    predictor.predict(dict(data))
+    assert len(predictor._result_cache) == 1
+    predictor.cache_clear()
+    assert len(predictor._result_cache) == 0
+
+
+def test_cache_info_counts_hits_and_misses():
+    predictor = SepsisPredictor()
+    data = predictor.get_dummy_input()
+    predictor.predict(dict(data))
+    predictor.predict(dict(data))
+    predictor.predict_batch([dict(data), predictor.get_dummy_input() | {"age": 70}])
+    assert predictor.cache_info() == {"size": 2, "maxsize": 1024, "hits": 2, "misses": 2, "hit_rate": 0.5}
+
+    predictor.cache_clear()
+    assert predictor.cache_info() == {"size": 0, "maxsize": 1024, "hits": 0, "misses": 0, "hit_rate": 0.0}
+
+
+def test_result_cache_is_bounded():
+    predictor = SepsisPredictor()
+    predictor.result_cache_size = 3
+    for age in range(5):
+        data = predictor.get_dummy_input()
+        data["age"] = age
+        predictor.predict(data)
+    assert len(predictor._result_cache) == 3
+
+
+def test_input_is_validated_on_a_cache_hit():
+    """predict() normalizes the caller's input in place whether or not the result was cached"""
+    predictor = SepsisPredictor()
+    raw = {field: "1" for field in predictor.get_required_fields()}
+
+    first = dict(raw)
+    predictor.predict(first)
+    second = dict(raw)
+    predictor.predict(second)
+
+    for data in (first, second):
+        assert not any(isinstance(value, str) for value in data.values())
+    # The analysis methods need the normalized values
+    predictor.analyze_factors_and_metrics(second)
+
+
+def test_app_analysis_after_prediction_cache_reset():
+    """A repeated /predict whose app-level cache entry was dropped still gets a working analysis"""
+    import app as app_module
+    client = app_module.app.test_client()
+    predictor = app_module.predictors["sepsis"]
+    payload = {
+        "predictor_type": "sepsis",
+        "data": {field: "1" for field in predictor.get_required_fields()}
+    }
+
+    first = client.post("/predict", json=payload).get_json()
+    app_module.prediction_cache.clear()
+    second = client.post("/predict", json=payload).get_json()
+
+    assert "analysis_error" not in first
+    assert "analysis_error" not in second
+    assert second["risk_score"] == first["risk_score"]
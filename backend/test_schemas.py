@@ -0,0 +1,68 @@
+#!/usr/bin/env python3
+"""
+Tests for the request body schemas
+"""
+
+import sys
+import os
+import json
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+import pytest
+
+from schemas import PredictRequest, AnalyzeRequest, ReportRequest, SchemaError
+
+
+def _raw(body):
+    return json.dumps(body).encode()
+
+
+def test_predict_request():
+    req = PredictRequest.from_json(_raw({"predictor_type": "sepsis", "data": {"age": 50}}))
+    assert req == PredictRequest("sepsis", {"age": 50}, include_analysis=True)
+
+    req = PredictRequest.from_json(_raw({"predictor_type": "sepsis", "data": {"age": 50}, "include_analysis": 0}))
+    assert req.include_analysis is False
+
+
+def test_analyze_request():
+    req = AnalyzeRequest.from_json(_raw({"predictor_type": "anemia", "data": {"hemoglobin": 12}}))
+    assert req == AnalyzeRequest("anemia", {"hemoglobin": 12})
+
+
+def test_report_request_defaults_user_data():
+    req = ReportRequest.from_json(_raw({"prediction_data": {"risk_score": 0.2}}))
+    assert req == ReportRequest({"risk_score": 0.2}, {})
+
+    req = ReportRequest.from_json(_raw({"prediction_data": {"risk_score": 0.2}, "user_data": None}))
+    assert req.user_data == {}
+
+
+@pytest.mark.parametrize("raw, message", [
+    (b"", "No data provided"),
+    (b"{not json", "Invalid JSON"),
+    (b"[1, 2]", "must be a JSON object"),
+    (_raw({"data": {"age": 50}}), "'predictor_type' must be a string"),
+    (_raw({"predictor_type": 3, "data": {"age": 50}}), "'predictor_type' must be a string"),
+    (_raw({"predictor_type": "sepsis"}), "Input data is required"),
+    (_raw({"predictor_type": "sepsis", "data": {}}), "Input data is required"),
+    (_raw({"predictor_type": "sepsis", "data": [1]}), "'data' must be a JSON object"),
+])
+def test_invalid_predict_and_analyze_bodies(raw, message):
+    for schema in (PredictRequest, AnalyzeRequest):
+        with pytest.raises(SchemaError, match=message):
+            schema.from_json(raw)
+
+
+@pytest.mark.parametrize("body, message", [
+    ({}, "Prediction data is required"),
+    ({"prediction_data": "high"}, "'prediction_data' must be a JSON object"),
+    ({"prediction_data": {"risk_score": 0.2}, "user_data": [1]}, "'user_data' must be a JSON object"),
+])
+def test_invalid_report_bodies(body, message):
+    with pytest.raises(SchemaError, match=message):
+        ReportRequest.from_json(_raw(body))
+
+
+def test_schema_error_is_a_value_error():
+    assert issubclass(SchemaError, ValueError)